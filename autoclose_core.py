@@ -0,0 +1,3807 @@
+# -*- coding: utf-8 -*-
+"""
+AutoClose Studio 핵심부 (QtCore 전용)
+
+설정 관리, 예약 계산, 대상 프로그램 종료, 원격/본체 종료, 음성 캐시처럼
+화면과 무관한 부분을 모았다. QtGui·QtWidgets·Qt Multimedia를 불러오지 않으므로
+창 없이 도는 PC에서는 이 모듈만으로 예약 실행을 돌릴 수 있다.
+
+* `ScheduleRunner`가 예약 한 회차의 단계(프로그램 종료 → 음성 재생 → 원격/본체 종료)를 진행
+* 음성은 `AudioBackend`를 따르는 재생기로 재생한다. GUI는 Qt Multimedia 기반 `AudioService`를,
+  화면 없는 모드는 운영체제 재생 명령을 쓰는 `CommandAudioService`를 넘긴다.
+* `desktop_scheduler_qt.py`의 창은 실행기 신호를 받아 표시하는 선택적 앞단이다.
+
+    python autoclose_core.py                  # 화면 없이 예약 실행만
+    python desktop_scheduler_qt.py --headless # 같은 동작(패키징된 exe에서도 사용)
+"""
+from __future__ import annotations
+
+import asyncio
+import atexit
+import bisect
+import copy
+import errno
+import hashlib
+import heapq
+import importlib.util
+import json
+import locale
+import os
+import selectors
+import shutil
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
+from multiprocessing.connection import Client, Listener
+from dataclasses import dataclass, asdict, field, fields
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import psutil
+
+from PySide6 import QtCore
+from PySide6.QtCore import Signal
+
+from autoclose_control import (
+    CONTROL_MAX_BYTES,
+    CONTROL_TIMEOUT,
+    control_address,
+    control_dir_error,
+    decode_message,
+    encode_message,
+    forward_to_running_instance,
+)
+from autoclose_profile import STARTUP_TRACE, STARTUP_TRACE_FILE
+
+APP_NAME = "AutoClose Studio"
+APP_VERSION = "2.1.2"
+BUILD_DATE = "2025-11-06"
+AUTHOR_NAME = "Zolt46 / PSW / Emanon108"
+ORGANIZATION_NAME = "AutoClose Studio"
+ORGANIZATION_DOMAIN = "autoclose.local"
+DEFAULT_USER_PASSWORD = "0000"
+DEFAULT_ADMIN_PASSWORD = "000000"
+
+APP_DIR = Path(__file__).resolve().parent
+
+
+def resource_path(relative: str) -> Path:
+    """exe 패키징(PyInstaller 등) 이후에도 자원 경로를 안전하게 찾는다."""
+
+    base_dir = Path(getattr(sys, "_MEIPASS", APP_DIR))  # type: ignore[attr-defined]
+    return base_dir / relative
+
+
+DEFAULT_ASSET_DIR = "assets"
+DEFAULT_APP_ICON = resource_path(f"{DEFAULT_ASSET_DIR}/app_icon.ico")
+
+
+def hash_password(raw: str) -> str:
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def verify_password(stored_hash: str, attempt: str) -> bool:
+    if not stored_hash:
+        return True
+    try:
+        return stored_hash == hash_password(attempt)
+    except Exception:
+        return False
+
+
+def coerce_bool(value: object, default: bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in {"1", "true", "yes", "y", "on"}:
+            return True
+        if lowered in {"0", "false", "no", "n", "off"}:
+            return False
+    if isinstance(value, (int, float)):
+        return bool(value)
+    return default
+
+class ConfigLocator:
+    """현재 설정 파일 위치를 추적하고 변경을 돕는 도우미."""
+
+    def __init__(self) -> None:
+        base_root = Path(
+            os.environ.get("APPDATA")
+            or os.environ.get("XDG_CONFIG_HOME")
+            or Path.home() / ".config"
+        )
+        self._default_dir = base_root / "auto_close_studio"
+        self._default_dir.mkdir(parents=True, exist_ok=True)
+        self._pointer_file = self._default_dir / "storage_location.json"
+        self._config_dir = self._load_pointer()
+        self._config_dir.mkdir(parents=True, exist_ok=True)
+
+    def _load_pointer(self) -> Path:
+        if self._pointer_file.exists():
+            try:
+                data = json.loads(self._pointer_file.read_text(encoding="utf-8"))
+                stored = data.get("path")
+                if stored:
+                    path = Path(stored).expanduser()
+                    return path
+            except Exception:
+                pass
+        return self._default_dir
+
+    @property
+    def default_dir(self) -> Path:
+        """저장 위치를 옮겨도 바뀌지 않는 이 PC의 기본 설정 폴더."""
+
+        return self._default_dir
+
+    @property
+    def config_dir(self) -> Path:
+        return self._config_dir
+
+    @property
+    def config_file(self) -> Path:
+        return self._config_dir / "settings.json"
+
+    def change_dir(self, new_dir: Path) -> None:
+        target = Path(new_dir).expanduser()
+        target.mkdir(parents=True, exist_ok=True)
+        try:
+            resolved = target.resolve()
+        except Exception:
+            resolved = target
+        self._config_dir = resolved
+        payload = {"path": str(self._config_dir)}
+        self._pointer_file.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+with STARTUP_TRACE.phase("설정 위치 확인"):
+    CONFIG_LOCATOR = ConfigLocator()
+
+
+def startup_trace_path() -> Path:
+    """시작 기록 파일. 네트워크 폴더로 옮긴 설정과 달리 늘 이 PC의 기본 설정 폴더에 둔다."""
+
+    return CONFIG_LOCATOR.default_dir / STARTUP_TRACE_FILE
+
+DAY_KEYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+DAY_LABEL = {
+    "mon": "월요일",
+    "tue": "화요일",
+    "wed": "수요일",
+    "thu": "목요일",
+    "fri": "금요일",
+    "sat": "토요일",
+    "sun": "일요일",
+}
+
+DEFAULT_TARGETS = ["chrome.exe", "msedge.exe", "vlc.exe", "YouTube Music.exe"]
+DEFAULT_REMOTE = [
+    {"host": "192.168.0.31", "username": "admin", "password": "1234", "method": "ssh"},
+]
+# 원격 종료 실행 방식: 스레드 풀 또는 asyncio 이벤트 루프 하나.
+REMOTE_BACKENDS = {"threads": "스레드 풀", "asyncio": "비동기(asyncio)"}
+
+
+def normalize_slot_time(value: object) -> Optional[str]:
+    """"9:5" 같은 입력을 "09:05" 형식으로 맞추고, 해석할 수 없으면 None을 돌려준다."""
+
+    if not isinstance(value, str):
+        return None
+    parts = value.strip().split(":")
+    if len(parts) != 2:
+        return None
+    try:
+        hh, mm = int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
+    if not (0 <= hh < 24 and 0 <= mm < 60):
+        return None
+    return f"{hh:02d}:{mm:02d}"
+
+
+@dataclass
+class DaySchedule:
+    enabled: bool = True
+    time: str = "09:00"  # HH:MM
+    auto_assign: bool = True
+    audio_path: Optional[str] = None
+    allow_remote: bool = True
+    allow_local_shutdown: bool = True
+    last_ran: Optional[str] = None  # yyyy-mm-dd
+    extra_times: List[str] = field(default_factory=list)  # 추가 실행 시간(HH:MM)
+    last_slot: Optional[str] = None  # last_ran 날짜에 마지막으로 실행된 시간(HH:MM)
+
+    def as_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict[str, object]) -> "DaySchedule":
+        base = DaySchedule()
+        for key in (
+            "enabled",
+            "time",
+            "auto_assign",
+            "audio_path",
+            "allow_remote",
+            "allow_local_shutdown",
+            "last_ran",
+            "extra_times",
+            "last_slot",
+        ):
+            if key in data:
+                setattr(base, key, data[key])
+        if not isinstance(base.extra_times, list):
+            base.extra_times = []
+        return base
+
+    def slot_times(self) -> List[str]:
+        """기본 시간(`time`)과 추가 시간을 합쳐 중복 없이 정렬한 HH:MM 목록."""
+
+        slots = {normalize_slot_time(value) for value in [self.time, *self.extra_times]}
+        slots.discard(None)
+        return sorted(slots)  # type: ignore[arg-type]
+
+    def is_slot_done(self, current_date: date, slot: str) -> bool:
+        if self.last_ran != current_date.isoformat():
+            return False
+        # 예전 설정(last_slot 없음)은 하루 한 번 실행 기준이므로 그날 전체를 완료로 본다.
+        return self.last_slot is None or self.last_slot >= slot
+
+
+@dataclass
+class SchedulerConfig:
+    """전체 설정. `ConfigManager.config`로 받은 인스턴스는 모든 스레드가 공유하는 스냅샷이므로
+    제자리에서 고치지 않고, 바꿀 때는 `ConfigManager.update()`에 넘긴 복사본을 고친다."""
+
+    playlist: List[str] = field(default_factory=list)
+    playlist_rotation: int = 0
+    targets: List[str] = field(default_factory=lambda: DEFAULT_TARGETS.copy())
+    remote_hosts: List[Dict[str, str]] = field(default_factory=lambda: DEFAULT_REMOTE.copy())
+    enable_remote_shutdown: bool = True
+    enable_local_shutdown: bool = True
+    shutdown_delay: int = 5
+    terminate_timeout: int = 5
+    terminate_children: bool = False
+    holidays_enabled: bool = True
+    auto_skip_weekends: bool = True
+    holidays: List[str] = field(default_factory=list)
+    holiday_ranges: List[Dict[str, str]] = field(default_factory=list)
+    holiday_labels: Dict[str, str] = field(default_factory=dict)
+    start_with_os: bool = False
+    theme_accent: str = "#2A5CAA"
+    header_logo_path: Optional[str] = None
+    audio_volume: float = 0.9
+    storage_journal: bool = False
+    remote_backend: str = "threads"
+    remote_concurrency: int = 16
+    remote_prewarm_seconds: int = 60
+    remote_probe_interval: int = 120
+    remote_lead_seconds: int = 0
+    audio_preflight_seconds: int = 180
+    audio_preflight_copy: bool = False
+    audio_cache_mb: int = 512
+    shutdown_logs: List[Dict[str, str]] = field(default_factory=list)
+    user_password_hash: str = field(default_factory=lambda: hash_password(DEFAULT_USER_PASSWORD))
+    admin_password_hash: str = field(default_factory=lambda: hash_password(DEFAULT_ADMIN_PASSWORD))
+    days: Dict[str, DaySchedule] = field(
+        default_factory=lambda: {key: DaySchedule(enabled=(key not in {"sat", "sun"})) for key in DAY_KEYS}
+    )
+
+    def as_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        data["days"] = {k: v.as_dict() for k, v in self.days.items()}
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict[str, object]) -> "SchedulerConfig":
+        base = SchedulerConfig()
+        for key in (
+            "playlist",
+            "playlist_rotation",
+            "targets",
+            "remote_hosts",
+            "enable_remote_shutdown",
+            "enable_local_shutdown",
+            "shutdown_delay",
+            "terminate_timeout",
+            "terminate_children",
+            "holidays_enabled",
+            "auto_skip_weekends",
+            "holidays",
+            "holiday_ranges",
+            "holiday_labels",
+            "start_with_os",
+            "theme_accent",
+            "audio_volume",
+            "storage_journal",
+            "remote_backend",
+            "remote_concurrency",
+            "remote_prewarm_seconds",
+            "remote_probe_interval",
+            "remote_lead_seconds",
+            "audio_preflight_seconds",
+            "audio_preflight_copy",
+            "audio_cache_mb",
+            "header_logo_path",
+            "shutdown_logs",
+            "user_password_hash",
+            "admin_password_hash",
+        ):
+            if key in data:
+                setattr(base, key, data[key])
+        days = {}
+        for day_key, day_val in data.get("days", {}).items():
+            days[day_key] = DaySchedule.from_dict(day_val)
+        for missing in DAY_KEYS:
+            days.setdefault(missing, DaySchedule(enabled=(missing not in {"sat", "sun"})))
+        base.days = days
+        base.auto_skip_weekends = coerce_bool(data.get("auto_skip_weekends", base.auto_skip_weekends), base.auto_skip_weekends)
+        base.storage_journal = coerce_bool(base.storage_journal, False)
+        base.terminate_children = coerce_bool(base.terminate_children, False)
+        try:
+            base.terminate_timeout = max(0, min(60, int(base.terminate_timeout)))
+        except (TypeError, ValueError):
+            base.terminate_timeout = 5
+        if base.remote_backend not in REMOTE_BACKENDS:
+            base.remote_backend = "threads"
+        try:
+            base.remote_concurrency = max(1, min(256, int(base.remote_concurrency)))
+        except (TypeError, ValueError):
+            base.remote_concurrency = 16
+        try:
+            base.remote_prewarm_seconds = max(0, min(600, int(base.remote_prewarm_seconds)))
+        except (TypeError, ValueError):
+            base.remote_prewarm_seconds = 60
+        try:
+            base.remote_probe_interval = max(0, min(3600, int(base.remote_probe_interval)))
+        except (TypeError, ValueError):
+            base.remote_probe_interval = 120
+        try:
+            base.remote_lead_seconds = max(0, min(600, int(base.remote_lead_seconds)))
+        except (TypeError, ValueError):
+            base.remote_lead_seconds = 0
+        try:
+            base.audio_preflight_seconds = max(0, min(3600, int(base.audio_preflight_seconds)))
+        except (TypeError, ValueError):
+            base.audio_preflight_seconds = 180
+        base.audio_preflight_copy = coerce_bool(base.audio_preflight_copy, False)
+        try:
+            base.audio_cache_mb = max(0, min(100_000, int(base.audio_cache_mb)))
+        except (TypeError, ValueError):
+            base.audio_cache_mb = 512
+        if not isinstance(base.holiday_labels, dict):
+            base.holiday_labels = {}
+        if not isinstance(base.user_password_hash, str) or not base.user_password_hash:
+            base.user_password_hash = hash_password(DEFAULT_USER_PASSWORD)
+        if not isinstance(base.admin_password_hash, str) or not base.admin_password_hash:
+            base.admin_password_hash = hash_password(DEFAULT_ADMIN_PASSWORD)
+        if base.header_logo_path and not isinstance(base.header_logo_path, str):
+            base.header_logo_path = None
+        try:
+            base.audio_volume = float(base.audio_volume)
+        except (TypeError, ValueError):
+            base.audio_volume = 0.9
+        base.audio_volume = max(0.0, min(1.0, base.audio_volume))
+        return base
+
+class HolidayIndex:
+    """휴일 목록을 미리 해석해 둔 조회용 색인.
+
+    단일 휴일은 날짜 집합으로, 기간은 정렬·병합한 뒤 이분 탐색으로 찾는다.
+    설정 리비전마다 한 번만 만들어 `ConfigManager.holiday_index`로 공유한다.
+    """
+
+    __slots__ = ("revision", "skip_weekends", "_singles", "_starts", "_ends")
+
+    def __init__(
+        self,
+        singles: Iterable[date],
+        ranges: Iterable[Tuple[date, date]],
+        skip_weekends: bool,
+        revision: int = -1,
+    ) -> None:
+        self.revision = revision
+        self.skip_weekends = skip_weekends
+        self._singles = frozenset(singles)
+        merged: List[List[date]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + timedelta(days=1):
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+
+    @classmethod
+    def from_config(cls, cfg: SchedulerConfig, revision: int = -1) -> "HolidayIndex":
+        singles: List[date] = []
+        for iso in cfg.holidays:
+            try:
+                singles.append(date.fromisoformat(iso))
+            except (TypeError, ValueError):
+                continue
+        ranges: List[Tuple[date, date]] = []
+        for rng in cfg.holiday_ranges:
+            try:
+                start = datetime.strptime(rng["start"], "%Y-%m-%d").date()
+                end = datetime.strptime(rng["end"], "%Y-%m-%d").date()
+            except Exception:
+                continue
+            if start <= end:
+                ranges.append((start, end))
+        return cls(singles, ranges, cfg.auto_skip_weekends, revision)
+
+    def contains(self, target: date) -> bool:
+        if self.skip_weekends and target.weekday() >= 5:
+            return True
+        if target in self._singles:
+            return True
+        pos = bisect.bisect_right(self._starts, target) - 1
+        return pos >= 0 and target <= self._ends[pos]
+
+
+def is_holiday(cfg: SchedulerConfig, target: date, holidays: Optional[HolidayIndex] = None) -> bool:
+    index = holidays if holidays is not None else HolidayIndex.from_config(cfg)
+    return index.contains(target)
+
+
+def is_day_eligible(
+    cfg: SchedulerConfig,
+    day_cfg: DaySchedule,
+    current_date: date,
+    slot: Optional[str] = None,
+    holidays: Optional[HolidayIndex] = None,
+) -> bool:
+    if not day_cfg.enabled:
+        return False
+    if cfg.holidays_enabled and is_holiday(cfg, current_date, holidays):
+        return False
+    if slot is None:
+        if day_cfg.last_ran == current_date.isoformat():
+            return False
+    elif day_cfg.is_slot_done(current_date, slot):
+        return False
+    return True
+
+
+@dataclass
+class UpcomingRun:
+    when: datetime
+    day_key: str
+    audio_path: Optional[str]
+    auto_assign: bool
+    remote_allowed: bool
+    local_allowed: bool
+    slot: str = ""
+
+
+class RunQueue:
+    """실행 슬롯을 시각 순으로 꺼내는 힙 기반 대기열.
+
+    요일마다 슬롯 수에 제한이 없으며, 가장 이른 슬롯 조회는 O(1), 꺼내기는 O(log n)이다.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[datetime, int, str, str]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, when: datetime, day_key: str, slot: str) -> None:
+        heapq.heappush(self._heap, (when, self._seq, day_key, slot))
+        self._seq += 1
+
+    def peek(self) -> Optional[Tuple[datetime, str, str]]:
+        if not self._heap:
+            return None
+        when, _, day_key, slot = self._heap[0]
+        return when, day_key, slot
+
+    def pop(self) -> Optional[Tuple[datetime, str, str]]:
+        if not self._heap:
+            return None
+        when, _, day_key, slot = heapq.heappop(self._heap)
+        return when, day_key, slot
+
+    def drain(self) -> Iterator[Tuple[datetime, str, str]]:
+        while self._heap:
+            item = self.pop()
+            if item is not None:
+                yield item
+
+    def pop_due(self, now: datetime) -> List[Tuple[datetime, str, str]]:
+        due: List[Tuple[datetime, str, str]] = []
+        while self._heap and self._heap[0][0] <= now:
+            item = self.pop()
+            if item is not None:
+                due.append(item)
+        return due
+
+    @classmethod
+    def from_config(
+        cls,
+        cfg: SchedulerConfig,
+        start: datetime,
+        horizon_days: int = 28,
+        holidays: Optional[HolidayIndex] = None,
+    ) -> "RunQueue":
+        """`start` 이후 `horizon_days`일 동안 실행 가능한 슬롯을 모두 담은 대기열을 만든다."""
+
+        queue = cls()
+        if holidays is None and cfg.holidays_enabled:
+            holidays = HolidayIndex.from_config(cfg)
+        for offset in range(horizon_days):
+            current_date = start.date() + timedelta(days=offset)
+            day_key = DAY_KEYS[current_date.weekday()]
+            day_cfg = cfg.days.get(day_key)
+            if not day_cfg or not day_cfg.enabled:
+                continue
+            slots = day_cfg.slot_times()
+            if not slots or not is_day_eligible(cfg, day_cfg, current_date, slots[-1], holidays):
+                continue
+            for slot in slots:
+                hh, mm = map(int, slot.split(":"))
+                when = datetime.combine(current_date, dt_time(hh, mm))
+                if when < start or day_cfg.is_slot_done(current_date, slot):
+                    continue
+                queue.push(when, day_key, slot)
+        return queue
+
+
+def _build_runs(
+    cfg: SchedulerConfig, slots: Iterable[Tuple[datetime, str, str]], limit: Optional[int] = None
+) -> List[UpcomingRun]:
+    """시각 순으로 정렬된 슬롯에 플레이리스트 순환 음성을 배정해 실행 목록을 만든다."""
+
+    playlist_len = len(cfg.playlist)
+    rotation = cfg.playlist_rotation % max(1, playlist_len) if playlist_len else 0
+    index = rotation
+    runs: List[UpcomingRun] = []
+    for scheduled, day_key, slot in slots:
+        if limit is not None and len(runs) >= limit:
+            break
+        day_cfg = cfg.days[day_key]
+        if day_cfg.auto_assign and playlist_len:
+            audio = cfg.playlist[index % playlist_len]
+        else:
+            audio = day_cfg.audio_path if day_cfg.audio_path else (cfg.playlist[index % playlist_len] if day_cfg.auto_assign and playlist_len else None)
+        runs.append(
+            UpcomingRun(
+                when=scheduled,
+                day_key=day_key,
+                audio_path=audio,
+                auto_assign=day_cfg.auto_assign,
+                remote_allowed=cfg.enable_remote_shutdown and day_cfg.allow_remote,
+                local_allowed=cfg.enable_local_shutdown and day_cfg.allow_local_shutdown,
+                slot=slot,
+            )
+        )
+        if day_cfg.auto_assign and playlist_len:
+            index = (index + 1) % playlist_len
+    return runs
+
+
+def compute_upcoming_runs(
+    cfg: SchedulerConfig,
+    horizon_days: int = 28,
+    limit: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[UpcomingRun]:
+    now = now or datetime.now()
+    queue = RunQueue.from_config(cfg, now, horizon_days)
+    return _build_runs(cfg, queue.drain(), limit)
+
+
+def predict_playlist_for_day(
+    cfg: SchedulerConfig, target_day: str, calendar: Optional["RunCalendar"] = None
+) -> Optional[str]:
+    if target_day not in DAY_KEYS:
+        return None
+    runs = calendar.upcoming(horizon_days=28) if calendar is not None else compute_upcoming_runs(cfg, horizon_days=28)
+    for run in runs:
+        if run.day_key == target_day:
+            return run.audio_path
+    return None
+
+
+CALENDAR_HORIZON_DAYS = 35
+
+
+class RunCalendar:
+    """설정 리비전과 날짜가 바뀔 때만 다시 계산하는 예정 실행 달력.
+
+    하루치 슬롯 목록은 (리비전, 날짜, 기간)마다 한 번만 만들고, 현재 시각 이후의 실행 목록은
+    지난 슬롯 개수별로 기억해 UI 여러 곳과 스케줄러가 같은 계산 결과를 공유한다.
+    """
+
+    def __init__(self, cfg_mgr: "ConfigManager") -> None:
+        self._cfg_mgr = cfg_mgr
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple[int, date, int]] = None
+        self._slots: List[Tuple[datetime, str, str]] = []
+        self._whens: List[datetime] = []
+        self._runs: Dict[int, List[UpcomingRun]] = {}
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._key = None
+
+    def upcoming(
+        self, horizon_days: int = 28, limit: Optional[int] = None, now: Optional[datetime] = None
+    ) -> List[UpcomingRun]:
+        now = now or datetime.now()
+        with self._lock:
+            snapshot = self._cfg_mgr.snapshot()
+            revision, cfg = snapshot
+            horizon = max(horizon_days, CALENDAR_HORIZON_DAYS)
+            key = (revision, now.date(), horizon)
+            if self._key is None or self._key[:2] != key[:2] or self._key[2] < horizon:
+                midnight = datetime.combine(now.date(), dt_time())
+                holidays = self._cfg_mgr.holiday_index_for(snapshot)
+                self._slots = list(RunQueue.from_config(cfg, midnight, horizon, holidays).drain())
+                self._whens = [when for when, _, _ in self._slots]
+                self._runs = {}
+                self._key = key
+            position = bisect.bisect_left(self._whens, now)
+            runs = self._runs.get(position)
+            if runs is None:
+                runs = _build_runs(cfg, self._slots[position:])
+                self._runs[position] = runs
+        last_day = now.date() + timedelta(days=horizon_days)
+        selected = [run for run in runs if run.when.date() < last_day]
+        return selected[:limit] if limit is not None else selected
+
+    def predict_for_day(self, target_day: str) -> Optional[str]:
+        return predict_playlist_for_day(self._cfg_mgr.config, target_day, self)
+
+
+# 변경을 모아 두었다가 디스크에 쓰는 최소 간격(초). None 또는 0이면 변경마다 즉시 기록한다.
+CONFIG_WRITE_INTERVAL = 1.0
+# 저널이 이 기록 수나 크기를 넘으면 전체 스냅샷으로 합친다.
+JOURNAL_COMPACT_RECORDS = 200
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+
+def _config_delta(old: Dict[str, object], new: Dict[str, object]) -> Dict[str, object]:
+    """두 설정 사전의 차이를 저널 기록용 변경분(`set`, `days`)으로 만든다."""
+
+    delta: Dict[str, object] = {}
+    changed = {key: value for key, value in new.items() if key != "days" and old.get(key) != value}
+    if changed:
+        delta["set"] = changed
+    old_days = old.get("days") or {}
+    day_changes: Dict[str, Dict[str, object]] = {}
+    for day_key, day_fields in (new.get("days") or {}).items():
+        before = old_days.get(day_key) or {}
+        diff = {name: value for name, value in day_fields.items() if before.get(name) != value}
+        if diff:
+            day_changes[day_key] = diff
+    if day_changes:
+        delta["days"] = day_changes
+    return delta
+
+
+def _apply_config_delta(data: Dict[str, object], delta: Dict[str, object]) -> None:
+    data.update(delta.get("set") or {})
+    days = data.setdefault("days", {})
+    for day_key, day_fields in (delta.get("days") or {}).items():
+        days.setdefault(day_key, {}).update(day_fields)
+
+
+# 변경 알림 구독 단위. 최상위 설정 필드 이름과 요일별 "days.<요일>" 항목으로 이뤄진다.
+ALL_CONFIG_SECTIONS = frozenset(
+    [f.name for f in fields(SchedulerConfig)] + ["days"] + [f"days.{key}" for key in DAY_KEYS]
+)
+# 예정 실행·자동 배정 결과에 영향을 주는 항목.
+SCHEDULE_SECTIONS = frozenset(
+    {
+        "days",
+        "playlist",
+        "playlist_rotation",
+        "holidays",
+        "holiday_ranges",
+        "holidays_enabled",
+        "auto_skip_weekends",
+        "enable_remote_shutdown",
+        "enable_local_shutdown",
+    }
+)
+HOLIDAY_SECTIONS = frozenset(
+    {"holidays", "holiday_ranges", "holiday_labels", "holidays_enabled", "auto_skip_weekends"}
+)
+SETTINGS_SECTIONS = frozenset(
+    {
+        "targets",
+        "remote_hosts",
+        "enable_remote_shutdown",
+        "enable_local_shutdown",
+        "shutdown_delay",
+        "terminate_timeout",
+        "terminate_children",
+        "start_with_os",
+        "storage_journal",
+        "remote_backend",
+        "remote_concurrency",
+        "remote_prewarm_seconds",
+        "remote_probe_interval",
+        "remote_lead_seconds",
+        "audio_preflight_seconds",
+        "audio_preflight_copy",
+        "audio_cache_mb",
+        "header_logo_path",
+    }
+)
+
+
+def _normalize_sections(sections: Iterable[str]) -> frozenset:
+    """선언된 변경 항목에 상위 항목("days.mon" → "days")을 채워 넣는다."""
+
+    result = set(sections)
+    if any(name.startswith("days.") for name in result):
+        result.add("days")
+    if "days" in result and not any(name.startswith("days.") for name in result):
+        result.update(f"days.{key}" for key in DAY_KEYS)
+    return frozenset(result)
+
+
+def _delta_sections(delta: Dict[str, object]) -> frozenset:
+    """`_config_delta` 결과에서 바뀐 최상위 항목 이름을 뽑는다."""
+
+    sections = set((delta.get("set") or {}).keys())
+    day_changes = delta.get("days") or {}
+    if day_changes:
+        sections.add("days")
+        sections.update(f"days.{key}" for key in day_changes)
+    return frozenset(sections)
+
+
+class ConfigManager(QtCore.QObject):
+    config_changed = Signal(SchedulerConfig)
+    sections_changed = Signal(object)  # frozenset[str]: 바뀐 설정 항목 이름
+    storage_dir_changed = Signal(str)
+
+    def __init__(self, write_interval: Optional[float] = CONFIG_WRITE_INTERVAL) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self.locator = CONFIG_LOCATOR
+        self.write_count = 0
+        self._journal_seq = 0
+        self._journal_records = 0
+        self._journal_bytes = 0
+        # (리비전, 설정) 쌍을 하나의 참조로 두고 변경 시 통째로 바꿔 끼운다(copy-on-write).
+        with STARTUP_TRACE.phase("설정 파일 읽기"):
+            self._snapshot: Tuple[int, SchedulerConfig] = (0, self._load())
+        self._persisted: Dict[str, object] = self.config.as_dict()
+        self._holiday_index: Optional[HolidayIndex] = None
+        self.calendar = RunCalendar(self)
+        self._write_interval = write_interval if write_interval and write_interval > 0 else None
+        self._dirty = False
+        self._dirty_event = threading.Event()
+        self._closed = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        if self._write_interval is not None:
+            self._writer = threading.Thread(target=self._writer_loop, name="ConfigWriter", daemon=True)
+            self._writer.start()
+        self._subscribers: List[Tuple[frozenset, Callable[[SchedulerConfig], None]]] = []
+        # 다른 스레드에서 update()가 불려도 구독자는 GUI 스레드에서 호출되도록 신호를 거친다.
+        self.sections_changed.connect(self._dispatch_sections)
+        atexit.register(self._flush_on_exit)
+
+    def _load(self) -> SchedulerConfig:
+        config_file = self.locator.config_file
+        backup_file = config_file.with_suffix(config_file.suffix + ".bak")
+        raw_data: Optional[Dict[str, object]] = None
+        used_backup = False
+        if config_file.exists():
+            try:
+                raw_data = json.loads(config_file.read_text(encoding="utf-8"))
+            except Exception as exc:  # pragma: no cover - fall back to backup/default
+                print("[설정 읽기 실패]", exc)
+        if raw_data is None and backup_file.exists():
+            try:
+                raw_data = json.loads(backup_file.read_text(encoding="utf-8"))
+                used_backup = True
+            except Exception as exc:  # pragma: no cover - still fall back to default
+                print("[백업 설정 읽기 실패]", exc)
+        raw_data = self._replay_journal(raw_data)
+        if raw_data is not None:
+            try:
+                config = SchedulerConfig.from_dict(raw_data)
+                if self._apply_migrations(config, raw_data) or used_backup:
+                    try:
+                        self._write(config)
+                    except Exception as exc:  # pragma: no cover - non critical
+                        print("[설정 마이그레이션 실패]", exc)
+                return config
+            except Exception as exc:  # pragma: no cover - fall back to default
+                print("[설정 변환 실패]", exc)
+        config = SchedulerConfig()
+        if self._apply_migrations(config, raw_data):
+            try:
+                self._write(config)
+            except Exception as exc:  # pragma: no cover - non critical
+                print("[기본 설정 저장 실패]", exc)
+        return config
+
+    @property
+    def journal_file(self) -> Path:
+        config_file = self.locator.config_file
+        return config_file.with_suffix(".journal")
+
+    def _replay_journal(self, raw_data: Optional[Dict[str, object]]) -> Optional[Dict[str, object]]:
+        """스냅샷 이후에 덧붙은 저널 기록을 순서대로 다시 적용한다."""
+
+        journal_file = self.journal_file
+        base_seq = 0
+        if raw_data is not None:
+            try:
+                base_seq = int(raw_data.get("journal_seq", 0))
+            except (TypeError, ValueError):
+                base_seq = 0
+        self._journal_seq = base_seq
+        if not journal_file.exists():
+            return raw_data
+        try:
+            payload = journal_file.read_bytes()
+        except Exception as exc:  # pragma: no cover - fall back to snapshot only
+            print("[설정 저널 읽기 실패]", exc)
+            return raw_data
+        if raw_data is None:
+            # 스냅샷과 백업을 모두 읽지 못했으면 저널이 건드리지 않은 항목이 비지 않도록 기본 설정 위에 적용한다.
+            print("[설정 저널] 설정 파일을 읽지 못해 기본 설정 위에 저널을 적용합니다.")
+            data = SchedulerConfig().as_dict()
+        else:
+            data = raw_data
+        good_bytes = 0
+        torn = False
+        for line in payload.splitlines(keepends=True):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("줄바꿈 없이 끝난 기록")
+                record = json.loads(line.decode("utf-8"))
+                seq = int(record["seq"])
+            except Exception:
+                torn = True  # 기록 도중 끊긴 마지막 줄은 버린다.
+                break
+            good_bytes += len(line)
+            if seq <= base_seq:
+                continue
+            _apply_config_delta(data, record)
+            self._journal_seq = seq
+            self._journal_records += 1
+        if torn:
+            # 끊긴 줄 뒤에 덧붙인 기록은 다음에 읽을 때 함께 버려지므로 마지막 정상 기록까지로 자른다.
+            try:
+                with journal_file.open("r+b") as handle:
+                    handle.truncate(good_bytes)
+            except OSError as exc:  # pragma: no cover - disk dependent
+                print("[설정 저널 정리 실패]", exc)
+        self._journal_bytes = good_bytes
+        if raw_data is None and not self._journal_records:
+            return None
+        return data
+
+    def _apply_migrations(self, config: SchedulerConfig, data: Optional[Dict[str, object]]) -> bool:
+        changed = False
+        if data is None or "auto_skip_weekends" not in data:
+            if config.auto_skip_weekends is not True:
+                config.auto_skip_weekends = True
+                changed = True
+        return changed
+
+    def _write(self, config: SchedulerConfig) -> None:
+        self._write_snapshot(config.as_dict())
+
+    def _write_snapshot(self, data: Dict[str, object]) -> None:
+        payload = dict(data)
+        payload["journal_seq"] = self._journal_seq
+        self._write_payload(json.dumps(payload, ensure_ascii=False, indent=2))
+        if self._journal_records or self.journal_file.exists():
+            try:
+                self.journal_file.unlink()
+            except FileNotFoundError:
+                pass
+        self._journal_records = 0
+        self._journal_bytes = 0
+
+    def _append_journal(self, delta: Dict[str, object]) -> None:
+        self._journal_seq += 1
+        record = {"seq": self._journal_seq, "at": datetime.now().isoformat(timespec="seconds"), **delta}
+        line = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+        # 바이너리로 써서 줄바꿈 변환 없이 `_journal_bytes`와 파일 크기를 맞추고, 기록마다 디스크까지 내린다.
+        with self.journal_file.open("ab") as handle:
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+        self.write_count += 1
+        self._journal_records += 1
+        self._journal_bytes += len(line)
+
+    def _persist(self, current: Dict[str, object], compact: bool) -> None:
+        """저널 모드면 변경분만 덧붙이고, 필요하면 스냅샷으로 합쳐 기록한다."""
+
+        if (
+            not compact
+            and self._journal_records < JOURNAL_COMPACT_RECORDS
+            and self._journal_bytes < JOURNAL_COMPACT_BYTES
+        ):
+            delta = _config_delta(self._persisted, current)
+            if delta:
+                self._append_journal(delta)
+        else:
+            self._write_snapshot(current)
+        self._persisted = current
+
+    def _write_payload(self, payload: str) -> None:
+        config_file = self.locator.config_file
+        config_file.parent.mkdir(parents=True, exist_ok=True)
+        backup_file = config_file.with_suffix(config_file.suffix + ".bak")
+        tmp_file = config_file.with_suffix(config_file.suffix + ".tmp")
+        self.write_count += 1
+        try:
+            if config_file.exists():
+                shutil.copy2(config_file, backup_file)
+        except Exception:
+            pass
+        tmp_file.write_text(payload, encoding="utf-8")
+        try:
+            os.replace(tmp_file, config_file)
+        except Exception:
+            shutil.move(str(tmp_file), str(config_file))
+
+    @property
+    def config(self) -> SchedulerConfig:
+        """현재 설정 스냅샷.
+
+        발행된 스냅샷은 다시 고치지 않으므로 어느 스레드에서든 잠금 없이 읽을 수 있다.
+        모든 읽는 쪽이 같은 객체를 공유하므로 속성·목록·사전을 제자리에서 고치면 안 되며,
+        값을 바꿀 때는 반드시 `update()`를 거쳐 새 스냅샷을 만든다.
+        """
+
+        return self._snapshot[1]
+
+    @property
+    def revision(self) -> int:
+        """설정이 바뀔 때마다 1씩 증가하는 리비전 번호."""
+
+        return self._snapshot[0]
+
+    def snapshot(self) -> Tuple[int, SchedulerConfig]:
+        """리비전과 설정을 한 번에 읽어 서로 어긋나지 않는 쌍으로 돌려준다."""
+
+        return self._snapshot
+
+    @property
+    def holiday_index(self) -> HolidayIndex:
+        """현재 리비전 기준으로 한 번만 만들어 재사용하는 휴일 색인."""
+
+        return self.holiday_index_for(self._snapshot)
+
+    def holiday_index_for(self, snapshot: Tuple[int, SchedulerConfig]) -> HolidayIndex:
+        revision, config = snapshot
+        index = self._holiday_index
+        if index is None or index.revision != revision:
+            index = HolidayIndex.from_config(config, revision)
+            if revision == self.revision:
+                self._holiday_index = index
+        return index
+
+    def subscribe(self, sections: Iterable[str], callback: Callable[[SchedulerConfig], None]) -> None:
+        """`sections` 중 하나라도 바뀌면 GUI 스레드에서 `callback(config)`을 호출한다."""
+
+        self._subscribers.append((_normalize_sections(sections), callback))
+
+    def unsubscribe(self, callback: Callable[[SchedulerConfig], None]) -> None:
+        self._subscribers = [(keys, cb) for keys, cb in self._subscribers if cb != callback]
+
+    def _dispatch_sections(self, sections: frozenset) -> None:
+        config = self.config
+        for keys, callback in list(self._subscribers):
+            if keys & sections:
+                callback(config)
+
+    def _notify(self, config: SchedulerConfig, sections: frozenset) -> None:
+        if sections:
+            self.sections_changed.emit(sections)
+        self.config_changed.emit(config)
+
+    def save(self) -> None:
+        with self._lock:
+            revision, config = self._snapshot
+            self._snapshot = (revision + 1, config)
+            self._dirty = True
+        self.flush()
+        self._notify(config, ALL_CONFIG_SECTIONS)
+
+    def update(self, updater, sections: Optional[Iterable[str]] = None) -> None:
+        """`updater(config)`로 설정을 바꾸고 바뀐 항목만 구독자에게 알린다.
+
+        `sections`로 바꾸는 항목을 선언하면 그대로 쓰고, 생략하면 변경 전후를 비교해 찾아낸다.
+        `updater`는 현재 스냅샷의 복사본을 받으며, 끝난 뒤에야 새 스냅샷으로 교체되므로
+        다른 스레드는 고치는 도중의 상태를 보지 않는다. 예외가 나면 복사본은 버려진다.
+        그사이 다른 변경이 먼저 끝나면 새 스냅샷의 복사본으로 `updater`를 다시 부르므로,
+        `updater` 밖에 남기는 값은 부를 때마다 처음부터 다시 정해야 한다.
+        """
+
+        while True:
+            # 복사·적용·비교는 잠금 밖에서 하고, 그사이 다른 스레드가 먼저 바꿨으면 새 스냅샷으로 다시 한다.
+            revision, current = self._snapshot
+            config = copy.deepcopy(current)
+            updater(config)
+            if sections is None:
+                changed = _delta_sections(_config_delta(current.as_dict(), config.as_dict()))
+            else:
+                changed = _normalize_sections(sections)
+            with self._lock:
+                if self._snapshot[0] != revision:
+                    continue
+                self._snapshot = (revision + 1, config)
+                self._dirty = True
+                if self._write_interval is not None:
+                    self._dirty_event.set()
+            break
+        if self._write_interval is None:
+            self.flush()
+        self._notify(config, changed)
+
+    def flush(self, compact: bool = False) -> None:
+        """모아 둔 변경이 있으면 호출한 스레드에서 바로 디스크에 기록한다.
+
+        저널 모드에서는 변경분만 덧붙이며, `compact`를 주면 저널을 전체 스냅샷으로 합친다.
+        """
+
+        with self._io_lock:
+            with self._lock:
+                if not self._dirty and not (compact and self._journal_records):
+                    return
+                self._dirty = False
+                self._dirty_event.clear()
+                config = self.config
+            # 스냅샷은 바뀌지 않으므로 직렬화는 잠금 밖에서 해도 안전하다.
+            self._persist(config.as_dict(), compact=compact or not config.storage_journal)
+
+    def _writer_loop(self) -> None:
+        interval = self._write_interval or CONFIG_WRITE_INTERVAL
+        while not self._closed.is_set():
+            self._dirty_event.wait()
+            # 첫 변경 이후 간격만큼 기다리며 그 사이의 변경을 한 번의 기록으로 합친다.
+            self._closed.wait(interval)
+            try:
+                self.flush()
+            except Exception as exc:  # pragma: no cover - disk dependent
+                print("[설정 저장 실패]", exc)
+
+    def change_storage_dir(self, path: Path) -> None:
+        with self._io_lock:
+            with self._lock:
+                self.locator.change_dir(path)
+                revision, config = self._snapshot
+                self._snapshot = (revision + 1, config)
+                self._dirty = True
+        self.flush(compact=True)
+        self.storage_dir_changed.emit(str(self.locator.config_dir))
+        self._notify(config, ALL_CONFIG_SECTIONS)
+
+    def storage_directory(self) -> Path:
+        return self.locator.config_dir
+
+    def reload(self) -> None:
+        """디스크의 설정 파일을 다시 읽어 바꿔 끼운다(바깥에서 고친 설정 반영).
+
+        지연 기록을 기다리던 변경은 먼저 기록하므로 `patch()` 직후에 불러도 잃지 않는다.
+        """
+
+        self.flush()
+        with self._io_lock:
+            with self._lock:
+                revision, _ = self._snapshot
+                self._journal_records = 0
+                config = self._load()
+                self._snapshot = (revision + 1, config)
+                self._persisted = config.as_dict()
+                self._dirty = False
+                self._dirty_event.clear()
+        self._notify(config, ALL_CONFIG_SECTIONS)
+
+    def patch(self, values: Dict[str, object], allowed: Optional[Iterable[str]] = None) -> List[str]:
+        """항목 이름별 값을 설정 파일을 읽을 때와 같은 규칙으로 걸러 적용하고, 바꾼 항목을 돌려준다.
+
+        모르는 항목이 하나라도 있으면 아무것도 바꾸지 않고 ValueError를, `allowed`에 없는 항목이
+        있으면 PermissionError를 낸다.
+        """
+
+        known = {item.name for item in fields(SchedulerConfig)}
+        unknown = sorted(set(values) - known)
+        if unknown:
+            raise ValueError(f"알 수 없는 설정 항목입니다: {', '.join(unknown)}")
+        denied = sorted(set(values) - set(allowed)) if allowed is not None else []
+        if denied:
+            raise PermissionError(f"바꿀 수 없는 설정 항목입니다: {', '.join(denied)}")
+        merged = self.config.as_dict()
+        merged.update(values)
+        checked = SchedulerConfig.from_dict(merged)
+        keys = sorted(values)
+
+        def updater(config: SchedulerConfig) -> None:
+            for key in keys:
+                setattr(config, key, copy.deepcopy(getattr(checked, key)))
+
+        self.update(updater, sections=keys)
+        return keys
+
+    def _flush_on_exit(self) -> None:
+        # 바뀐 것이 없고 저널도 비었으면 아무것도 쓰지 않는다(`flush`가 알아서 건너뛴다).
+        self._closed.set()
+        self._dirty_event.set()
+        try:
+            self.flush(compact=True)
+        except Exception:
+            pass
+
+# 정확한 기한 대기 모드에서도 절전 복귀나 시스템 시각 변경을 놓치지 않도록 최대 대기 시간을 둔다.
+MAX_SCHEDULER_SLEEP = 300.0
+# 예약 시각이 지난 뒤에도 이 시간(초) 안이면 실행한다.
+TRIGGER_WINDOW_SECONDS = 30
+
+
+class SchedulerEngine(QtCore.QObject):
+    schedule_triggered = Signal(str, str, bool, bool)  # day_key, audio_path, allow_remote, allow_local
+    next_run_changed = Signal(object)
+
+    def __init__(
+        self,
+        cfg_mgr: ConfigManager,
+        clock: Optional[Callable[[], datetime]] = None,
+        poll_interval: Optional[float] = None,
+    ) -> None:
+        """`clock`은 현재 시각 공급자(시험용 주입), `poll_interval`을 주면 예전 방식의 주기 폴링으로 동작한다."""
+
+        super().__init__()
+        self.cfg_mgr = cfg_mgr
+        self._clock: Callable[[], datetime] = clock or datetime.now
+        self._poll_interval = poll_interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._last_trigger_marker: Optional[Tuple[str, date, str]] = None
+        self.cfg_mgr.config_changed.connect(self._on_config_changed)
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="SchedulerEngine", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1.5)
+
+    def wake(self) -> None:
+        """대기 중인 스케줄러 스레드를 깨워 다음 기한을 다시 계산하게 한다."""
+
+        self._wake.set()
+
+    def _on_config_changed(self, _: SchedulerConfig) -> None:
+        self.wake()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            self._check_trigger()
+            next_run = self._compute_next_run()
+            if self._poll_interval is not None:
+                timeout = self._poll_interval
+            else:
+                timeout = self._seconds_until(next_run)
+            self._wake.wait(timeout)
+
+    def _seconds_until(self, run: Optional[UpcomingRun]) -> float:
+        if run is None:
+            return MAX_SCHEDULER_SLEEP
+        remaining = (run.when - self._clock()).total_seconds()
+        return max(0.0, min(remaining, MAX_SCHEDULER_SLEEP))
+
+    def now(self) -> datetime:
+        """스케줄러가 기준으로 삼는 현재 시각(시험에서는 주입한 시계)."""
+
+        return self._clock()
+
+    def next_run(self) -> Optional[UpcomingRun]:
+        """다음 실행 예정. 신호를 보내지 않고 조회만 한다."""
+
+        runs = self.cfg_mgr.calendar.upcoming(horizon_days=28, limit=1, now=self._clock())
+        return runs[0] if runs else None
+
+    def _compute_next_run(self) -> Optional[UpcomingRun]:
+        next_run = self.next_run()
+        self.next_run_changed.emit(next_run)
+        return next_run
+
+    def _is_day_eligible(self, cfg: SchedulerConfig, day_cfg: DaySchedule, current_date: date) -> bool:
+        return is_day_eligible(cfg, day_cfg, current_date, holidays=self.cfg_mgr.holiday_index)
+
+    def _is_holiday(self, cfg: SchedulerConfig, target: date) -> bool:
+        return is_holiday(cfg, target, self.cfg_mgr.holiday_index)
+
+    def _check_trigger(self) -> None:
+        now = self._clock()
+        snapshot = self.cfg_mgr.snapshot()
+        cfg = snapshot[1]
+        start = now - timedelta(seconds=TRIGGER_WINDOW_SECONDS)
+        queue = RunQueue.from_config(cfg, start, horizon_days=2, holidays=self.cfg_mgr.holiday_index_for(snapshot))
+        for when, day_key, slot in queue.pop_due(now):
+            marker = (day_key, when.date(), slot)
+            if self._last_trigger_marker == marker:
+                continue
+            self._last_trigger_marker = marker
+            day_cfg = cfg.days[day_key]
+            audio_path = self._resolve_audio(cfg, day_cfg)
+            self.schedule_triggered.emit(
+                day_key,
+                audio_path or "",
+                cfg.enable_remote_shutdown and day_cfg.allow_remote,
+                cfg.enable_local_shutdown and day_cfg.allow_local_shutdown,
+            )
+            ran_on = when.date().isoformat()
+
+            def _mark(config: SchedulerConfig, day_key: str = day_key, slot: str = slot, ran_on: str = ran_on) -> None:
+                config.days[day_key].last_ran = ran_on
+                config.days[day_key].last_slot = slot
+
+            self.cfg_mgr.update(_mark, sections=(f"days.{day_key}",))
+            # 실행 기록은 재부팅 뒤에도 남아야 하므로 쓰기 지연을 기다리지 않는다.
+            self.cfg_mgr.flush()
+
+    def _resolve_audio(self, cfg: SchedulerConfig, day_cfg: DaySchedule) -> Optional[str]:
+        if not day_cfg.auto_assign and day_cfg.audio_path:
+            return day_cfg.audio_path
+        if not cfg.playlist:
+            return day_cfg.audio_path
+        picked: List[str] = []
+
+        # 순번은 최신 스냅샷에서 읽고 올려야 같은 회차에 여러 슬롯이 실행돼도 곡이 겹치지 않는다.
+        def _bump(config: SchedulerConfig) -> None:
+            if not config.playlist:
+                return
+            index = config.playlist_rotation % len(config.playlist)
+            picked[:] = [config.playlist[index]]
+            config.playlist_rotation = (index + 1) % len(config.playlist)
+
+        self.cfg_mgr.update(_bump, sections=("playlist_rotation",))
+        return picked[0] if picked else day_cfg.audio_path
+
+
+# 음성 캐시 원본 변경 확인 주기(초).
+AUDIO_CACHE_SYNC_INTERVAL = 300.0
+
+
+class AudioCache(QtCore.QObject):
+    """네트워크 드라이브의 음성 파일을 설정 폴더 옆 로컬 폴더에 복사해 두는 캐시.
+
+    사본은 원본 경로·크기·수정 시각으로 만든 키로 저장하므로 원본이 바뀌면 새 사본을 만든다.
+    전체 크기가 `max_bytes`를 넘으면 가장 오래 쓰지 않은 사본부터 지운다.
+    복사는 백그라운드 스레드에서만 하고, `lookup()`은 원본의 크기·수정 시각만 확인한다.
+    """
+
+    synced = Signal(int, int)  # 사본 수, 전체 바이트
+
+    def __init__(
+        self,
+        directory: Path,
+        sources_provider: Callable[[], List[str]],
+        max_bytes: int = 512 * 1024 * 1024,
+        interval: float = AUDIO_CACHE_SYNC_INTERVAL,
+    ) -> None:
+        super().__init__()
+        self._sources_provider = sources_provider
+        self._max_bytes = max(0, max_bytes)
+        self._interval = interval
+        self._lock = threading.RLock()
+        self._directory = directory
+        self._entries: Dict[str, Dict[str, object]] = {}  # 키 → 원본/사본 정보
+        self._latest: Dict[str, str] = {}  # 원본 경로 → 가장 최근에 확인한 키
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._load_index()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def set_directory(self, directory: Path) -> None:
+        with self._lock:
+            if directory == self._directory:
+                return
+            self._directory = directory
+            self._entries.clear()
+            self._latest.clear()
+            self._load_index()
+        self._wake.set()
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        self._max_bytes = max(0, max_bytes)
+        self._wake.set()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="AudioCacheSync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1.5)
+
+    def sync_now(self) -> None:
+        self._wake.set()
+
+    def _loop(self) -> None:
+        _lower_thread_priority()
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.sync()
+            except RuntimeError:
+                return
+            except Exception as exc:  # pragma: no cover - 파일 시스템 예외 보호
+                print(f"[음성 캐시 동기화 실패] {exc}")
+            self._wake.wait(self._interval)
+
+    @staticmethod
+    def _source_key(path: str) -> str:
+        return os.path.normcase(str(Path(path).expanduser()))
+
+    def lookup(self, path: str) -> Optional[str]:
+        """원본에 대한 로컬 사본 경로. 사본이 없거나 원본이 바뀌었으면(크기·수정 시각) None.
+
+        원본에 닿지 않으면(네트워크 끊김 등) 마지막으로 만든 사본을 그대로 쓴다.
+        """
+
+        if not path or not self.enabled:
+            return None
+        with self._lock:
+            key = self._latest.get(self._source_key(path))
+            entry = self._entries.get(key) if key else None
+            if entry is None:
+                return None
+            local = self._directory / str(entry["file"])
+            expected = (entry.get("bytes"), entry.get("mtime_ns"))
+        try:
+            stat = Path(path).expanduser().stat()
+        except OSError:
+            stat = None
+        if stat is not None and (stat.st_size, stat.st_mtime_ns) != expected:
+            # 같은 경로의 파일을 바꿔 넣은 경우: 이번에는 원본을 재생하고 새 사본은 동기화에서 만든다.
+            self._wake.set()
+            return None
+        with self._lock:
+            entry["last_used"] = time.time()
+        return str(local) if local.exists() else None
+
+    def ensure(self, path: str, fit_only: bool = False) -> Optional[Path]:
+        """원본을 확인해 최신 사본을 만들고(이미 있으면 그대로) 경로를 돌려준다. 작업 스레드에서 호출한다.
+
+        `fit_only`이면 새 사본이 한도를 넘길 때 복사하지 않고 None을 돌려준다.
+        """
+
+        if not path or not self.enabled:
+            return None
+        source = Path(path).expanduser()
+        stat = source.stat()
+        key = hashlib.sha1(f"{self._source_key(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8")).hexdigest()
+        name = f"{key}{source.suffix.lower()}"
+        with self._lock:
+            directory = self._directory
+            entry = self._entries.get(key)
+        target = directory / name
+        if entry is None or not target.exists():
+            if fit_only and self.total_bytes() + stat.st_size > self._max_bytes:
+                return None
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(target.suffix + ".tmp")
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, target)
+        with self._lock:
+            if directory != self._directory:
+                return target
+            previous = self._latest.get(self._source_key(path))
+            self._entries[key] = {
+                "source": str(source),
+                "file": name,
+                "bytes": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "last_used": (entry or {}).get("last_used", time.time()),
+            }
+            self._latest[self._source_key(path)] = key
+            if previous and previous != key:
+                self._remove(previous)
+        return target
+
+    def sync(self) -> None:
+        """사용 중인 음성 파일을 모두 확인해 사본을 맞추고, 크기 한도를 넘으면 오래된 사본을 지운다."""
+
+        if not self.enabled:
+            return
+        sources = list(dict.fromkeys(p for p in self._sources_provider() if p))
+        wanted = {self._source_key(path) for path in sources}
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if self._source_key(str(entry["source"])) not in wanted]:
+                self._remove(key)
+        # 한도를 넘는 파일은 복사하지 않아야 동기화할 때마다 지우고 다시 복사하는 일이 없다.
+        for path in sources:
+            try:
+                self.ensure(path, fit_only=True)
+            except OSError as exc:
+                print(f"[음성 캐시] {Path(path).name}: {exc}")
+        with self._lock:
+            self._evict()
+            self._save_index()
+            count, total = len(self._entries), self.total_bytes()
+        self.synced.emit(count, total)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(int(entry.get("bytes", 0)) for entry in self._entries.values())
+
+    def _evict(self) -> None:
+        total = self.total_bytes()
+        for key, _ in sorted(self._entries.items(), key=lambda item: float(item[1].get("last_used", 0))):
+            if total <= self._max_bytes:
+                break
+            total -= int(self._entries[key].get("bytes", 0))
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for source, latest in list(self._latest.items()):
+            if latest == key:
+                del self._latest[source]
+        try:
+            (self._directory / str(entry["file"])).unlink()
+        except OSError:
+            pass
+
+    def _index_file(self) -> Path:
+        return self._directory / "index.json"
+
+    def _load_index(self) -> None:
+        try:
+            data = json.loads(self._index_file().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for key, entry in (data.get("entries") or {}).items():
+            if isinstance(entry, dict) and entry.get("file") and entry.get("source"):
+                self._entries[key] = entry
+                self._latest[self._source_key(str(entry["source"]))] = key
+
+    def _save_index(self) -> None:
+        if not self._entries and not self._index_file().exists():
+            return
+        self._directory.mkdir(parents=True, exist_ok=True)
+        tmp = self._index_file().with_suffix(".tmp")
+        tmp.write_text(json.dumps({"entries": self._entries}, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self._index_file())
+
+
+# 종료 신호 뒤 강제 종료(kill)까지 기다리는 기본 시간과, kill 뒤 확인 시간(초).
+PROCESS_TERMINATE_TIMEOUT = 5.0
+PROCESS_KILL_TIMEOUT = 2.0
+
+
+@dataclass
+class ProcessOutcome:
+    pid: int
+    name: str
+    outcome: str  # "종료", "강제 종료", "이미 종료", "권한 없음", "남아 있음"
+    child: bool = False
+
+
+@dataclass
+class TerminationReport:
+    outcomes: List[ProcessOutcome] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def survivors(self) -> List[ProcessOutcome]:
+        return [item for item in self.outcomes if item.outcome in {"권한 없음", "남아 있음"}]
+
+    def summary(self, limit: int = 8) -> str:
+        counts: Dict[str, int] = {}
+        for item in self.outcomes:
+            counts[item.outcome] = counts.get(item.outcome, 0) + 1
+        head = " · ".join(f"{outcome} {count}" for outcome, count in counts.items()) or "대상 없음"
+        details = [
+            f"{item.name}({item.pid}{', 하위' if item.child else ''}) {item.outcome}" for item in self.outcomes[:limit]
+        ]
+        if len(self.outcomes) > limit:
+            details.append(f"외 {len(self.outcomes) - limit}개")
+        text = f"{head} · {self.elapsed:.2f}초"
+        return f"{text} — {', '.join(details)}" if details else text
+
+
+# 프로세스 색인 갱신 주기(초).
+PROCESS_INDEX_INTERVAL = 2.0
+
+
+class ProcessIndex(QtCore.QObject):
+    """종료 대상 프로그램 이름 → 실행 중인 프로세스 색인을 백그라운드에서 증분 갱신한다.
+
+    갱신할 때마다 PID 목록만 읽고, 새로 생긴 PID의 이름만 조회한다. 사라진 PID는 색인에서 뺀다.
+    이름을 읽을 권한이 없는 PID도 기억해 두고 다시 조회하지 않는다.
+    그래서 예약 실행 시점에는 전체 프로세스를 훑지 않고 대상 수만큼만 꺼내 쓸 수 있다.
+    """
+
+    changed = Signal()
+
+    def __init__(self, targets_provider: Callable[[], List[str]], interval: float = PROCESS_INDEX_INTERVAL) -> None:
+        super().__init__()
+        self._targets_provider = targets_provider
+        self._interval = max(0.2, interval)
+        self._lock = threading.Lock()
+        # 백그라운드 갱신과 예약 실행 직전의 갱신이 겹치지 않게 한다.
+        self._refresh_lock = threading.Lock()
+        self._names: Dict[int, str] = {}  # 모든 PID의 프로세스 이름
+        self._denied: Set[int] = set()  # 이름을 읽을 권한이 없는 PID
+        self._targets: frozenset = frozenset()
+        self._matches: Dict[str, Dict[int, psutil.Process]] = {}
+        self._refreshed_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ProcessIndex", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1.5)
+
+    def refresh_now(self) -> None:
+        self._wake.set()
+
+    def _loop(self) -> None:
+        _lower_thread_priority()
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.refresh()
+            except RuntimeError:
+                # 프로그램 종료 중 Qt 객체가 먼저 정리되면 신호를 보낼 수 없으므로 조용히 끝낸다.
+                return
+            except Exception as exc:  # pragma: no cover - psutil 예외 보호
+                print(f"[프로세스 색인 갱신 실패] {exc}")
+            self._wake.wait(self._interval)
+
+    def refresh(self) -> bool:
+        """색인을 한 번 갱신하고, 대상 프로세스 구성이 바뀌었으면 True를 돌려준다."""
+
+        with self._refresh_lock:
+            return self._refresh()
+
+    def _refresh(self) -> bool:
+        own_pid = os.getpid()
+        pids = set(psutil.pids())
+        pids.discard(own_pid)
+        targets = frozenset(t.lower() for t in self._targets_provider())
+        with self._lock:
+            known = set(self._names) | self._denied
+            retarget = targets != self._targets
+        new_names: Dict[int, str] = {}
+        new_procs: Dict[int, psutil.Process] = {}
+        denied: Set[int] = set()
+        for pid in pids - known:
+            try:
+                proc = psutil.Process(pid)
+                name = proc.name()
+            except psutil.AccessDenied:
+                denied.add(pid)
+                continue
+            except psutil.NoSuchProcess:
+                continue
+            new_names[pid] = name
+            new_procs[pid] = proc
+        with self._lock:
+            before = {name: frozenset(procs) for name, procs in self._matches.items()}
+            for pid in known - pids:
+                self._names.pop(pid, None)
+                self._denied.discard(pid)
+            self._denied |= denied
+            for pid, name in new_names.items():
+                self._names[pid] = name
+            if retarget:
+                self._targets = targets
+                matches: Dict[str, Dict[int, psutil.Process]] = {}
+                for pid, name in self._names.items():
+                    name = name.lower()
+                    if name in targets:
+                        proc = new_procs.get(pid) or self._matches.get(name, {}).get(pid)
+                        if proc is None:
+                            try:
+                                proc = psutil.Process(pid)
+                            except psutil.NoSuchProcess:
+                                continue
+                        matches.setdefault(name, {})[pid] = proc
+                self._matches = matches
+            else:
+                for name, procs in self._matches.items():
+                    for pid in [pid for pid in procs if pid not in pids]:
+                        del procs[pid]
+                for pid, proc in new_procs.items():
+                    name = self._names.get(pid, "").lower()
+                    if name in targets:
+                        self._matches.setdefault(name, {})[pid] = proc
+                self._matches = {name: procs for name, procs in self._matches.items() if procs}
+            self._refreshed_at = time.monotonic()
+            after = {name: frozenset(procs) for name, procs in self._matches.items()}
+        if after != before:
+            self.changed.emit()
+            return True
+        return False
+
+    def covers(self, targets: Iterable[str]) -> bool:
+        """마지막 갱신이 `targets`를 모두 대상으로 삼았으면 True. 새로 추가한 대상은 다음 갱신부터 들어간다."""
+
+        with self._lock:
+            return self._refreshed_at is not None and {t.lower() for t in targets} <= self._targets
+
+    def processes(self, targets: Iterable[str]) -> List[Tuple[psutil.Process, str]]:
+        """색인에서 대상 이름과 일치하는 (프로세스, 이름) 목록을 꺼낸다. 색인 밖의 이름은 무시한다."""
+
+        wanted = {t.lower() for t in targets}
+        with self._lock:
+            return [
+                (proc, self._names.get(pid, name))
+                for name, procs in self._matches.items()
+                if name in wanted
+                for pid, proc in procs.items()
+            ]
+
+    def running(self) -> Dict[str, List[int]]:
+        """실행 중인 대상 프로그램 이름과 PID 목록. 화면 표시용으로 캐시만 읽는다."""
+
+        result: Dict[str, List[int]] = {}
+        with self._lock:
+            for name, procs in sorted(self._matches.items()):
+                pids = sorted(procs)
+                result[self._names.get(pids[0], name)] = pids
+        return result
+
+
+def terminate_programs(
+    targets: List[str],
+    timeout: float = PROCESS_TERMINATE_TIMEOUT,
+    include_children: bool = False,
+    kill_timeout: float = PROCESS_KILL_TIMEOUT,
+    index: Optional[ProcessIndex] = None,
+) -> TerminationReport:
+    """대상 프로그램에 한꺼번에 종료 신호를 보내고, `timeout`초 동안 함께 기다린 뒤 남은 프로세스를 강제 종료한다.
+
+    `include_children`이면 대상의 하위 프로세스 트리(브라우저 렌더러 등)도 같이 정리한다.
+    `index`가 있으면 증분 갱신으로 직전에 시작한 프로세스까지 반영한 뒤 색인에서 대상만 꺼내 쓴다.
+    색인이 대상을 모두 다루지 않거나 갱신에 실패하면 전체 프로세스를 훑는다.
+    프로세스별 결과와 전체 소요 시간을 `TerminationReport`로 돌려준다.
+    """
+
+    started = time.perf_counter()
+    lowered = {t.lower() for t in targets}
+    own_pid = os.getpid()
+    procs: Dict[int, Tuple[psutil.Process, str, bool]] = {}
+    use_index = False
+    if index is not None:
+        try:
+            index.refresh()
+            use_index = index.covers(lowered)
+        except Exception as exc:  # pragma: no cover - psutil 예외 보호
+            print(f"[프로세스 색인 갱신 실패] {exc}")
+    if use_index:
+        for proc, name in index.processes(lowered):
+            # PID가 재사용됐으면 is_running()이 생성 시각 비교로 걸러낸다.
+            if proc.pid != own_pid and proc.is_running():
+                procs[proc.pid] = (proc, name, False)
+    else:
+        for proc in psutil.process_iter(["name"]):
+            try:
+                name = proc.info.get("name") or ""
+                if name.lower() in lowered and proc.pid != own_pid:
+                    procs[proc.pid] = (proc, name, False)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+    if include_children:
+        for proc, _, _ in list(procs.values()):
+            try:
+                children = proc.children(recursive=True)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            for child in children:
+                if child.pid in procs or child.pid == own_pid:
+                    continue
+                try:
+                    procs[child.pid] = (child, child.name(), True)
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+    outcomes: Dict[int, str] = {}
+    signalled: List[psutil.Process] = []
+    for pid, (proc, _, _) in procs.items():
+        try:
+            proc.terminate()
+            signalled.append(proc)
+        except psutil.NoSuchProcess:
+            outcomes[pid] = "이미 종료"
+        except psutil.AccessDenied:
+            outcomes[pid] = "권한 없음"
+    _, alive = psutil.wait_procs(signalled, timeout=max(0.0, timeout))
+    for proc in signalled:
+        outcomes.setdefault(proc.pid, "종료")
+    if alive:
+        for proc in alive:
+            try:
+                proc.kill()
+                outcomes[proc.pid] = "강제 종료"
+            except psutil.NoSuchProcess:
+                outcomes[proc.pid] = "종료"
+            except psutil.AccessDenied:
+                outcomes[proc.pid] = "권한 없음"
+        _, still_alive = psutil.wait_procs(alive, timeout=kill_timeout)
+        for proc in still_alive:
+            if outcomes.get(proc.pid) != "권한 없음":
+                outcomes[proc.pid] = "남아 있음"
+    return TerminationReport(
+        [ProcessOutcome(pid, name, outcomes.get(pid, "종료"), child) for pid, (_, name, child) in procs.items()],
+        time.perf_counter() - started,
+    )
+
+
+def _escape_powershell(value: str) -> str:
+    return value.replace("`", "``").replace("\"", "`\"")
+
+
+# 원격 종료를 동시에 보내는 최대 작업자 수와 제한 시간(초).
+REMOTE_SHUTDOWN_WORKERS = 16
+REMOTE_HOST_TIMEOUT = 20.0
+REMOTE_SHUTDOWN_TIMEOUT = 60.0
+SSH_CONNECT_TIMEOUT = 10.0
+
+# paramiko·asyncssh는 cryptography까지 끌고 와 시작을 늦추므로 처음 쓸 때 불러온다.
+_optional_modules: Dict[str, object] = {}
+_optional_lock = threading.Lock()
+
+
+def optional_module_available(name: str) -> bool:
+    """모듈을 불러오지 않고 설치 여부만 확인한다."""
+
+    if name in _optional_modules:
+        return _optional_modules[name] is not None
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def load_paramiko():
+    """paramiko를 처음 쓸 때 불러온다. 설치되어 있지 않으면 None."""
+
+    with _optional_lock:
+        if "paramiko" not in _optional_modules:
+            try:
+                import paramiko  # type: ignore
+            except ImportError:  # pragma: no cover - optional dependency
+                paramiko = None
+            _optional_modules["paramiko"] = paramiko
+        return _optional_modules["paramiko"]
+
+
+def load_asyncssh():
+    """asyncssh를 처음 쓸 때 불러온다. 설치되어 있지 않으면 None."""
+
+    with _optional_lock:
+        if "asyncssh" not in _optional_modules:
+            try:
+                import asyncssh  # type: ignore
+            except ImportError:  # pragma: no cover - optional dependency
+                asyncssh = None
+            _optional_modules["asyncssh"] = asyncssh
+        return _optional_modules["asyncssh"]
+
+
+def split_host_port(raw: str, default_port: int) -> Tuple[str, int]:
+    """"host", "host:port", "[v6]:port", "ssh://host:port" 형식을 (호스트, 포트)로 나눈다."""
+
+    target = raw.strip()
+    if not target:
+        return "", default_port
+    if "://" in target:
+        target = target.split("://", 1)[1]
+    if target.startswith("[") and "]" in target:
+        host_part, _, remainder = target.partition("]")
+        host = host_part.strip("[]")
+        if remainder.startswith(":"):
+            try:
+                return host, int(remainder[1:])
+            except ValueError:
+                return host, default_port
+        return host, default_port
+    if target.count(":") == 1:
+        name, port_str = target.split(":", 1)
+        if port_str.isdigit():
+            return name, int(port_str)
+    return target, default_port
+
+
+# 원격 종료 방식별 기본 포트.
+REMOTE_METHOD_PORTS = {"ssh": 22, "winrm": 5985, "winrm-http": 5985, "winrm-https": 5986}
+# 방식을 적지 않은 원격 대상의 종료 방식. 연결 확인과 종료가 같은 포트를 보도록 함께 쓴다.
+DEFAULT_REMOTE_METHOD = "winrm"
+# 한 셀렉터에 동시에 걸어 두는 최대 소켓 수(Windows select()의 FD_SETSIZE 512 이하).
+PROBE_MAX_IN_FLIGHT = 256
+_CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, "WSAEWOULDBLOCK", 10035)}
+
+
+@dataclass
+class ProbeResult:
+    host: str
+    port: int
+    tcp_open: Optional[bool] = None  # None: 제한 시간 안에 응답 없음
+    tcp_rtt: Optional[float] = None
+    icmp_ok: Optional[bool] = None  # None: ICMP를 쓰지 않았거나 운영체제가 허용하지 않음
+    icmp_rtt: Optional[float] = None
+    error: str = ""
+
+    @property
+    def reachable(self) -> bool:
+        """포트가 열렸거나 연결 거부(RST)라도 돌아왔거나 ICMP 응답이 있으면 살아 있는 호스트로 본다."""
+
+        return bool(self.tcp_open) or self.error == "연결 거부" or bool(self.icmp_ok)
+
+    @property
+    def rtt(self) -> Optional[float]:
+        return self.tcp_rtt if self.tcp_rtt is not None else self.icmp_rtt
+
+    def describe(self) -> str:
+        parts: List[str] = []
+        if self.tcp_open:
+            parts.append(f"TCP {self.port} 응답 {self.tcp_rtt * 1000:.1f} ms")
+        else:
+            parts.append(f"TCP {self.port} {self.error or '응답 없음'}")
+        if self.icmp_ok:
+            parts.append(f"ICMP 응답 {self.icmp_rtt * 1000:.1f} ms")
+        elif self.icmp_ok is False:
+            parts.append("ICMP 응답 없음")
+        return " · ".join(parts)
+
+
+def remote_method(host: Dict[str, str]) -> str:
+    """원격 대상의 종료 방식(소문자). 적지 않았으면 `DEFAULT_REMOTE_METHOD`."""
+
+    return (host.get("method") or DEFAULT_REMOTE_METHOD).lower()
+
+
+def remote_probe_target(host: Dict[str, str]) -> Tuple[str, int]:
+    method = remote_method(host)
+    return split_host_port(host.get("host") or "", REMOTE_METHOD_PORTS.get(method, 22))
+
+
+def _icmp_checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _open_icmp_socket() -> Optional[socket.socket]:
+    """권한 없이 쓸 수 있는 ICMP(데이터그램) 소켓을 연다. 운영체제가 막으면 None."""
+
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except (OSError, AttributeError):
+        return None
+    sock.setblocking(False)
+    return sock
+
+
+def probe_hosts(
+    targets: Iterable[Tuple[str, int]],
+    timeout: float = 2.0,
+    icmp: bool = False,
+) -> List[ProbeResult]:
+    """여러 호스트의 TCP 포트(선택적으로 ICMP)를 셀렉터 하나로 동시에 확인한다.
+
+    외부 ping 프로세스를 띄우지 않고 비차단 connect()만 사용하며, 결과는 입력 순서대로 돌려준다.
+    ICMP는 권한 없는 데이터그램 소켓을 허용하는 운영체제(리눅스 ping_group_range, macOS)에서만 쓴다.
+    """
+
+    results = [ProbeResult(host, port) for host, port in targets]
+    if not results:
+        return results
+    deadline = time.monotonic() + max(0.05, timeout)
+    selector = selectors.DefaultSelector()
+    addresses: Dict[int, Tuple] = {}
+    for index, result in enumerate(results):
+        try:
+            info = socket.getaddrinfo(result.host, result.port, type=socket.SOCK_STREAM)[0]
+            addresses[index] = (info[0], info[4])
+        except (OSError, UnicodeError) as exc:
+            result.tcp_open = False
+            result.error = f"주소 해석 실패: {exc}"
+    waiting = list(addresses)
+    in_flight: Dict[socket.socket, Tuple[int, float]] = {}
+
+    icmp_sock = _open_icmp_socket() if icmp else None
+    icmp_sent: Dict[Tuple[str, int], Tuple[int, float]] = {}
+    if icmp_sock is not None:
+        ident = os.getpid() & 0xFFFF
+        for seq, (index, (family, sockaddr)) in enumerate(addresses.items(), 1):
+            if family != socket.AF_INET:
+                continue
+            header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+            packet = struct.pack("!BBHHH", 8, 0, _icmp_checksum(header), ident, seq)
+            try:
+                icmp_sock.sendto(packet, (sockaddr[0], 0))
+                icmp_sent[(sockaddr[0], seq)] = (index, time.monotonic())
+                results[index].icmp_ok = False
+            except OSError:
+                continue
+        if icmp_sent:
+            selector.register(icmp_sock, selectors.EVENT_READ)
+
+    def start_next() -> None:
+        while waiting and len(in_flight) < PROBE_MAX_IN_FLIGHT:
+            index = waiting.pop(0)
+            family, sockaddr = addresses[index]
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            code = sock.connect_ex(sockaddr)
+            started = time.monotonic()
+            if code == 0:
+                results[index].tcp_open, results[index].tcp_rtt = True, 0.0
+                sock.close()
+                continue
+            if code not in _CONNECT_PENDING:
+                finish(index, code)
+                sock.close()
+                continue
+            in_flight[sock] = (index, started)
+            selector.register(sock, selectors.EVENT_WRITE)
+
+    def finish(index: int, code: int, rtt: Optional[float] = None) -> None:
+        result = results[index]
+        if code == 0:
+            result.tcp_open, result.tcp_rtt = True, rtt
+        else:
+            result.tcp_open = False
+            result.error = "연결 거부" if code in (errno.ECONNREFUSED, 10061) else os.strerror(code)
+
+    def icmp_pending() -> bool:
+        return any(results[index].icmp_ok is False for index, _ in icmp_sent.values())
+
+    try:
+        start_next()
+        while in_flight or (icmp_sent and icmp_pending()):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                sock = key.fileobj
+                if sock is icmp_sock:
+                    _read_icmp_replies(icmp_sock, icmp_sent, results)
+                    continue
+                index, started = in_flight.pop(sock)
+                selector.unregister(sock)
+                finish(index, sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR), time.monotonic() - started)
+                sock.close()
+            start_next()
+    finally:
+        for sock in list(in_flight):
+            selector.unregister(sock)
+            sock.close()
+        for index in waiting + [index for index, _ in in_flight.values()]:
+            results[index].error = results[index].error or "응답 없음"
+        if icmp_sock is not None:
+            icmp_sock.close()
+        selector.close()
+    for result in results:
+        if result.tcp_open is None and not result.error:
+            result.error = "응답 없음"
+    return results
+
+
+def _read_icmp_replies(
+    sock: socket.socket, sent: Dict[Tuple[str, int], Tuple[int, float]], results: List[ProbeResult]
+) -> None:
+    while True:
+        try:
+            data, (address, _) = sock.recvfrom(1024)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            return
+        if data and data[0] >> 4 == 4:  # macOS는 IP 헤더를 포함해 돌려준다.
+            data = data[(data[0] & 0x0F) * 4:]
+        if len(data) < 8:
+            continue
+        icmp_type, _, _, _, seq = struct.unpack("!BBHHH", data[:8])
+        entry = sent.get((address, seq))
+        if icmp_type != 0 or entry is None:
+            continue
+        index, started = entry
+        if results[index].icmp_ok is False:
+            results[index].icmp_ok = True
+            results[index].icmp_rtt = time.monotonic() - started
+
+
+def _collect_ssh_commands(host: Dict[str, str]) -> List[str]:
+    commands: List[str] = []
+    for key in ("command", "shutdown_command"):
+        value = host.get(key)
+        if isinstance(value, str) and value.strip():
+            commands.append(value.strip())
+    extra = host.get("commands") or host.get("shutdown_commands")
+    if isinstance(extra, (list, tuple)):
+        for item in extra:
+            if isinstance(item, str) and item.strip():
+                commands.append(item.strip())
+    platform_hint = (host.get("platform") or "").lower()
+    if platform_hint:
+        if "win" in platform_hint:
+            commands.append("shutdown /s /t 0")
+        elif any(token in platform_hint for token in ("linux", "unix", "mac", "darwin")):
+            commands.append("shutdown -h now")
+    if not commands:
+        commands.extend(["shutdown /s /t 0", "shutdown -h now"])
+    seen: List[str] = []
+    for cmd in commands:
+        if cmd not in seen:
+            seen.append(cmd)
+    return seen
+
+
+def _winrm_shutdown_command(host: Dict[str, str], target: str) -> List[str]:
+    host_name, _ = split_host_port(target, 0)
+    command = ["shutdown", "/m", f"\\\\{host_name}", "/s", "/t", "0"]
+    username = (host.get("username") or "").strip()
+    password = host.get("password") or ""
+    if username:
+        command.extend(["/u", username])
+        if password:
+            command.extend(["/p", password])
+    return command
+
+
+def _remaining(deadline: float) -> float:
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("호스트별 제한 시간을 넘겼습니다.")
+    return remaining
+
+
+def _run_ssh_commands(ssh, commands: List[str], deadline: float) -> str:
+    """연결된 SSH 세션에서 종료 명령을 차례로 시도하고 성공한 명령 안내문을 돌려준다.
+
+    어떤 명령도 종료 코드를 받지 못했다면 세션 자체의 문제로 보고 ConnectionError를 낸다.
+    """
+
+    errors: List[str] = []
+    got_status = False
+    for command in commands:
+        try:
+            stdin, stdout, stderr = ssh.exec_command(command, timeout=_remaining(deadline))
+            channel = stdout.channel
+            while not channel.exit_status_ready():
+                _remaining(deadline)
+                time.sleep(0.02)
+            exit_status = channel.recv_exit_status()
+            got_status = got_status or exit_status >= 0
+            if exit_status == 0:
+                return f"SSH 명령 전송: {command}"
+            detail = stderr.read().decode("utf-8", errors="ignore").strip()
+            if not detail:
+                detail = stdout.read().decode("utf-8", errors="ignore").strip()
+            detail = detail or f"종료 코드 {exit_status}"
+            errors.append(f"{command}: {detail}")
+        except TimeoutError:
+            raise
+        except Exception as ssh_exc:  # pragma: no cover - network dependent
+            errors.append(f"{command}: {ssh_exc}")
+    if not got_status:
+        raise ConnectionError("; ".join(errors) or "SSH 세션이 응답하지 않습니다.")
+    raise RuntimeError("; ".join(errors) or "알 수 없는 이유로 종료 명령 실패")
+
+
+def _open_ssh_client(host: Dict[str, str], target: str, timeout: float):
+    paramiko = load_paramiko()
+    if not paramiko:
+        raise RuntimeError("paramiko가 포함되지 않아 SSH 원격 종료를 실행할 수 없습니다.")
+    host_name, port = split_host_port(target, 22)
+    ssh = paramiko.SSHClient()
+    ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    try:
+        ssh.connect(
+            hostname=host_name,
+            port=port,
+            username=host.get("username") or None,
+            password=host.get("password") or None,
+            timeout=timeout,
+            banner_timeout=timeout,
+            auth_timeout=timeout,
+            look_for_keys=False,
+            allow_agent=False,
+        )
+    except Exception:
+        ssh.close()
+        raise
+    return ssh
+
+
+def _shutdown_remote_ssh(
+    host: Dict[str, str], target: str, deadline: float, pool: Optional["SSHSessionPool"] = None
+) -> str:
+    commands = _collect_ssh_commands(host)
+    pooled = pool.acquire(host) if pool is not None else None
+    if pooled is not None:
+        try:
+            return _run_ssh_commands(pooled, commands, deadline) + " (미리 연결된 세션)"
+        except ConnectionError:
+            pass  # 세션이 끊겼으면 아래에서 새로 연결한다.
+        finally:
+            pooled.close()
+    ssh = _open_ssh_client(host, target, min(SSH_CONNECT_TIMEOUT, _remaining(deadline)))
+    try:
+        return _run_ssh_commands(ssh, commands, deadline)
+    finally:
+        ssh.close()
+
+
+# 미리 연 SSH 세션의 keepalive 간격과 최대 보관 시간(초).
+SSH_KEEPALIVE_INTERVAL = 15
+SSH_POOL_MAX_AGE = 30 * 60
+
+
+class SSHSessionPool:
+    """예약 실행 전에 SSH 세션을 미리 열고 인증해 두었다가 원격 종료 때 넘겨주는 풀.
+
+    세션은 keepalive로 음성 재생 동안 유지하며, 한 번 꺼내 쓰면 풀에서 빠진다.
+    끊겼거나 오래된 세션은 꺼낼 때 버리므로 호출 측은 새로 연결하면 된다.
+    """
+
+    def __init__(self, max_workers: int = REMOTE_SHUTDOWN_WORKERS, max_age: float = SSH_POOL_MAX_AGE) -> None:
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, int, str], Tuple[float, object]] = {}
+        self._warming: set = set()
+        self._max_workers = max(1, max_workers)
+        self._max_age = max_age
+
+    @staticmethod
+    def key_for(host: Dict[str, str]) -> Optional[Tuple[str, int, str]]:
+        if remote_method(host) != "ssh":
+            return None
+        host_name, port = split_host_port(host.get("host") or "", 22)
+        if not host_name:
+            return None
+        return host_name, port, host.get("username") or ""
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def prewarm(self, hosts: List[Dict[str, str]], timeout: float = SSH_CONNECT_TIMEOUT) -> None:
+        """백그라운드에서 `warm()`을 실행한다."""
+
+        if not optional_module_available("paramiko"):
+            return
+        threading.Thread(target=self.warm, args=(hosts, timeout), name="SSHPrewarm", daemon=True).start()
+
+    def warm(self, hosts: List[Dict[str, str]], timeout: float = SSH_CONNECT_TIMEOUT) -> int:
+        """아직 열린 세션이 없는 SSH 호스트에 동시에 접속·인증하고, 살아 있는 세션 수를 돌려준다."""
+
+        if not load_paramiko():
+            return 0
+        self.prune()
+        todo: List[Tuple[Tuple[str, int, str], Dict[str, str]]] = []
+        with self._lock:
+            for host in hosts:
+                key = self.key_for(host)
+                if key is None or key in self._sessions or key in self._warming:
+                    continue
+                self._warming.add(key)
+                todo.append((key, host))
+        if todo:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(todo)), thread_name_prefix="SSHPrewarm"
+            ) as executor:
+                for key, host in todo:
+                    executor.submit(self._open, key, host, timeout)
+        return len(self)
+
+    def _open(self, key: Tuple[str, int, str], host: Dict[str, str], timeout: float) -> None:
+        try:
+            client = _open_ssh_client(host, (host.get("host") or "").strip(), timeout)
+            transport = client.get_transport()
+            if transport is not None:
+                transport.set_keepalive(SSH_KEEPALIVE_INTERVAL)
+        except Exception as exc:  # pragma: no cover - network dependent
+            print(f"[SSH 사전 연결 실패] {key[0]}:{key[1]}: {exc}")
+            client = None
+        with self._lock:
+            self._warming.discard(key)
+            if client is not None:
+                previous = self._sessions.pop(key, None)
+                self._sessions[key] = (time.monotonic(), client)
+                if previous is not None:
+                    previous[1].close()
+
+    def has_session(self, host: Dict[str, str]) -> bool:
+        """해당 호스트의 살아 있는 세션이 풀에 있으면 True. 세션은 꺼내지 않는다."""
+
+        key = self.key_for(host)
+        if key is None:
+            return False
+        with self._lock:
+            entry = self._sessions.get(key)
+        if entry is None:
+            return False
+        opened_at, client = entry
+        transport = client.get_transport()
+        return time.monotonic() - opened_at <= self._max_age and transport is not None and transport.is_active()
+
+    def acquire(self, host: Dict[str, str]):
+        """해당 호스트의 살아 있는 세션을 풀에서 꺼내 돌려주고, 없으면 None."""
+
+        key = self.key_for(host)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._sessions.pop(key, None)
+        if entry is None:
+            return None
+        opened_at, client = entry
+        transport = client.get_transport()
+        if time.monotonic() - opened_at > self._max_age or transport is None or not transport.is_active():
+            client.close()
+            return None
+        return client
+
+    def prune(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                key
+                for key, (opened_at, client) in self._sessions.items()
+                if now - opened_at > self._max_age
+                or client.get_transport() is None
+                or not client.get_transport().is_active()
+            ]
+            clients = [self._sessions.pop(key)[1] for key in stale]
+        for client in clients:
+            client.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            clients = [client for _, client in self._sessions.values()]
+            self._sessions.clear()
+        for client in clients:
+            client.close()
+
+
+# 도달성 캐시: 응답 없음으로 기록된 지 이 시간(초) 안이면 종료 전에 짧게 다시 확인한다.
+REACHABILITY_FRESH_SECONDS = 10 * 60
+REACHABILITY_RECHECK_TIMEOUT = 1.0
+# 재확인에도 응답이 없던 호스트에 주는 호스트별 제한 시간(초). 건너뛰지 않고 이 시간만큼은 시도한다.
+REMOTE_SUSPECT_TIMEOUT = 5.0
+
+
+@dataclass
+class HostState:
+    host: str
+    port: int
+    checked_at: Optional[float] = None  # time.time() 기준
+    last_seen: Optional[float] = None
+    rtt: Optional[float] = None
+    error: str = ""
+    failures: int = 0
+
+    @property
+    def online(self) -> Optional[bool]:
+        if self.checked_at is None:
+            return None
+        return self.failures == 0
+
+    def describe(self, now: Optional[float] = None) -> str:
+        if self.checked_at is None:
+            return "확인 전"
+        now = time.time() if now is None else now
+        age = _format_age(now - self.checked_at)
+        if self.failures == 0:
+            rtt = f"{self.rtt * 1000:.0f} ms" if self.rtt is not None else "응답"
+            return f"● {rtt} · {age}"
+        seen = f" · 마지막 응답 {_format_age(now - self.last_seen)}" if self.last_seen else ""
+        return f"✖ {self.error or '응답 없음'} · {age}{seen}"
+
+
+def _format_age(seconds: float) -> str:
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds}초 전"
+    if seconds < 3600:
+        return f"{seconds // 60}분 전"
+    return f"{seconds // 3600}시간 전"
+
+
+class HostReachabilityCache(QtCore.QObject):
+    """원격 PC별 마지막 응답 시각·RTT·오류를 보관하고, 낮은 우선순위 스레드가 주기적으로 갱신한다.
+
+    조회(`state_for`, `order`)는 캐시만 읽으므로 새 검사를 일으키지 않는다.
+    `interval`이 0이면 주기 갱신을 멈추고, 연결 시험 결과(`record`)만 반영한다.
+    """
+
+    updated = Signal()
+
+    def __init__(self, hosts_provider: Callable[[], List[Dict[str, str]]], interval: float = 120) -> None:
+        super().__init__()
+        self._hosts_provider = hosts_provider
+        self._interval = max(0.0, float(interval))
+        self._lock = threading.Lock()
+        self._states: Dict[Tuple[str, int], HostState] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="HostReachability", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1.5)
+
+    def set_interval(self, seconds: float) -> None:
+        self._interval = max(0.0, float(seconds))
+        self._wake.set()
+
+    def refresh_now(self) -> None:
+        """대기 중인 갱신 스레드를 깨워 바로 한 번 검사하게 한다."""
+
+        self._wake.set()
+
+    def _loop(self) -> None:
+        _lower_thread_priority()
+        while not self._stop.is_set():
+            self._wake.clear()
+            if self._interval > 0:
+                try:
+                    self.refresh()
+                except RuntimeError:
+                    # 프로그램 종료 중 Qt 객체가 먼저 정리되면 신호를 보낼 수 없으므로 조용히 끝낸다.
+                    return
+                except Exception as exc:  # pragma: no cover - 네트워크 예외 보호
+                    print(f"[도달성 검사 실패] {exc}")
+            self._wake.wait(self._interval or None)
+
+    def refresh(self, timeout: float = 2.0) -> None:
+        targets = {remote_probe_target(host) for host in self._hosts_provider()}
+        targets = {target for target in targets if target[0]}
+        with self._lock:
+            for key in list(self._states):
+                if key not in targets:
+                    del self._states[key]
+        if targets:
+            self.record(probe_hosts(sorted(targets), timeout=timeout))
+
+    def record(self, results: Iterable[ProbeResult]) -> None:
+        now = time.time()
+        with self._lock:
+            for result in results:
+                state = self._states.setdefault((result.host, result.port), HostState(result.host, result.port))
+                state.checked_at = now
+                if result.reachable:
+                    state.last_seen = now
+                    state.rtt = result.rtt
+                    state.error = ""
+                    state.failures = 0
+                else:
+                    state.error = result.error or "응답 없음"
+                    state.failures += 1
+        self.updated.emit()
+
+    def state_for(self, host: Dict[str, str]) -> Optional[HostState]:
+        with self._lock:
+            state = self._states.get(remote_probe_target(host))
+            return copy.copy(state) if state is not None else None
+
+    def order(self, hosts: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """응답이 빠른 호스트부터, 기록이 없는 호스트, 응답이 없던 호스트 순으로 정렬한다."""
+
+        def rank(host: Dict[str, str]) -> Tuple[int, float]:
+            state = self.state_for(host)
+            if state is None or state.online is None:
+                return 1, 0.0
+            if state.online:
+                return 0, state.rtt if state.rtt is not None else 0.0
+            return 2, 0.0
+
+        return sorted(hosts, key=rank)
+
+    def probably_offline(self, host: Dict[str, str], max_age: float = REACHABILITY_FRESH_SECONDS) -> bool:
+        state = self.state_for(host)
+        return (
+            state is not None
+            and state.checked_at is not None
+            and state.failures > 0
+            and time.time() - state.checked_at <= max_age
+        )
+
+
+def _lower_thread_priority() -> None:
+    """가능한 플랫폼(리눅스)에서 현재 스레드의 nice 값을 올린다. 그 밖에서는 아무것도 하지 않는다."""
+
+    if sys.platform.startswith("linux") and hasattr(os, "setpriority"):
+        try:
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 10)
+        except OSError:
+            pass
+
+
+def _triage_remote_hosts(
+    hosts: List[Dict[str, str]],
+    reachability: Optional[HostReachabilityCache],
+    host_timeout: float,
+) -> List[Tuple[Dict[str, str], float]]:
+    """캐시로 호스트를 빠른 순서로 정렬하고 호스트별 제한 시간을 정해 (호스트, 제한 시간) 목록을 돌려준다.
+
+    최근 응답이 없던 호스트는 짧게 다시 확인하고, 그래도 응답이 없으면 건너뛰지 않고
+    `REMOTE_SUSPECT_TIMEOUT`으로 줄인 제한 시간 안에서 종료를 시도한다.
+    검사 포트만 막는 방화벽이나 절전에서 깨어나는 중인 PC도 꺼질 수 있게 하기 위해서다.
+    """
+
+    if reachability is None or not hosts:
+        return [(host, host_timeout) for host in hosts]
+    ordered = reachability.order(hosts)
+    suspects = [host for host in ordered if reachability.probably_offline(host)]
+    shortened = set()
+    if suspects:
+        probes = probe_hosts([remote_probe_target(host) for host in suspects], timeout=REACHABILITY_RECHECK_TIMEOUT)
+        reachability.record(probes)
+        shortened = {id(host) for host, probe in zip(suspects, probes) if not probe.reachable}
+    short_timeout = min(host_timeout, REMOTE_SUSPECT_TIMEOUT)
+    return [(host, short_timeout if id(host) in shortened else host_timeout) for host in ordered]
+
+
+def _shutdown_remote_winrm(host: Dict[str, str], target: str, deadline: float) -> str:
+    command = _winrm_shutdown_command(host, target)
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=_remaining(deadline))
+    except subprocess.TimeoutExpired as exc:
+        raise TimeoutError("호스트별 제한 시간을 넘겼습니다.") from exc
+    if completed.returncode != 0:
+        detail = completed.stderr.strip() or completed.stdout.strip() or f"종료 코드 {completed.returncode}"
+        raise RuntimeError(detail)
+    return "원격 종료 명령 전송 (shutdown /m)"
+
+
+def _shutdown_remote_host(
+    host: Dict[str, str], timeout: float, pool: Optional[SSHSessionPool] = None
+) -> Tuple[str, bool, str]:
+    """호스트 하나에 종료 명령을 보내고 (대상, 성공 여부, 안내문)을 돌려준다."""
+
+    method = remote_method(host)
+    target = (host.get("host") or "").strip()
+    if not target:
+        return "", False, "대상 호스트가 비어 있습니다."
+    deadline = time.monotonic() + max(0.1, timeout)
+    try:
+        if method == "ssh":
+            return target, True, _shutdown_remote_ssh(host, target, deadline, pool)
+        if method == "winrm":
+            return target, True, _shutdown_remote_winrm(host, target, deadline)
+        raise ValueError(f"지원하지 않는 원격 종료 방식: {method}")
+    except Exception as exc:
+        return target, False, str(exc) or exc.__class__.__name__
+
+
+def _remote_result_notifier(
+    results: List[Tuple[str, bool, str]], result_callback: Optional[Callable[[str, bool, str], None]]
+) -> Callable[[str, bool, str], None]:
+    def notify(target: str, success: bool, message: str) -> None:
+        results.append((target, success, message))
+        if result_callback is not None:
+            try:
+                result_callback(target, success, message)
+            except Exception:
+                pass
+        else:
+            status = "성공" if success else "실패"
+            print(f"[원격 종료 {status}] {target or '알 수 없음'}: {message}")
+
+    return notify
+
+
+def shutdown_remote(
+    hosts: List[Dict[str, str]],
+    result_callback: Optional[Callable[[str, bool, str], None]] = None,
+    max_workers: int = REMOTE_SHUTDOWN_WORKERS,
+    host_timeout: float = REMOTE_HOST_TIMEOUT,
+    overall_timeout: Optional[float] = REMOTE_SHUTDOWN_TIMEOUT,
+    backend: str = "threads",
+    pool: Optional[SSHSessionPool] = None,
+    reachability: Optional[HostReachabilityCache] = None,
+) -> List[Tuple[str, bool, str]]:
+    """원격 PC들에 종료 명령을 동시에 보낸다.
+
+    최대 `max_workers`개의 작업자가 호스트마다 `host_timeout`초 안에서 연결과 명령을 마치고,
+    결과는 끝나는 순서대로 `result_callback(대상, 성공 여부, 안내문)`으로 알린다.
+    `overall_timeout`이 지나면 아직 끝나지 않은 호스트는 실패로 보고하고 기다리지 않는다.
+    `max_workers`가 1 이하이면 예전처럼 호출한 스레드에서 차례로 실행한다.
+    `backend="asyncio"`이면 `shutdown_remote_async`를 이벤트 루프 하나에서 돌리고,
+    이때 `max_workers`는 동시 실행 한도로 쓰인다.
+    `pool`을 주면 미리 열어 둔 SSH 세션부터 사용하고, 없거나 끊겼으면 새로 연결한다.
+    `reachability`를 주면 응답이 빠른 호스트부터 보내고, 최근 응답이 없던 호스트는
+    짧은 재확인에서도 응답이 없으면 줄인 제한 시간(`REMOTE_SUSPECT_TIMEOUT`) 안에서 시도한다.
+    """
+
+    if backend == "asyncio":
+        return asyncio.run(
+            shutdown_remote_async(
+                hosts,
+                result_callback,
+                concurrency=max_workers,
+                host_timeout=host_timeout,
+                overall_timeout=overall_timeout,
+                pool=pool,
+                reachability=reachability,
+            )
+        )
+    results: List[Tuple[str, bool, str]] = []
+    notify = _remote_result_notifier(results, result_callback)
+    plan = _triage_remote_hosts(hosts, reachability, host_timeout)
+    if not plan:
+        return results
+    started = time.monotonic()
+    if max_workers <= 1:
+        for host, timeout in plan:
+            if overall_timeout is not None:
+                timeout = min(timeout, overall_timeout - (time.monotonic() - started))
+                if timeout <= 0:
+                    notify((host.get("host") or "").strip(), False, "전체 제한 시간을 넘겨 실행하지 못했습니다.")
+                    continue
+            notify(*_shutdown_remote_host(host, timeout, pool))
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(plan)), thread_name_prefix="RemoteShutdown")
+    futures = {executor.submit(_shutdown_remote_host, host, timeout, pool): host for host, timeout in plan}
+    reported = set()
+    try:
+        for future in as_completed(futures, timeout=overall_timeout):
+            reported.add(future)
+            notify(*future.result())
+    except FuturesTimeout:
+        for future, host in futures.items():
+            if future in reported:
+                continue
+            if future.done() and not future.cancelled():
+                notify(*future.result())
+            else:
+                notify((host.get("host") or "").strip(), False, "전체 제한 시간 안에 끝나지 않았습니다.")
+    finally:
+        # 제한 시간을 넘긴 작업은 각자의 호스트 제한 시간 안에 정리되므로 기다리지 않는다.
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def _uses_pooled_session(host: Dict[str, str], pool: Optional[SSHSessionPool]) -> bool:
+    return pool is not None and pool.has_session(host)
+
+
+async def _shutdown_remote_ssh_async(
+    host: Dict[str, str],
+    target: str,
+    deadline: float,
+    executor: Optional[ThreadPoolExecutor] = None,
+    pool: Optional[SSHSessionPool] = None,
+) -> str:
+    asyncssh = load_asyncssh()
+    if asyncssh is None or _uses_pooled_session(host, pool):
+        # asyncssh가 없거나 이 호스트에 미리 연 paramiko 세션이 있을 때만 paramiko 경로를 스레드로 넘긴다.
+        # 동시 실행 수는 호출 측 세마포어가 제한한다.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, _shutdown_remote_ssh, host, target, deadline, pool)
+    host_name, port = split_host_port(target, 22)
+    connect_timeout = min(SSH_CONNECT_TIMEOUT, _remaining(deadline))
+    async with asyncssh.connect(
+        host_name,
+        port=port,
+        username=host.get("username") or None,
+        password=host.get("password") or None,
+        known_hosts=None,
+        client_keys=None,
+        agent_path=None,
+        connect_timeout=connect_timeout,
+    ) as conn:
+        errors: List[str] = []
+        for command in _collect_ssh_commands(host):
+            # 제한 시간을 다 쓰면 남은 명령은 시도하지 않는다(`_run_ssh_commands`와 같음).
+            remaining = _remaining(deadline)
+            try:
+                result = await asyncio.wait_for(conn.run(command, check=False), remaining)
+            except (asyncssh.Error, OSError, asyncio.TimeoutError) as ssh_exc:
+                # 명령 하나가 실패해도 다음 대체 명령을 시도한다.
+                errors.append(f"{command}: {str(ssh_exc) or ssh_exc.__class__.__name__}")
+                continue
+            if result.exit_status == 0:
+                return f"SSH 명령 전송: {command}"
+            detail = str(result.stderr or "").strip() or str(result.stdout or "").strip()
+            errors.append(f"{command}: {detail or f'종료 코드 {result.exit_status}'}")
+    raise RuntimeError("; ".join(errors) or "알 수 없는 이유로 종료 명령 실패")
+
+
+async def _shutdown_remote_winrm_async(host: Dict[str, str], target: str, deadline: float) -> str:
+    command = _winrm_shutdown_command(host, target)
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), _remaining(deadline))
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        process.kill()
+        # 자식 프로세스가 출력 파이프를 붙잡고 있으면 wait()가 끝나지 않으므로 오래 기다리지 않는다.
+        try:
+            await asyncio.wait_for(process.wait(), 1.0)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+        raise
+    if process.returncode != 0:
+        encoding = locale.getpreferredencoding(False)
+        detail = stderr.decode(encoding, errors="ignore").strip() or stdout.decode(encoding, errors="ignore").strip()
+        raise RuntimeError(detail or f"종료 코드 {process.returncode}")
+    return "원격 종료 명령 전송 (shutdown /m)"
+
+
+async def _shutdown_remote_host_async(
+    host: Dict[str, str],
+    timeout: float,
+    semaphore: asyncio.Semaphore,
+    executor: Optional[ThreadPoolExecutor] = None,
+    pool: Optional[SSHSessionPool] = None,
+) -> Tuple[str, bool, str]:
+    method = remote_method(host)
+    target = (host.get("host") or "").strip()
+    if not target:
+        return "", False, "대상 호스트가 비어 있습니다."
+    async with semaphore:
+        deadline = time.monotonic() + max(0.1, timeout)
+        try:
+            if method == "ssh":
+                message = await asyncio.wait_for(_shutdown_remote_ssh_async(host, target, deadline, executor, pool), timeout)
+            elif method == "winrm":
+                message = await asyncio.wait_for(_shutdown_remote_winrm_async(host, target, deadline), timeout)
+            else:
+                raise ValueError(f"지원하지 않는 원격 종료 방식: {method}")
+        except asyncio.TimeoutError:
+            return target, False, "호스트별 제한 시간을 넘겼습니다."
+        except Exception as exc:
+            return target, False, str(exc) or exc.__class__.__name__
+    return target, True, message
+
+
+async def shutdown_remote_async(
+    hosts: List[Dict[str, str]],
+    result_callback: Optional[Callable[[str, bool, str], None]] = None,
+    concurrency: int = REMOTE_SHUTDOWN_WORKERS,
+    host_timeout: float = REMOTE_HOST_TIMEOUT,
+    overall_timeout: Optional[float] = REMOTE_SHUTDOWN_TIMEOUT,
+    pool: Optional[SSHSessionPool] = None,
+    reachability: Optional[HostReachabilityCache] = None,
+) -> List[Tuple[str, bool, str]]:
+    """`shutdown_remote`의 asyncio 버전. 호스트 수가 많아도 스레드를 호스트마다 만들지 않는다.
+
+    동시에 진행하는 호스트는 `concurrency`개로 제한하고, `overall_timeout`이 지나면
+    남은 작업을 취소한 뒤 실패로 보고한다. 호스트 사전 형식과 `result_callback` 규약은 같다.
+    """
+
+    results: List[Tuple[str, bool, str]] = []
+    notify = _remote_result_notifier(results, result_callback)
+    plan = _triage_remote_hosts(hosts, reachability, host_timeout)
+    if not plan:
+        return results
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    executor: Optional[ThreadPoolExecutor] = None
+    # 스레드는 paramiko로 보내는 SSH 호스트(asyncssh가 없거나 미리 연 세션이 있는 호스트) 수만큼만 쓴다.
+    threaded = [
+        host
+        for host, _ in plan
+        if remote_method(host) == "ssh" and (load_asyncssh() is None or _uses_pooled_session(host, pool))
+    ]
+    if threaded:
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(concurrency, len(threaded))), thread_name_prefix="RemoteShutdownSSH"
+        )
+    tasks = {
+        asyncio.ensure_future(_shutdown_remote_host_async(host, timeout, semaphore, executor, pool)): host
+        for host, timeout in plan
+    }
+    pending = set(tasks)
+    end = None if overall_timeout is None else loop.time() + overall_timeout
+    while pending:
+        timeout = None if end is None else end - loop.time()
+        if timeout is not None and timeout <= 0:
+            break
+        done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            notify(*task.result())
+    for task in pending:
+        task.cancel()
+        notify((tasks[task].get("host") or "").strip(), False, "전체 제한 시간 안에 끝나지 않았습니다.")
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+def shutdown_local(delay: int) -> None:
+    if sys.platform.startswith("win"):
+        os.system(f"shutdown /s /t {max(0, delay)}")
+    else:  # linux/mac
+        time.sleep(max(0, delay))
+        os.system("shutdown -h now")
+
+
+@dataclass
+class TriggerPipeline:
+    """예약 실행 한 회차의 단계 진행 상태와 소요 시간.
+
+    프로그램 종료(작업 스레드)와 음성 재생은 동시에 진행하고,
+    둘 다 끝나야 원격/본체 종료 후속 단계를 실행한다.
+    """
+
+    day_key: str
+    started: float = field(default_factory=time.perf_counter)
+    timings: Dict[str, float] = field(default_factory=dict)
+    termination_done: bool = False
+    playback_done: bool = False
+    follow_up: Optional[Tuple[bool, bool]] = None
+    dispatched: bool = False
+    remote_started: bool = False
+    remote_armed: bool = False
+
+    def mark(self, stage: str, elapsed: Optional[float] = None) -> None:
+        self.timings[stage] = time.perf_counter() - self.started if elapsed is None else elapsed
+
+    @property
+    def ready(self) -> bool:
+        return self.termination_done and self.playback_done and not self.dispatched
+
+    def summary(self) -> str:
+        return " · ".join(f"{stage} {seconds:.2f}초" for stage, seconds in self.timings.items())
+
+
+class AudioBackend(QtCore.QObject):
+    """`ScheduleRunner`가 쓰는 음성 재생기의 공통 부분(신호, 길이 기록, 로컬 캐시 연결).
+
+    재생이 끝나거나 `stop()`으로 멈추면 `playback_finished`를, 실패하면 `playback_error` 뒤에
+    `playback_finished`를 보낸다. 길이를 알게 되면 `duration_known`을 보낸다.
+    이 클래스 자체는 아무것도 재생하지 않는 재생기로 동작하며, `CommandAudioService`와
+    GUI의 `AudioService`가 `play`/`stop`/`is_active`를 다시 정의한다.
+    """
+
+    playback_started = Signal(str)
+    playback_finished = Signal(str)
+    playback_error = Signal(str, str)
+    duration_known = Signal(str, float)  # path, seconds
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._current: Optional[str] = None
+        self._durations: Dict[str, float] = {}
+        self.cache: Optional[AudioCache] = None
+        self._volume: float = 0.9
+
+    def set_volume(self, value: float) -> None:
+        try:
+            volume = float(value)
+        except (TypeError, ValueError):
+            volume = 0.9
+        self._volume = max(0.0, min(1.0, volume))
+        self._apply_volume()
+
+    def _apply_volume(self) -> None:
+        pass
+
+    def preload(self) -> None:
+        """재생에 필요한 라이브러리를 미리 불러 둔다. 첫 재생 때 불러오는 재생기만 구현한다."""
+
+    def play(self, path: str) -> None:
+        """재생기를 붙이지 않은 기본 동작: 재생할 수 없다고 알리고 바로 끝낸다.
+
+        실행 회차가 재생 끝을 기다리다 멈추지 않도록 `playback_finished`는 항상 보낸다.
+        """
+
+        self._current = None
+        if path:
+            self.playback_error.emit(path, "음성 재생기가 설정되지 않았습니다.")
+        self.playback_finished.emit(path or "")
+
+    def stop(self) -> None:
+        """멈출 재생이 없다. 재생기는 진행 중인 재생을 멈추고 `playback_finished`를 보낸다."""
+
+    def is_active(self) -> bool:
+        """재생 중이거나 재생을 준비 중이면 True."""
+
+        return False
+
+    def is_playing(self) -> bool:
+        return self.is_active()
+
+    def position_seconds(self) -> float:
+        return 0.0
+
+    @staticmethod
+    def _duration_key(path: str) -> str:
+        try:
+            normalized = Path(path).expanduser().resolve(strict=False)
+        except Exception:
+            normalized = Path(path).expanduser().absolute()
+        return os.path.normcase(str(normalized))
+
+    def duration_for(self, path: str) -> Optional[float]:
+        """재생했거나 미리 확인한 적이 있는 파일의 길이(초). 모르면 None."""
+
+        return self._durations.get(self._duration_key(path)) if path else None
+
+    def remember_duration(self, path: str, seconds: float) -> None:
+        if path and seconds > 0:
+            self._durations[self._duration_key(path)] = seconds
+
+    def set_cache(self, cache: Optional[AudioCache]) -> None:
+        self.cache = cache
+
+    def _source_path(self, path: str) -> Tuple[Path, Optional[str]]:
+        """재생할 파일과 정규화한 원본 경로. 로컬 캐시에 사본이 있으면 사본을 재생한다.
+
+        원본도 사본도 없으면 정규화 경로 대신 None을 돌려준다.
+        """
+
+        file_path = Path(path).expanduser()
+        # 로컬 캐시에 최신 사본이 있으면 네트워크 드라이브의 원본은 열지 않고 사본을 재생한다.
+        local = self.cache.lookup(path) if self.cache is not None else None
+        play_path = Path(local) if local else file_path
+        if play_path is file_path and not file_path.exists():
+            return file_path, None
+        try:
+            normalized = file_path.resolve(strict=False)
+        except Exception:
+            normalized = file_path.absolute()
+        return play_path, str(normalized)
+
+    def current_source(self) -> Optional[str]:
+        return self._current if self.is_active() else None
+
+    def is_playing_source(self, path: Optional[str]) -> bool:
+        if not self.is_playing():
+            return False
+        if not path or not self._current:
+            return False
+        candidate = Path(path).expanduser()
+        try:
+            candidate_norm = candidate.resolve(strict=False)
+        except Exception:
+            candidate_norm = candidate.absolute()
+        try:
+            current_norm = Path(self._current).resolve(strict=False)
+        except Exception:
+            current_norm = Path(self._current).absolute()
+        return os.path.normcase(str(current_norm)) == os.path.normcase(str(candidate_norm))
+
+
+# 화면 없는 모드의 재생 명령. Windows는 PowerShell로 PresentationCore MediaPlayer를 쓰고,
+# 그 밖에는 아래 순서로 처음 찾은 재생기를 쓴다({percent}: 0~100, {volume}: 0~1, {pulse}: 0~65536).
+HEADLESS_AUDIO_PLAYERS = (
+    ("ffplay", ("-nodisp", "-autoexit", "-loglevel", "error", "-volume", "{percent}")),
+    ("afplay", ("-v", "{volume}")),
+    ("paplay", ("--volume={pulse}",)),
+    ("aplay", ("-q",)),
+)
+_POWERSHELL_PLAYER = """
+Add-Type -AssemblyName PresentationCore
+$player = New-Object System.Windows.Media.MediaPlayer
+$player.Volume = {volume}
+$player.Open([Uri]'{path}')
+$deadline = (Get-Date).AddSeconds(10)
+while (-not $player.NaturalDuration.HasTimeSpan -and (Get-Date) -lt $deadline) {{ Start-Sleep -Milliseconds 50 }}
+if (-not $player.NaturalDuration.HasTimeSpan) {{ exit 2 }}
+$seconds = $player.NaturalDuration.TimeSpan.TotalSeconds
+[Console]::Out.WriteLine('DURATION ' + $seconds.ToString([Globalization.CultureInfo]::InvariantCulture))
+$player.Play()
+Start-Sleep -Milliseconds ([int]($seconds * 1000) + 300)
+$player.Close()
+"""
+
+
+def playback_command(path: Path, volume: float) -> Optional[List[str]]:
+    """화면 없는 모드에서 음성 파일을 재생할 명령. 쓸 수 있는 재생기가 없으면 None."""
+
+    if sys.platform.startswith("win"):
+        script = _POWERSHELL_PLAYER.format(path=str(path).replace("'", "''"), volume=f"{volume:.2f}")
+        return ["powershell", "-NoProfile", "-NonInteractive", "-Command", script]
+    values = {"percent": int(volume * 100), "volume": f"{volume:.2f}", "pulse": int(volume * 65536)}
+    for name, args in HEADLESS_AUDIO_PLAYERS:
+        executable = shutil.which(name)
+        if executable:
+            return [executable, *(arg.format(**values) for arg in args), str(path)]
+    return None
+
+
+class CommandAudioService(AudioBackend):
+    """Qt Multimedia 없이 운영체제의 재생 명령(`playback_command`)으로 음성을 재생한다.
+
+    재생기 프로세스가 끝나기를 작업 스레드에서 기다렸다가 신호로 알린다.
+    재생기가 `DURATION <초>` 줄을 출력하면 길이도 함께 알린다.
+    """
+
+    _duration_read = Signal(object, float)  # process, seconds
+    _exited = Signal(object, int, str)  # process, return code, stderr
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._process: Optional[subprocess.Popen] = None
+        self._started_at = 0.0
+        self._duration_read.connect(self._on_duration_read)
+        self._exited.connect(self._on_exited)
+
+    def play(self, path: str) -> None:
+        if not path:
+            self._current = None
+            self._terminate()
+            self.playback_finished.emit("")
+            return
+        play_path, source = self._source_path(path)
+        command = playback_command(play_path, self._volume) if source else None
+        process = None
+        error = ""
+        if source is None:
+            error = "파일을 찾을 수 없습니다. 경로를 다시 확인하세요."
+        elif command is None:
+            error = "음성 재생 명령(ffplay, afplay, paplay, aplay)을 찾을 수 없습니다."
+        else:
+            self._current = None
+            self._terminate()
+            try:
+                process = subprocess.Popen(
+                    command,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    errors="replace",
+                    creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+                )
+            except OSError as exc:
+                error = f"재생 명령을 실행할 수 없습니다: {exc}"
+        if process is None:
+            resolved = source or str(play_path)
+            self._current = None
+            self._terminate()
+            self.playback_error.emit(resolved, error)
+            self.playback_finished.emit(resolved)
+            return
+        self._process = process
+        self._current = source
+        self._started_at = time.monotonic()
+        threading.Thread(target=self._watch, args=(process,), name="AudioCommand", daemon=True).start()
+        self.playback_started.emit(source)
+
+    def stop(self) -> None:
+        # QMediaPlayer.stop()처럼 멈춘 재생의 종료를 바로 알린다. 끝낸 재생기의 종료 신호는 무시된다.
+        if self._process is None:
+            return
+        path = self._current or ""
+        self._current = None
+        self._terminate()
+        self.playback_finished.emit(path)
+
+    def _terminate(self) -> None:
+        """재생기를 끝내고 잊는다. 그 프로세스의 종료는 `_on_exited`에서 알리지 않는다."""
+
+        process = self._process
+        self._process = None
+        if process is not None and process.poll() is None:
+            process.terminate()
+
+    def is_active(self) -> bool:
+        return self._process is not None
+
+    def position_seconds(self) -> float:
+        return time.monotonic() - self._started_at if self._process is not None else 0.0
+
+    def _watch(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            if line.startswith("DURATION "):
+                try:
+                    self._duration_read.emit(process, float(line.split()[1]))
+                except (IndexError, ValueError):
+                    pass
+        stderr = process.stderr.read().strip()
+        try:
+            self._exited.emit(process, process.wait(), stderr.splitlines()[-1] if stderr else "")
+        except RuntimeError:
+            # 앱 종료 중 Qt 객체가 먼저 정리된 경우
+            return
+
+    def _on_duration_read(self, process: subprocess.Popen, seconds: float) -> None:
+        if process is self._process and self._current:
+            self.remember_duration(self._current, seconds)
+            self.duration_known.emit(self._current, seconds)
+
+    def _on_exited(self, process: subprocess.Popen, code: int, stderr: str) -> None:
+        if process is not self._process:
+            return
+        path = self._current or ""
+        self._process = None
+        self._current = None
+        if code != 0:
+            detail = "지원하지 않는 형식이거나 재생할 수 없는 파일입니다."
+            self.playback_error.emit(path, f"{detail} ({stderr})" if stderr else detail)
+        self.playback_finished.emit(path)
+
+
+# 시작 후 이 시간(초)이 지나 한가해지면 처음 쓸 때 불러오는 재생기·SSH 모듈을 미리 불러 둔다.
+IDLE_PRELOAD_DELAY = 20.0
+
+
+class ScheduleRunner(QtCore.QObject):
+    """예약 실행 한 회차(프로그램 종료 → 음성 재생 → 원격/본체 종료)를 진행한다.
+
+    스케줄러·프로세스 색인·원격 상태 캐시·음성 캐시·SSH 세션 풀을 가지고, 음성은 넘겨받은
+    `AudioBackend`로 재생한다. 창은 아래 신호를 받아 표시만 하는 앞단이므로 없어도 동작한다.
+    """
+
+    stage_message = Signal(str)
+    stage_cleared = Signal()
+    notice = Signal(str, str, int)  # 안내문, 수준("info"/"warning"), 표시 시간(ms)
+    mode_changed = Signal(str)  # "idle" / "schedule" / "preview"
+    termination_finished = Signal(object, object)  # TriggerPipeline, TerminationReport
+
+    def __init__(
+        self,
+        cfg_mgr: ConfigManager,
+        audio: AudioBackend,
+        preflight=None,
+        parent=None,
+        clock: Optional[Callable[[], datetime]] = None,
+    ) -> None:
+        """`clock`은 스케줄러와 실행 전 타이머가 함께 쓰는 현재 시각 공급자(시험용 주입)."""
+
+        super().__init__(parent)
+        self.cfg_mgr = cfg_mgr
+        cfg = cfg_mgr.config
+        self.scheduler = SchedulerEngine(cfg_mgr, clock=clock)
+        self.audio_service = audio
+        self.audio_service.set_volume(cfg.audio_volume)
+        self.audio_cache = AudioCache(
+            cfg_mgr.storage_directory() / "audio_cache",
+            self._audio_sources,
+            cfg.audio_cache_mb * 1024 * 1024,
+        )
+        self.audio_service.set_cache(self.audio_cache)
+        self.ssh_pool = SSHSessionPool(cfg.remote_concurrency)
+        self.reachability = HostReachabilityCache(
+            lambda: self.cfg_mgr.config.remote_hosts, cfg.remote_probe_interval
+        )
+        self.process_index = ProcessIndex(lambda: self.cfg_mgr.config.targets)
+        # 디코딩까지 확인하는 사전 점검기(GUI의 `AudioPreflight`). 없으면 사전 점검을 건너뛴다.
+        self.audio_preflight = preflight
+        self._prewarm_timer = QtCore.QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.timeout.connect(self._prewarm_remote_sessions)
+        self._remote_lead_timer = QtCore.QTimer(self)
+        self._remote_lead_timer.setSingleShot(True)
+        self._remote_lead_timer.timeout.connect(self._dispatch_remote_early)
+        self._preflight_timer = QtCore.QTimer(self)
+        self._preflight_timer.setSingleShot(True)
+        self._preflight_timer.timeout.connect(self._run_audio_preflight)
+        self._preload_timer = QtCore.QTimer(self)
+        self._preload_timer.setSingleShot(True)
+        self._preload_timer.setInterval(int(IDLE_PRELOAD_DELAY * 1000))
+        self._preload_timer.timeout.connect(self._preload_deferred)
+        self._preflight_run: Optional[UpcomingRun] = None
+        self._preflight_marker: Optional[Tuple[datetime, str]] = None
+        self._pending_follow_up: Optional[Tuple[bool, bool]] = None
+        self._pipeline: Optional[TriggerPipeline] = None
+        self._playback_mode: str = "idle"
+        self._active_day_key: Optional[str] = None
+        self._ignore_playback_finished = False
+        self._connect_signals()
+
+    @property
+    def playback_mode(self) -> str:
+        return self._playback_mode
+
+    @property
+    def active_day_key(self) -> Optional[str]:
+        return self._active_day_key
+
+    def _set_mode(self, mode: str) -> None:
+        if mode != self._playback_mode:
+            self._playback_mode = mode
+            self.mode_changed.emit(mode)
+
+    def _connect_signals(self) -> None:
+        self.scheduler.schedule_triggered.connect(self.trigger)
+        self.scheduler.next_run_changed.connect(self._on_next_run_changed)
+        self.audio_service.playback_started.connect(self._on_playback_started)
+        self.audio_service.playback_finished.connect(self._on_playback_finished)
+        self.audio_service.playback_error.connect(self._on_playback_error)
+        self.audio_service.duration_known.connect(self._on_duration_known)
+        self.termination_finished.connect(self._on_termination_finished)
+        if self.audio_preflight is not None:
+            self.audio_preflight.finished.connect(self._on_audio_preflight_finished)
+        subscribe = self.cfg_mgr.subscribe
+        subscribe({"audio_volume"}, lambda cfg: self.audio_service.set_volume(cfg.audio_volume))
+        subscribe({"remote_probe_interval"}, lambda cfg: self.reachability.set_interval(cfg.remote_probe_interval))
+        subscribe({"remote_hosts"}, lambda _: self.reachability.refresh_now())
+        subscribe({"targets"}, lambda _: self.process_index.refresh_now())
+        subscribe({"playlist", "days"}, lambda _: self.audio_cache.sync_now())
+        subscribe({"audio_cache_mb"}, lambda cfg: self.audio_cache.set_max_bytes(cfg.audio_cache_mb * 1024 * 1024))
+        self.cfg_mgr.storage_dir_changed.connect(
+            lambda path: self.audio_cache.set_directory(Path(path) / "audio_cache")
+        )
+
+    def start(self) -> None:
+        self.scheduler.start()
+        self.reachability.start()
+        self.process_index.start()
+        self.audio_cache.start()
+        self._preload_timer.start()
+
+    def stop(self) -> None:
+        self._preload_timer.stop()
+        self._prewarm_timer.stop()
+        self._remote_lead_timer.stop()
+        self._preflight_timer.stop()
+        self.scheduler.stop()
+        self.audio_service.stop()
+        self.ssh_pool.close_all()
+        self.reachability.stop()
+        self.process_index.stop()
+        self.audio_cache.stop()
+
+    def _preload_deferred(self) -> None:
+        """시작이 끝나고 한가할 때 음성 재생기와 (원격 종료를 쓰면) SSH 모듈을 미리 불러 둔다."""
+
+        self.audio_service.preload()
+        cfg = self.cfg_mgr.config
+        if cfg.enable_remote_shutdown and any(SSHSessionPool.key_for(host) for host in cfg.remote_hosts):
+            loaders = [load_paramiko]
+            if cfg.remote_backend == "asyncio":
+                loaders.append(load_asyncssh)
+            threading.Thread(
+                target=lambda: [load() for load in loaders], name="PreloadSSH", daemon=True
+            ).start()
+
+    def status(self) -> Dict[str, object]:
+        """제어 채널 `status` 응답: 실행 상태, 다음 실행, 실행 중인 대상 프로그램."""
+
+        pipeline = self._pipeline
+        return {
+            "pid": os.getpid(),
+            "version": APP_VERSION,
+            "mode": self._playback_mode,
+            "active_day": self._active_day_key,
+            "stages": pipeline.summary() if pipeline is not None else "",
+            "next_run": self.next_run_info(),
+            "running_targets": {name: len(pids) for name, pids in self.process_index.running().items()},
+            "config_file": str(self.cfg_mgr.locator.config_file),
+            "revision": self.cfg_mgr.revision,
+        }
+
+    def next_run_info(self) -> Optional[Dict[str, object]]:
+        run = self.scheduler.next_run()
+        if run is None:
+            return None
+        return {
+            "when": run.when.isoformat(timespec="minutes"),
+            "day": run.day_key,
+            "label": DAY_LABEL[run.day_key],
+            "slot": run.slot,
+            "audio": run.audio_path,
+            "auto_assign": run.auto_assign,
+            "remote": run.remote_allowed,
+            "local": run.local_allowed,
+        }
+
+    def _on_next_run_changed(self, run: Optional[UpcomingRun]) -> None:
+        self._schedule_prewarm(run)
+        self._schedule_audio_preflight(run)
+
+    def _schedule_prewarm(self, run: Optional[UpcomingRun]) -> None:
+        """다음 실행 `remote_prewarm_seconds`초 전에 SSH 세션을 미리 열도록 타이머를 맞춘다."""
+
+        cfg = self.cfg_mgr.config
+        lead = cfg.remote_prewarm_seconds
+        if run is None or lead <= 0 or not run.remote_allowed or not optional_module_available("paramiko"):
+            self._prewarm_timer.stop()
+            return
+        seconds = (run.when - timedelta(seconds=lead) - self.scheduler.now()).total_seconds()
+        if seconds <= 0:
+            self._prewarm_timer.stop()
+            self._prewarm_remote_sessions()
+            return
+        # 먼 미래라도 스케줄러가 주기적으로 다음 실행을 다시 알리므로 하루 단위로 끊어 맞춘다.
+        self._prewarm_timer.start(int(min(seconds, 86400) * 1000))
+
+    def _audio_sources(self) -> List[str]:
+        """음성 캐시에 유지할 원본 목록(플레이리스트와 요일별 지정 음성)."""
+
+        cfg = self.cfg_mgr.config
+        sources = list(cfg.playlist)
+        sources.extend(day.audio_path for day in cfg.days.values() if day.audio_path)
+        return sources
+
+    def _schedule_audio_preflight(self, run: Optional[UpcomingRun]) -> None:
+        """다음 실행 `audio_preflight_seconds`초 전에 음성 파일 사전 점검을 예약한다. 회차마다 한 번만 실행한다."""
+
+        lead = self.cfg_mgr.config.audio_preflight_seconds
+        if self.audio_preflight is None or run is None or lead <= 0 or not run.audio_path:
+            self._preflight_timer.stop()
+            self._preflight_run = None
+            return
+        if self._preflight_marker == (run.when, run.audio_path):
+            return
+        self._preflight_run = run
+        seconds = (run.when - timedelta(seconds=lead) - self.scheduler.now()).total_seconds()
+        if seconds <= 0:
+            self._preflight_timer.stop()
+            self._run_audio_preflight()
+            return
+        self._preflight_timer.start(int(min(seconds, 86400) * 1000))
+
+    def _run_audio_preflight(self) -> None:
+        run = self._preflight_run
+        if run is None or not run.audio_path or self.audio_preflight is None or self.audio_preflight.busy():
+            return
+        if run.when - self.scheduler.now() > timedelta(seconds=self.cfg_mgr.config.audio_preflight_seconds + 1):
+            # 하루 단위로 끊어 맞춘 타이머가 먼저 깬 경우 남은 시간만큼 다시 기다린다.
+            self._schedule_audio_preflight(run)
+            return
+        self._preflight_marker = (run.when, run.audio_path)
+        cache = self.audio_cache if self.cfg_mgr.config.audio_preflight_copy else None
+        self.audio_preflight.check(run.audio_path, cache)
+
+    def _on_audio_preflight_finished(
+        self, path: str, success: bool, message: str, duration: float, local_path: str
+    ) -> None:
+        name = Path(path).name
+        if success:
+            self.audio_service.remember_duration(path, duration)
+            where = " · 로컬 사본 사용" if local_path else ""
+            print(f"[음성 사전 점검] {name}: {message} ({duration:.1f}초{where})")
+            return
+        self.append_shutdown_log("음성 사전 점검", f"{name}: {message}")
+        self.notice.emit(f"예약된 음성 파일에 문제가 있습니다: {name}\n{message}", "warning", 6000)
+
+    def _prewarm_remote_sessions(self) -> None:
+        cfg = self.cfg_mgr.config
+        if cfg.enable_remote_shutdown:
+            self.ssh_pool.prewarm(cfg.remote_hosts)
+
+    def _run_remote_shutdown(self, cfg: SchedulerConfig) -> None:
+        try:
+            shutdown_remote(
+                cfg.remote_hosts,
+                max_workers=cfg.remote_concurrency,
+                backend=cfg.remote_backend,
+                pool=self.ssh_pool,
+                reachability=self.reachability,
+            )
+        finally:
+            self.ssh_pool.close_all()
+
+    def append_shutdown_log(self, kind: str, detail: str) -> None:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+        def updater(cfg: SchedulerConfig) -> None:
+            entry = {"at": timestamp, "type": kind, "detail": detail}
+            cfg.shutdown_logs.insert(0, entry)
+            del cfg.shutdown_logs[30:]
+
+        self.cfg_mgr.update(updater, sections=("shutdown_logs",))
+
+    def trigger(self, day_key: str, audio_path: str, allow_remote: bool, allow_local: bool) -> None:
+        if (
+            self._playback_mode == "schedule"
+            and self._active_day_key == day_key
+            and self.audio_service.is_playing_source(audio_path)
+        ):
+            prev_remote, prev_local = self._pending_follow_up or (False, False)
+            self._pending_follow_up = (prev_remote or allow_remote, prev_local or allow_local)
+            return
+        if self.audio_service.is_active():
+            if self._playback_mode == "schedule":
+                self._pending_follow_up = None
+            if self._playback_mode != "idle":
+                self._ignore_playback_finished = True
+            self.stage_cleared.emit()
+            self.audio_service.stop()
+        self._active_day_key = day_key
+        self._pending_follow_up = (allow_remote, allow_local)
+        self._set_mode("schedule")
+        if allow_remote:
+            # 예약 전에 열지 못한 세션(수동 실행 등)도 음성이 나오는 동안 연결해 둔다.
+            self._prewarm_remote_sessions()
+        day_label = DAY_LABEL[day_key]
+        # 이전 회차의 파이프라인은 버리고, 프로그램 종료는 작업 스레드로 보낸 뒤 곧바로 음성을 재생한다.
+        self._remote_lead_timer.stop()
+        self._pipeline = TriggerPipeline(day_key)
+        self._start_termination(self._pipeline, self.cfg_mgr.config)
+        if audio_path:
+            self.stage_message.emit(f"{day_label} 일정 실행 준비 - {Path(audio_path).name}")
+        else:
+            self.stage_message.emit(f"{day_label} 일정 실행 준비")
+        self.notice.emit(f"{day_label} 일정이 시작되었습니다.", "info", 3000)
+        self.audio_service.play(audio_path)
+
+    def force_run(self) -> None:
+        """오늘 요일 설정으로 예약 실행을 즉시 시작한다."""
+
+        now_key = DAY_KEYS[self.scheduler.now().weekday()]
+        cfg = self.cfg_mgr.config
+        day_cfg = cfg.days[now_key]
+        audio = self.scheduler._resolve_audio(cfg, day_cfg) or ""
+        allow_remote = cfg.enable_remote_shutdown and day_cfg.allow_remote
+        allow_local = cfg.enable_local_shutdown and day_cfg.allow_local_shutdown
+        self.trigger(now_key, audio, allow_remote, allow_local)
+
+    def preview(self, path: str) -> bool:
+        """미리 듣기를 시작한다. 예약 실행 중이면 시작하지 않고 False를 돌려준다."""
+
+        if self._playback_mode == "schedule":
+            return False
+        if self.audio_service.is_active():
+            self._ignore_playback_finished = True
+            self.audio_service.stop()
+        self._pending_follow_up = None
+        self._active_day_key = None
+        self.stage_cleared.emit()
+        self._set_mode("preview")
+        self.audio_service.play(path)
+        self.notice.emit(f"미리 듣기: {Path(path).name}", "info", 3000)
+        return True
+
+    def stop_preview(self) -> bool:
+        if self._playback_mode != "preview":
+            return False
+        self.audio_service.stop()
+        return True
+
+    def _start_termination(self, pipeline: TriggerPipeline, cfg: SchedulerConfig) -> None:
+        def worker() -> None:
+            try:
+                report = terminate_programs(
+                    cfg.targets, cfg.terminate_timeout, cfg.terminate_children, index=self.process_index
+                )
+            except Exception as exc:  # pragma: no cover - psutil 예외 보호
+                print(f"[프로그램 종료 실패] {exc}")
+                report = TerminationReport(elapsed=time.perf_counter() - pipeline.started)
+            self.termination_finished.emit(pipeline, report)
+
+        threading.Thread(target=worker, name="TerminatePrograms", daemon=True).start()
+
+    def _on_termination_finished(self, pipeline: TriggerPipeline, report: TerminationReport) -> None:
+        if report.outcomes:
+            self.append_shutdown_log("프로그램 종료", report.summary())
+        pipeline.mark("프로그램 종료", report.elapsed)
+        pipeline.termination_done = True
+        self._advance_pipeline(pipeline)
+
+    def _advance_pipeline(self, pipeline: TriggerPipeline) -> None:
+        """프로그램 종료와 음성 재생이 모두 끝났으면 후속 종료 단계를 실행한다."""
+
+        if pipeline is not self._pipeline or not pipeline.ready:
+            if pipeline is self._pipeline and pipeline.playback_done and not pipeline.termination_done:
+                self.stage_message.emit("프로그램 종료 확인 중…")
+            return
+        pipeline.dispatched = True
+        pipeline.mark("후속 단계 시작")
+        self._pipeline = None
+        self._remote_lead_timer.stop()
+        self.stage_cleared.emit()
+        allow_remote, allow_local = pipeline.follow_up or (False, False)
+        self._run_follow_up(allow_remote and not pipeline.remote_started, allow_local)
+        timings = pipeline.summary()
+        print(f"[일정 실행 단계] {timings}")
+        self.append_shutdown_log("실행 단계", timings)
+
+    def _resolve_follow_up(self) -> Tuple[bool, bool]:
+        """예약 때 정한 후속 단계를 지금 설정(전체·요일별 허용 여부)으로 다시 확인한다."""
+
+        allow_remote, allow_local = self._pending_follow_up or (False, False)
+        cfg_snapshot = self.cfg_mgr.config
+        if self._active_day_key:
+            day_cfg = cfg_snapshot.days.get(self._active_day_key)
+        else:
+            day_cfg = None
+        if day_cfg is not None:
+            allow_remote = allow_remote and cfg_snapshot.enable_remote_shutdown and day_cfg.allow_remote
+            allow_local = allow_local and cfg_snapshot.enable_local_shutdown and day_cfg.allow_local_shutdown
+        else:
+            allow_remote = allow_remote and cfg_snapshot.enable_remote_shutdown
+            allow_local = allow_local and cfg_snapshot.enable_local_shutdown
+        return allow_remote, allow_local
+
+    def _start_remote_shutdown(self, cfg_snapshot: SchedulerConfig) -> None:
+        hosts = [host.get("host", "") for host in cfg_snapshot.remote_hosts if host.get("host")]
+        detail = ", ".join(hosts) if hosts else "등록된 대상 없음"
+        self.append_shutdown_log("원격 종료", detail)
+        threading.Thread(target=self._run_remote_shutdown, args=(cfg_snapshot,), daemon=True).start()
+
+    def _arm_remote_lead(self, pipeline: TriggerPipeline, duration: float) -> None:
+        """음성이 끝나기 `remote_lead_seconds`초 전에 원격 종료를 보내도록 타이머를 맞춘다."""
+
+        lead = self.cfg_mgr.config.remote_lead_seconds
+        if pipeline is not self._pipeline or pipeline.remote_armed or lead <= 0 or duration <= 0:
+            return
+        if not self._resolve_follow_up()[0]:
+            return
+        pipeline.remote_armed = True
+        remaining = duration - self.audio_service.position_seconds() - lead
+        self._remote_lead_timer.start(int(max(0.0, remaining) * 1000))
+
+    def _on_duration_known(self, path: str, seconds: float) -> None:
+        if self._playback_mode == "schedule" and self._pipeline is not None:
+            self._arm_remote_lead(self._pipeline, seconds)
+
+    def _dispatch_remote_early(self) -> None:
+        pipeline = self._pipeline
+        if pipeline is None or pipeline.dispatched or pipeline.remote_started or self._playback_mode != "schedule":
+            return
+        if not self._resolve_follow_up()[0]:
+            return
+        pipeline.remote_started = True
+        pipeline.mark("원격 종료 시작")
+        self._start_remote_shutdown(self.cfg_mgr.config)
+
+    def _run_follow_up(self, allow_remote: bool, allow_local: bool) -> None:
+        cfg_snapshot = self.cfg_mgr.config
+        if allow_remote:
+            self._start_remote_shutdown(cfg_snapshot)
+        if allow_local:
+            self.append_shutdown_log(
+                "본체 종료",
+                f"{cfg_snapshot.shutdown_delay}초 후 종료",
+            )
+            self.cfg_mgr.flush()
+            threading.Thread(target=shutdown_local, args=(cfg_snapshot.shutdown_delay,), daemon=True).start()
+        self.notice.emit("일정 실행이 완료되었습니다.", "info", 3000)
+        self.scheduler._compute_next_run()
+
+    def _on_playback_started(self, path: str) -> None:
+        if self._playback_mode != "schedule":
+            return
+        if self._pipeline is not None:
+            self._pipeline.mark("재생 시작")
+            duration = self.audio_service.duration_for(path)
+            if duration:
+                self._arm_remote_lead(self._pipeline, duration)
+        day_label = DAY_LABEL.get(self._active_day_key or "", "일정")
+        name = Path(path).name if path else "음성 없음"
+        self.stage_message.emit(f"{day_label} - {name} 재생 중")
+
+    def _on_playback_error(self, path: str, message: str) -> None:
+        detail = message or "음성 재생 중 오류가 발생했습니다."
+        self.notice.emit(f"재생 오류: {detail}", "warning", 4000)
+        if self._playback_mode == "schedule":
+            day_label = DAY_LABEL.get(self._active_day_key or "", "일정")
+            self.stage_message.emit(f"{day_label} - 음성 재생 실패, 다음 단계 진행")
+
+    def _on_playback_finished(self, _: str) -> None:
+        if self._ignore_playback_finished:
+            self._ignore_playback_finished = False
+            return
+        if self._playback_mode == "schedule":
+            allow_remote, allow_local = self._resolve_follow_up()
+            self._pending_follow_up = None
+            pipeline = self._pipeline
+            if pipeline is not None:
+                pipeline.mark("음성 재생")
+                pipeline.follow_up = (allow_remote, allow_local)
+                pipeline.playback_done = True
+                self._advance_pipeline(pipeline)
+        elif self._playback_mode == "preview":
+            self.notice.emit("미리 듣기가 종료되었습니다.", "info", 2000)
+        self._active_day_key = None
+        self._set_mode("idle")
+
+
+@dataclass
+class _ControlRequest:
+    message: Dict[str, object]
+    done: threading.Event = field(default_factory=threading.Event)
+    reply: Dict[str, object] = field(default_factory=dict)
+
+
+class ControlServer(QtCore.QObject):
+    """로컬 제어 채널 서버(`autoclose_control`의 상대편).
+
+    사용자당 하나만 열 수 있으므로 단일 인스턴스 보장에도 쓴다. 접속마다 요청 하나를 받아
+    `register()`로 등록한 처리기를 Qt 이벤트 루프 스레드에서 실행하고 결과를 돌려준다.
+    """
+
+    _received = Signal(object)  # _ControlRequest
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._handlers: Dict[str, Callable[[Dict[str, object]], object]] = {}
+        self._listener: Optional[Listener] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._received.connect(self._dispatch)
+
+    def register(self, command: str, handler: Callable[[Dict[str, object]], object]) -> None:
+        self._handlers[command] = handler
+
+    def start(self) -> bool:
+        """채널을 연다. 다른 인스턴스가 이미 열어 두었으면 False.
+
+        소켓 폴더를 안전하게 쓸 수 없으면(`control_dir_error`) 채널 없이 True를 돌려준다.
+        """
+
+        address, family = control_address()
+        try:
+            if family == "AF_UNIX":
+                socket_path = Path(address)
+                socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                # exist_ok는 이미 있는 폴더의 소유자·권한을 확인하지 않는다.
+                error = control_dir_error(socket_path.parent)
+                if error:
+                    print(f"[제어 채널] {socket_path.parent}을(를) 쓸 수 없어 제어 채널 없이 시작합니다: {error}")
+                    return True
+                if socket_path.exists():
+                    try:
+                        Client(address, family).close()
+                        return False
+                    except OSError:
+                        # 비정상 종료로 남은 소켓 파일
+                        socket_path.unlink()
+            self._listener = Listener(address, family, backlog=8)
+        except OSError as exc:
+            # Windows는 같은 이름의 파이프가 이미 있으면 접근 거부로 실패한다.
+            print(f"[제어 채널] 열 수 없습니다: {exc}")
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="ControlServer", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        listener = self._listener
+        if listener is None:
+            return
+        self._stop.set()
+        try:
+            # 대기 중인 accept()를 깨운다.
+            Client(*control_address()).close()
+        except OSError:
+            pass
+        if self._thread:
+            self._thread.join(timeout=1.5)
+        listener.close()
+        self._listener = None
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                if self._stop.is_set():
+                    return
+                continue
+            with conn:
+                if self._stop.is_set():
+                    return
+                try:
+                    self._serve(conn)
+                except (EOFError, OSError):
+                    continue
+                except RuntimeError:
+                    # 앱 종료 중 Qt 객체가 먼저 정리된 경우
+                    return
+
+    def _serve(self, conn) -> None:
+        if not conn.poll(CONTROL_TIMEOUT):
+            return
+        try:
+            request = _ControlRequest(decode_message(conn.recv_bytes(CONTROL_MAX_BYTES)))
+        except ValueError as exc:
+            conn.send_bytes(encode_message({"ok": False, "error": f"잘못된 요청입니다: {exc}"}))
+            return
+        self._received.emit(request)
+        # 클라이언트가 먼저 포기하지 않도록 조금 짧게 기다린다.
+        if not request.done.wait(CONTROL_TIMEOUT * 0.8):
+            request.reply = {"ok": False, "error": "명령 처리 시간이 초과되었습니다."}
+        conn.send_bytes(encode_message(request.reply))
+
+    def _dispatch(self, request: _ControlRequest) -> None:
+        command = str(request.message.get("cmd") or "")
+        args = request.message.get("args")
+        handler = self._handlers.get(command)
+        if command == "ping":
+            request.reply = {"ok": True, "result": {"pid": os.getpid()}}
+        elif handler is None:
+            request.reply = {"ok": False, "error": f"지원하지 않는 명령입니다: {command}"}
+        else:
+            try:
+                result = handler(args if isinstance(args, dict) else {})
+                request.reply = {"ok": True, "result": result}
+            except Exception as exc:
+                request.reply = {"ok": False, "error": str(exc) or exc.__class__.__name__}
+        request.done.set()
+
+
+# 제어 채널에는 인증이 없으므로 `patch`는 운영 중에 켜고 끄는 항목만 바꾼다.
+CONTROL_PATCH_KEYS = frozenset(
+    {
+        "audio_volume",
+        "enable_remote_shutdown",
+        "enable_local_shutdown",
+        "holidays_enabled",
+        "auto_skip_weekends",
+        "shutdown_delay",
+        "terminate_timeout",
+        "terminate_children",
+        "remote_lead_seconds",
+        "remote_prewarm_seconds",
+        "remote_probe_interval",
+        "audio_preflight_seconds",
+        "audio_cache_mb",
+    }
+)
+# 관리자 비밀번호를 함께 보내도 바꿀 수 없는 항목. 비밀번호는 화면에서만 바꾼다.
+CONTROL_PATCH_FORBIDDEN = frozenset({"user_password_hash", "admin_password_hash"})
+
+
+def install_control_commands(server: ControlServer, runner: ScheduleRunner) -> None:
+    """`status`·`next-run`·`force-run`·`reload`·`patch` 명령을 실행기에 연결한다.
+
+    `patch`는 `CONTROL_PATCH_KEYS`만 바꾸고, 그 밖의 항목(원격 대상·종료 대상 등)은
+    요청에 `admin_password`가 맞을 때만 바꾼다. 비밀번호 해시는 어느 경우에도 바꾸지 않는다.
+    `force-run`은 프로그램과 PC를 바로 종료하므로 항상 `admin_password`가 맞아야 한다.
+    """
+
+    def admin_verified(args: Dict[str, object]) -> bool:
+        """요청에 관리자 비밀번호가 없으면 False, 맞으면 True, 틀리면 PermissionError."""
+
+        password = args.get("admin_password")
+        if password is None:
+            return False
+        if isinstance(password, str) and verify_password(runner.cfg_mgr.config.admin_password_hash, password):
+            return True
+        raise PermissionError("관리자 비밀번호가 올바르지 않습니다.")
+
+    def force_run(args: Dict[str, object]) -> Dict[str, object]:
+        if not admin_verified(args):
+            raise PermissionError("즉시 실행에는 관리자 비밀번호가 필요합니다.")
+        runner.force_run()
+        return {"mode": runner.playback_mode, "day": runner.active_day_key}
+
+    def reload(_: Dict[str, object]) -> Dict[str, object]:
+        runner.cfg_mgr.reload()
+        return {"config_file": str(runner.cfg_mgr.locator.config_file), "revision": runner.cfg_mgr.revision}
+
+    def patch(args: Dict[str, object]) -> Dict[str, object]:
+        values = args.get("values")
+        if not isinstance(values, dict) or not values:
+            raise ValueError("바꿀 설정을 values 객체로 보내세요.")
+        admin = admin_verified(args)
+        if admin:
+            allowed = frozenset(item.name for item in fields(SchedulerConfig)) - CONTROL_PATCH_FORBIDDEN
+        else:
+            allowed = CONTROL_PATCH_KEYS
+        try:
+            changed = runner.cfg_mgr.patch(values, allowed)
+        except PermissionError as exc:
+            if not admin and not CONTROL_PATCH_FORBIDDEN.intersection(values):
+                raise PermissionError(f"{exc} (관리자 비밀번호가 필요합니다: patch --admin)") from None
+            raise
+        return {"changed": changed, "revision": runner.cfg_mgr.revision}
+
+    server.register("status", lambda _: runner.status())
+    server.register("next-run", lambda _: runner.next_run_info())
+    server.register("force-run", force_run)
+    server.register("reload", reload)
+    server.register("patch", patch)
+
+
+def run_headless(argv: Optional[List[str]] = None) -> int:
+    """창·트레이·Qt Multimedia 없이 QtCore만으로 예약 실행을 돌린다. 진행 상황은 표준 출력에 남긴다."""
+
+    with STARTUP_TRACE.phase("QCoreApplication 생성"):
+        app = QtCore.QCoreApplication(list(sys.argv if argv is None else argv))
+        QtCore.QCoreApplication.setApplicationName(APP_NAME)
+        QtCore.QCoreApplication.setApplicationVersion(APP_VERSION)
+        QtCore.QCoreApplication.setOrganizationName(ORGANIZATION_NAME)
+        QtCore.QCoreApplication.setOrganizationDomain(ORGANIZATION_DOMAIN)
+    control = ControlServer()
+    with STARTUP_TRACE.phase("제어 채널 열기"):
+        started = control.start()
+    if not started:
+        print(f"{APP_NAME}가 이미 실행 중입니다.", flush=True)
+        return 1
+    with STARTUP_TRACE.phase("설정 불러오기"):
+        cfg_mgr = ConfigManager()
+    with STARTUP_TRACE.phase("실행기 생성"):
+        runner = ScheduleRunner(cfg_mgr, CommandAudioService())
+    install_control_commands(control, runner)
+    control.register("show", lambda _: {"message": "화면 없는 모드로 실행 중입니다."})
+    runner.stage_message.connect(lambda text: print(f"[진행] {text}", flush=True))
+    runner.notice.connect(
+        lambda text, level, _msec: print(f"[{'경고' if level == 'warning' else '알림'}] {text}", flush=True)
+    )
+    last_run: List[Optional[Tuple[datetime, str]]] = [None]
+
+    def report_next_run(run: Optional[UpcomingRun]) -> None:
+        key = (run.when, run.audio_path or "") if run else None
+        if key == last_run[0]:
+            return
+        last_run[0] = key
+        if run is None:
+            print("[다음 실행] 예정된 일정 없음", flush=True)
+        else:
+            audio = Path(run.audio_path).name if run.audio_path else "음성 없음"
+            print(f"[다음 실행] {run.when:%Y-%m-%d %H:%M} {DAY_LABEL[run.day_key]} · {audio}", flush=True)
+
+    runner.scheduler.next_run_changed.connect(report_next_run)
+    app.aboutToQuit.connect(runner.stop)
+    app.aboutToQuit.connect(control.stop)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: app.quit())
+    # Qt 이벤트 루프가 도는 동안에도 파이썬 신호 처리기가 불리도록 주기적으로 깨운다.
+    heartbeat = QtCore.QTimer()
+    heartbeat.timeout.connect(lambda: None)
+    heartbeat.start(500)
+    print(f"[{APP_NAME}] 화면 없는 모드로 시작합니다. 설정 파일: {cfg_mgr.locator.config_file}", flush=True)
+    with STARTUP_TRACE.phase("실행기 시작"):
+        runner.start()
+    # 이벤트 루프가 처음 돌 때를 시작 완료로 본다.
+    QtCore.QTimer.singleShot(0, lambda: STARTUP_TRACE.finish(startup_trace_path(), "headless"))
+    return app.exec()
+
+
+if __name__ == "__main__":
+    forwarded = forward_to_running_instance(sys.argv)
+    sys.exit(forwarded if forwarded is not None else run_headless())
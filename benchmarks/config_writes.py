@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+ConfigManager 디스크 기록 횟수 측정 도구
+
+요일 카드 토글·원격 PC 표 편집처럼 짧은 시간에 몰리는 UI 변경을 흉내 내고,
+즉시 기록 방식과 지연(write-behind) 기록 방식의 실제 파일 기록 횟수와
+호출 스레드에서 소요된 시간을 비교한다.
+
+    python benchmarks/config_writes.py --edits 200 --interval 1.0
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="autoclose_bench_")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6 import QtCore  # noqa: E402
+
+import autoclose_core as app  # noqa: E402
+
+
+def ui_burst(cfg_mgr: app.ConfigManager, edits: int) -> float:
+    """UI에서 발생하는 연속 변경을 흉내 내고 호출 스레드에서 걸린 시간(초)을 돌려준다."""
+
+    started = time.perf_counter()
+    for idx in range(edits):
+        day_key = app.DAY_KEYS[idx % len(app.DAY_KEYS)]
+        if idx % 3 == 0:
+            hosts = [{"host": f"10.0.0.{n}", "username": "admin", "password": "", "method": "ssh"} for n in range(idx % 40)]
+            cfg_mgr.update(lambda cfg, hosts=hosts: setattr(cfg, "remote_hosts", hosts))
+        else:
+            cfg_mgr.update(lambda cfg, key=day_key: setattr(cfg.days[key], "enabled", not cfg.days[key].enabled))
+    return time.perf_counter() - started
+
+
+def measure(edits: int, interval: float | None) -> tuple:
+    cfg_mgr = app.ConfigManager(write_interval=interval)
+    before = cfg_mgr.write_count
+    elapsed = ui_burst(cfg_mgr, edits)
+    if interval:
+        time.sleep(interval * 1.5)
+    after_idle = cfg_mgr.write_count - before
+    cfg_mgr.save()
+    return elapsed, after_idle, cfg_mgr.write_count - before
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edits", type=int, default=200, help="연속 변경 횟수")
+    parser.add_argument("--interval", type=float, default=app.CONFIG_WRITE_INTERVAL, help="지연 기록 간격(초)")
+    args = parser.parse_args()
+
+    QtCore.QCoreApplication(sys.argv)
+    for label, interval in (("즉시 기록", None), (f"지연 기록 {args.interval:g}s", args.interval)):
+        elapsed, idle_writes, total_writes = measure(args.edits, interval)
+        print(
+            f"[{label}] 변경 {args.edits}회 · 호출 스레드 {elapsed * 1000:.1f} ms · "
+            f"디스크 기록 {idle_writes}회 (save() 포함 {total_writes}회)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+종료 대상 프로세스 찾기 측정 도구
+
+예약 실행 시점에 전체 프로세스를 훑는 방식(`psutil.process_iter`)과
+`ProcessIndex`가 미리 만들어 둔 색인에서 대상만 꺼내는 방식의 소요 시간을 비교한다.
+`--spawn`으로 대기 프로세스를 더 띄워 부하가 큰 PC를 흉내 낼 수 있다.
+
+    python benchmarks/process_scan.py --runs 20
+    python benchmarks/process_scan.py --spawn 500 --targets chrome.exe msedge.exe
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="autoclose_bench_")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import psutil  # noqa: E402
+
+import autoclose_core as app  # noqa: E402
+
+
+def full_scan(targets: list) -> int:
+    lowered = {t.lower() for t in targets}
+    found = 0
+    for proc in psutil.process_iter(["name"]):
+        try:
+            if (proc.info.get("name") or "").lower() in lowered:
+                found += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20, help="측정 횟수")
+    parser.add_argument("--spawn", type=int, default=0, help="추가로 띄울 대기 프로세스 수")
+    parser.add_argument("--targets", nargs="+", default=app.DEFAULT_TARGETS, help="찾을 프로그램 이름")
+    args = parser.parse_args()
+
+    spawned = [
+        subprocess.Popen([sys.executable, "-c", "import time; time.sleep(600)"]) for _ in range(max(0, args.spawn))
+    ]
+    try:
+        index = app.ProcessIndex(lambda: args.targets)
+        started = time.perf_counter()
+        index.refresh()
+        build = time.perf_counter() - started
+        scan_samples, lookup_samples, refresh_samples = [], [], []
+        for _ in range(max(1, args.runs)):
+            started = time.perf_counter()
+            full_scan(args.targets)
+            scan_samples.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            index.refresh()
+            refresh_samples.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            [proc for proc, _ in index.processes(args.targets) if proc.is_running()]
+            lookup_samples.append(time.perf_counter() - started)
+        print(f"프로세스 {len(psutil.pids())}개 · 대상 {sum(len(p) for p in index.running().values())}개")
+        print(f"  전체 훑기      평균 {statistics.mean(scan_samples) * 1000:8.2f} ms")
+        print(f"  색인 조회      평균 {statistics.mean(lookup_samples) * 1000:8.2f} ms")
+        print(f"  색인 증분 갱신 평균 {statistics.mean(refresh_samples) * 1000:8.2f} ms (백그라운드, 첫 구축 {build * 1000:.1f} ms)")
+    finally:
+        for proc in spawned:
+            proc.kill()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+원격 종료 동시 실행 측정 도구
+
+로컬에 대역(stand-in) SSH 서버를 호스트 수만큼 띄우고, `shutdown_remote`를
+순차 실행(작업자 1개)과 동시 실행(스레드 풀·asyncio)으로 각각 돌려 전체 소요 시간을 비교한다.
+대역 서버는 인증을 모두 허용하고, 종료 명령을 받으면 `--command-delay`초 뒤 종료 코드 0을 돌려준다.
+
+    python benchmarks/remote_shutdown.py --hosts 5 10 20 40 --workers 16
+    python benchmarks/remote_shutdown.py --hosts 200 --backends asyncio --workers 64
+    python benchmarks/remote_shutdown.py --prewarm   # 미리 연 SSH 세션으로 보낼 때의 임계 경로 시간
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="autoclose_bench_")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import paramiko  # noqa: E402
+
+import autoclose_core as app  # noqa: E402
+
+
+class _StandInServer(paramiko.ServerInterface):
+    def __init__(self, command_delay: float) -> None:
+        self.command_delay = command_delay
+
+    def check_auth_password(self, username: str, password: str) -> int:
+        return paramiko.AUTH_SUCCESSFUL
+
+    def get_allowed_auths(self, username: str) -> str:
+        return "password"
+
+    def check_channel_request(self, kind: str, chanid: int) -> int:
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel: paramiko.Channel, command: bytes) -> bool:
+        def finish() -> None:
+            time.sleep(self.command_delay)
+            channel.send_exit_status(0)
+            channel.close()
+
+        threading.Thread(target=finish, daemon=True).start()
+        return True
+
+
+def start_stand_in(host_key: paramiko.PKey, command_delay: float) -> int:
+    """대역 SSH 서버 하나를 띄우고 수신 포트를 돌려준다."""
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(16)
+
+    def serve(conn: socket.socket) -> None:
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(host_key)
+        try:
+            transport.start_server(server=_StandInServer(command_delay))
+            channel = transport.accept(20)
+            while channel is not None and transport.is_active() and not channel.closed:
+                time.sleep(0.05)
+        except Exception:
+            pass
+        finally:
+            transport.close()
+
+    def accept_loop() -> None:
+        while True:
+            conn, _ = listener.accept()
+            threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def measure(
+    hosts: List[dict], workers: int, host_timeout: float, backend: str = "threads", prewarm: bool = False
+) -> tuple:
+    pool = None
+    if prewarm:
+        # 예약 시각 전에 열어 두는 상황을 흉내 내며, 세션 준비 시간은 측정에서 뺀다.
+        pool = app.SSHSessionPool(workers)
+        pool.warm(hosts)
+    started = time.perf_counter()
+    results = app.shutdown_remote(
+        hosts,
+        result_callback=lambda *_: None,
+        max_workers=workers,
+        host_timeout=host_timeout,
+        backend=backend,
+        pool=pool,
+    )
+    elapsed = time.perf_counter() - started
+    return elapsed, sum(1 for _, success, _ in results if success)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--hosts", type=int, nargs="+", default=[5, 10, 20, 40], help="측정할 호스트 수 목록")
+    parser.add_argument("--workers", type=int, default=app.REMOTE_SHUTDOWN_WORKERS, help="동시 실행 작업자 수")
+    parser.add_argument("--command-delay", type=float, default=0.2, help="대역 서버의 명령 처리 시간(초)")
+    parser.add_argument(
+        "--backends", nargs="+", choices=sorted(app.REMOTE_BACKENDS), default=["threads", "asyncio"], help="비교할 실행 방식"
+    )
+    parser.add_argument("--prewarm", action="store_true", help="동시 실행 측정 전에 SSH 세션을 미리 연결")
+    parser.add_argument("--sequential", action=argparse.BooleanOptionalAction, default=True, help="순차 실행도 측정")
+    parser.add_argument("--host-timeout", type=float, default=app.REMOTE_HOST_TIMEOUT, help="호스트별 제한 시간(초)")
+    args = parser.parse_args()
+
+    # 클라이언트가 먼저 끊을 때 대역 서버 쪽에서 남기는 소켓 오류 로그는 측정과 무관하다.
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+    host_key = paramiko.RSAKey.generate(2048)
+    ports = [start_stand_in(host_key, args.command_delay) for _ in range(max(args.hosts))]
+    for count in args.hosts:
+        hosts = [
+            {
+                "host": f"127.0.0.1:{port}",
+                "username": "bench",
+                "password": "bench",
+                "method": "ssh",
+                "platform": "linux",
+            }
+            for port in ports[:count]
+        ]
+        parts = []
+        seq_time = None
+        if args.sequential:
+            seq_time, seq_ok = measure(hosts, 1, args.host_timeout)
+            parts.append(f"순차 {seq_time:6.2f}s (성공 {seq_ok})")
+        for backend in args.backends:
+            par_time, par_ok = measure(hosts, args.workers, args.host_timeout, backend, args.prewarm)
+            label = f"{backend}+미리 연결" if args.prewarm else backend
+            text = f"{label} {args.workers}개 {par_time:6.2f}s (성공 {par_ok})"
+            if seq_time is not None:
+                text += f" {seq_time / max(par_time, 1e-6):.1f}배"
+            parts.append(text)
+        print(f"호스트 {count:3d}대 · " + " · ".join(parts))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+창 생성 시간·메모리 측정 도구
+
+`MainWindow`를 만드는 데 걸린 시간과 만든 뒤의 상주 메모리(RSS)를 잰다.
+휴일·고급 설정 페이지와 배정 미리보기를 처음 열 때 만드는 방식(lazy)과
+예전처럼 시작할 때 모두 만드는 방식(eager)을 각각 새 프로세스에서 측정해 비교한다.
+
+    python benchmarks/startup_pages.py --runs 5
+    python benchmarks/startup_pages.py --platform windows   # 실제 화면 플러그인으로 측정
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="autoclose_bench_")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def measure_child(mode: str) -> dict:
+    """이 프로세스에서 창을 한 번 만들고 측정값을 돌려준다."""
+
+    import psutil
+    from PySide6 import QtWidgets
+
+    import desktop_scheduler_qt as app
+
+    qt_app = QtWidgets.QApplication(sys.argv[:1])
+    process = psutil.Process()
+    base_rss = process.memory_info().rss
+    cfg_mgr = app.ConfigManager()
+    started = time.perf_counter()
+    window = app.MainWindow(cfg_mgr)
+    if mode == "eager":
+        for name in list(window._lazy_pages):
+            window._ensure_page(name)
+    qt_app.processEvents()
+    elapsed = time.perf_counter() - started
+    rss = process.memory_info().rss
+    window.runner.stop()
+    return {"elapsed": elapsed, "rss": rss, "window_rss": rss - base_rss, "subscribers": len(cfg_mgr._subscribers)}
+
+
+def run_child(mode: str, platform: str) -> dict:
+    env = dict(os.environ, QT_QPA_PLATFORM=platform)
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="방식별 측정 횟수")
+    parser.add_argument("--platform", default="offscreen", help="Qt 화면 플러그인(QT_QPA_PLATFORM)")
+    parser.add_argument("--child", choices=("lazy", "eager"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure_child(args.child)))
+        # 종료 시 Qt 객체 정리 순서에 따른 경고가 측정 결과를 가리지 않게 바로 끝낸다.
+        sys.stdout.flush()
+        os._exit(0)
+
+    for mode, label in (("eager", "시작 시 모두 생성"), ("lazy", "처음 열 때 생성")):
+        samples = [run_child(mode, args.platform) for _ in range(max(1, args.runs))]
+        elapsed = statistics.mean(sample["elapsed"] for sample in samples)
+        rss = statistics.mean(sample["rss"] for sample in samples)
+        window_rss = statistics.mean(sample["window_rss"] for sample in samples)
+        print(
+            f"[{label}] 창 생성 평균 {elapsed * 1000:7.1f} ms · RSS {rss / 1048576:6.1f} MB "
+            f"(창 생성분 {window_rss / 1048576:5.1f} MB) · 설정 구독 {samples[0]['subscribers']}개"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
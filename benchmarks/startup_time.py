@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+시작 시간 측정 도구
+
+프로그램을 실제로 실행해 시작 기록(`startup_trace.jsonl`)이 남을 때까지 기다린 뒤 종료하고,
+첫 실행(빈 설정 폴더, 가능하면 디스크 캐시도 비움)과 이어지는 재실행의 단계별 시간을 비교한다.
+실행 중인 AutoClose Studio가 있으면 두 번째 실행이 제어 채널로 넘어가므로 먼저 종료해야 한다.
+
+    python benchmarks/startup_time.py --runs 5
+    python benchmarks/startup_time.py --headless
+    python benchmarks/startup_time.py --exe dist/AutoCloseStudio.exe   # 패키징된 exe 측정
+    sudo python benchmarks/startup_time.py --drop-caches                # 리눅스: 첫 실행 전 페이지 캐시 비움
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import psutil  # noqa: E402
+
+from autoclose_control import send_command  # noqa: E402
+from autoclose_profile import STARTUP_TRACE_FILE  # noqa: E402
+
+
+def drop_caches() -> bool:
+    """리눅스에서 root로 실행했을 때만 페이지 캐시를 비운다."""
+
+    try:
+        os.sync()
+        Path("/proc/sys/vm/drop_caches").write_text("3\n")
+        return True
+    except (AttributeError, OSError):
+        return False
+
+
+def last_record_line(trace: Path) -> str:
+    """다 쓴(줄바꿈으로 끝난) 마지막 기록 줄. 쓰는 중에 읽어도 반쪽 줄은 건너뛴다."""
+
+    try:
+        text = trace.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+    complete = text[: text.rfind("\n") + 1].splitlines()
+    return complete[-1] if complete else ""
+
+
+def launch_once(command: List[str], appdata: Path, platform: str, timeout: float) -> Dict[str, object]:
+    """한 번 실행해 새 시작 기록이 생기면 종료하고, 그 기록에 실행부터 걸린 시간을 더해 돌려준다."""
+
+    trace = appdata / "auto_close_studio" / STARTUP_TRACE_FILE
+    before = last_record_line(trace)
+    env = dict(os.environ, APPDATA=str(appdata), XDG_CONFIG_HOME=str(appdata))
+    if platform:
+        env["QT_QPA_PLATFORM"] = platform
+    started = time.perf_counter()
+    process = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - started < timeout:
+            line = last_record_line(trace)
+            if line != before:
+                record = json.loads(line)
+                record["launch_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                return record
+            if process.poll() is not None:
+                raise RuntimeError(f"시작 기록을 남기기 전에 종료되었습니다 (종료 코드 {process.returncode}).")
+            time.sleep(0.01)
+        raise RuntimeError(f"{timeout:g}초 안에 시작 기록이 남지 않았습니다.")
+    finally:
+        # onefile exe는 압축을 푸는 부모와 실제 프로그램인 자식 프로세스로 나뉘므로 함께 끝낸다.
+        try:
+            parent = psutil.Process(process.pid)
+            for proc in parent.children(recursive=True) + [parent]:
+                proc.kill()
+        except psutil.NoSuchProcess:
+            pass
+        process.wait()
+
+
+def phase_table(records: List[Dict[str, object]]) -> Dict[str, float]:
+    """단계 이름별 평균 소요 시간(ms). 시점만 남긴 항목은 시작 시각을 쓴다."""
+
+    samples: Dict[str, List[float]] = {}
+    for record in records:
+        for phase in record["phases"]:
+            label = "  " * int(phase["depth"]) + str(phase["name"])
+            samples.setdefault(label, []).append(float(phase.get("ms", phase["start_ms"])))
+    return {label: statistics.mean(values) for label, values in samples.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="재실행 측정 횟수")
+    parser.add_argument("--headless", action="store_true", help="화면 없는 모드로 측정")
+    parser.add_argument("--exe", help="측정할 실행 파일(기본: 현재 파이썬으로 desktop_scheduler_qt.py 실행)")
+    parser.add_argument("--platform", default="", help="Qt 화면 플러그인(QT_QPA_PLATFORM)")
+    parser.add_argument("--drop-caches", action="store_true", help="첫 실행 전에 디스크 캐시를 비움(리눅스, root)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="한 번 실행을 기다리는 최대 시간(초)")
+    args = parser.parse_args()
+
+    if send_command("ping", timeout=1.0) is not None:
+        print("실행 중인 AutoClose Studio가 있습니다. 종료한 뒤 다시 측정하세요.", file=sys.stderr)
+        return 1
+    command = [args.exe] if args.exe else [sys.executable, str(ROOT / "desktop_scheduler_qt.py")]
+    if args.headless:
+        command.append("--headless")
+    appdata = Path(tempfile.mkdtemp(prefix="autoclose_bench_"))
+
+    cold_label = "첫 실행"
+    if args.drop_caches:
+        cold_label += " (캐시 비움)" if drop_caches() else " (캐시 비우기 실패)"
+    cold = launch_once(command, appdata, args.platform, args.timeout)
+    warm = [launch_once(command, appdata, args.platform, args.timeout) for _ in range(max(1, args.runs))]
+
+    columns = [(cold_label, [cold]), (f"재실행 평균 {len(warm)}회", warm)]
+    print(f"{'':<28}" + "".join(f"{label:>22}" for label, _ in columns))
+    # 두 값의 차이가 인터프리터 시작(onefile이면 압축 해제 포함)과 표준 라이브러리 불러오기 시간이다.
+    for key, title in (("launch_ms", "실행 → 시작 완료"), ("total_ms", "시작 기록 구간")):
+        values = [statistics.mean(float(r.get(key, 0.0)) for r in records) for _, records in columns]
+        print(f"{title:<28}" + "".join(f"{value:19.1f} ms" for value in values))
+    print()
+    tables = [phase_table(records) for _, records in columns]
+    for label in tables[0]:
+        print(f"{label:<28}" + "".join(f"{table.get(label, 0.0):19.1f} ms" for table in tables))
+    print("\n(들여쓴 항목은 바로 위 단계에 포함되며, '불러옴' 항목은 소요 시간이 아닌 시작 후 시점입니다.)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+SchedulerEngine 트리거 지연 측정 도구
+
+주입 가능한 시계(clock)로 예약 시각 직전의 가상 시각을 만들어 두고,
+예약 시각에서 `schedule_triggered` 신호가 실제로 도착하기까지 걸린 시간을 잰다.
+
+    python benchmarks/trigger_latency.py --runs 5 --lead 1.5
+    python benchmarks/trigger_latency.py --poll 15   # 예전 15초 폴링 방식과 비교
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 실제 사용자 설정을 건드리지 않도록 임시 폴더를 설정 위치로 사용한다.
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="autoclose_bench_")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6 import QtCore  # noqa: E402
+
+import autoclose_core as app  # noqa: E402
+
+
+def measure_once(lead: float, poll_interval: float | None) -> float:
+    """예약 시각 `lead`초 전에서 시작해 신호 도착까지의 지연(초)을 돌려준다."""
+
+    virtual_start = datetime.now().replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(seconds=lead)
+    target = virtual_start + timedelta(seconds=lead)
+    real_start = time.perf_counter()
+
+    def clock() -> datetime:
+        return virtual_start + timedelta(seconds=time.perf_counter() - real_start)
+
+    day_key = app.DAY_KEYS[target.weekday()]
+    cfg_mgr = app.ConfigManager()
+
+    def prepare(cfg: app.SchedulerConfig) -> None:
+        cfg.holidays_enabled = False
+        for key, day_cfg in cfg.days.items():
+            day_cfg.enabled = key == day_key
+            day_cfg.time = target.strftime("%H:%M")
+            day_cfg.last_ran = None
+
+    cfg_mgr.update(prepare)
+    fired: list = []
+    loop = QtCore.QEventLoop()
+
+    def on_trigger(*_: object) -> None:
+        fired.append(time.perf_counter())
+        loop.quit()
+
+    engine = app.SchedulerEngine(cfg_mgr, clock=clock, poll_interval=poll_interval)
+    engine.schedule_triggered.connect(on_trigger)
+    engine.start()
+    QtCore.QTimer.singleShot(int((lead + (poll_interval or 0) + 5) * 1000), loop.quit)
+    loop.exec()
+    engine.stop()
+    if not fired:
+        raise RuntimeError("제한 시간 안에 트리거가 발생하지 않았습니다.")
+    return fired[0] - (real_start + lead)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--lead", type=float, default=1.5, help="예약 시각까지 남은 가상 시간(초)")
+    parser.add_argument("--poll", type=float, default=None, help="지정 시 주기 폴링 모드로 측정")
+    args = parser.parse_args()
+
+    QtCore.QCoreApplication(sys.argv)
+    samples = [measure_once(args.lead, args.poll) for _ in range(max(1, args.runs))]
+    mode = f"폴링 {args.poll:g}s" if args.poll is not None else "정확한 기한 대기"
+    print(f"[{mode}] 측정 {len(samples)}회")
+    for idx, value in enumerate(samples, 1):
+        print(f"  #{idx}: {value * 1000:8.1f} ms")
+    print(f"  평균 {statistics.mean(samples) * 1000:.1f} ms · 최대 {max(samples) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,67 +9,101 @@
 * 대상 프로그램 강제 종료 → 음성 재생 → 원격 PC 종료 → 로컬 PC 종료 순으로 실행
 * 메인 창을 닫아도 백그라운드에서 동작하고, 트레이 아이콘으로 제어
 * 자동 재생용 플레이리스트를 관리하고, 요일별 자동 할당 시 순환
+* `--headless`로 실행하면 창·트레이 없이 예약 실행만 돌린다
+* 이미 실행 중이면 두 번째 실행은 인자(`status`, `force-run` 등)를 제어 채널로 넘기고 끝난다
+* `--profile-imports`로 실행하면 모듈별 불러오기 시간 보고서를 남긴다(`autoclose_profile`)
+* 시작할 때마다 단계별 소요 시간을 기본 설정 폴더의 `startup_trace.jsonl`에 남긴다
 
 주요 기술 요소
 ---------------
 * PySide6 기반의 QML 느낌의 카드를 입힌 UI
+* 설정·예약·종료 단계는 QtCore만 쓰는 `autoclose_core` 모듈에 있고, 이 창은 그 위의 앞단
 * `ConfigManager`가 AppData(또는 사용자 홈)의 JSON 구성 파일을 관리
-* `SchedulerEngine`이 별도 스레드에서 다음 실행을 감지하고 GUI 스레드에 신호 전달
+* `SchedulerEngine`이 별도 스레드에서 다음 실행을 감지하고 `ScheduleRunner`가 단계를 진행
 * `AudioService`가 Qt Multimedia로 음성 파일을 재생하고 완료 시 후속 작업을 호출
+  (Qt Multimedia와 paramiko는 시작을 늦추지 않도록 처음 쓸 때 또는 한가할 때 불러온다)
 * 각 편집 탭은 `LiveUpdateMixin`을 통해 변경 즉시 저장 및 프리뷰를 갱신
 """
 from __future__ import annotations
 
-import atexit
-import hashlib
 import html
-import json
-import os
-import platform
-import shutil
-import socket
-import subprocess
 import sys
 import threading
 import time
-from dataclasses import dataclass, asdict, field
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
-import psutil
-
-try:
-    import paramiko  # type: ignore
-except ImportError:  # pragma: no cover - optional dependency
-    paramiko = None
+from autoclose_profile import STARTUP_TRACE, ImportProfiler
+
+# `--profile-imports`로 실행하면 아래에서 불러오는 모듈마다 걸린 시간을 재어 보고서를 남기고 끝낸다.
+_import_profiler = ImportProfiler.from_argv(sys.argv) if __name__ == "__main__" else None
+
+from autoclose_control import forward_to_running_instance
+
+if __name__ == "__main__" and _import_profiler is None:
+    # 이미 실행 중인 인스턴스가 있으면 인자만 넘기고 Qt·paramiko를 불러오기 전에 끝낸다.
+    _forwarded = forward_to_running_instance(sys.argv)
+    if _forwarded is not None:
+        sys.exit(_forwarded)
+
+from autoclose_core import (
+    APP_NAME,
+    APP_VERSION,
+    AUTHOR_NAME,
+    BUILD_DATE,
+    DAY_KEYS,
+    DAY_LABEL,
+    DEFAULT_APP_ICON,
+    DEFAULT_REMOTE_METHOD,
+    DEFAULT_TARGETS,
+    HOLIDAY_SECTIONS,
+    ORGANIZATION_DOMAIN,
+    ORGANIZATION_NAME,
+    REMOTE_BACKENDS,
+    SCHEDULE_SECTIONS,
+    SETTINGS_SECTIONS,
+    AudioBackend,
+    AudioCache,
+    ConfigManager,
+    ControlServer,
+    HostReachabilityCache,
+    ProbeResult,
+    ProcessIndex,
+    ScheduleRunner,
+    SchedulerConfig,
+    UpcomingRun,
+    hash_password,
+    install_control_commands,
+    load_paramiko,
+    normalize_slot_time,
+    probe_hosts,
+    remote_method,
+    remote_probe_target,
+    run_headless,
+    startup_trace_path,
+    verify_password,
+)
+
+STARTUP_TRACE.mark("핵심 모듈 불러옴")
+
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    # 화면 없는 모드는 QtGui·QtWidgets·Qt Multimedia를 불러오기 전에 넘긴다.
+    if _import_profiler is not None:
+        sys.exit(_import_profiler.finish([("paramiko", load_paramiko)]))
+    sys.exit(run_headless(sys.argv))
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QIcon, QPalette, QColor
-from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
-
-APP_NAME = "AutoClose Studio"
-APP_VERSION = "2.1.2"
-BUILD_DATE = "2025-11-06"
-AUTHOR_NAME = "Zolt46 / PSW / Emanon108"
-ORGANIZATION_NAME = "AutoClose Studio"
-ORGANIZATION_DOMAIN = "autoclose.local"
-DEFAULT_USER_PASSWORD = "0000"
-DEFAULT_ADMIN_PASSWORD = "000000"
-
-APP_DIR = Path(__file__).resolve().parent
-
-
-def resource_path(relative: str) -> Path:
-    """exe 패키징(PyInstaller 등) 이후에도 자원 경로를 안전하게 찾는다."""
 
-    base_dir = Path(getattr(sys, "_MEIPASS", APP_DIR))  # type: ignore[attr-defined]
-    return base_dir / relative
+STARTUP_TRACE.mark("Qt 화면 모듈 불러옴")
 
+# Qt Multimedia는 첫 재생·사전 점검 때(또는 시작 후 한가할 때) `load_multimedia()`로 불러온다.
+QAudioOutput = None
+QMediaPlayer = None
 
-DEFAULT_ASSET_DIR = "assets"
-DEFAULT_APP_ICON = resource_path(f"{DEFAULT_ASSET_DIR}/app_icon.ico")
 
 PREFERRED_UI_FONTS = [
     "Noto Sans KR",
@@ -100,541 +134,90 @@ def _build_ui_font(point_size: int, weight: int) -> QFont:
     font.setStyleStrategy(QFont.PreferAntialias)
     return font
 
-def hash_password(raw: str) -> str:
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
-
-
-def verify_password(stored_hash: str, attempt: str) -> bool:
-    if not stored_hash:
-        return True
-    try:
-        return stored_hash == hash_password(attempt)
-    except Exception:
-        return False
-
-
-def coerce_bool(value: object, default: bool) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {"1", "true", "yes", "y", "on"}:
-            return True
-        if lowered in {"0", "false", "no", "n", "off"}:
-            return False
-    if isinstance(value, (int, float)):
-        return bool(value)
-    return default
-
-class ConfigLocator:
-    """현재 설정 파일 위치를 추적하고 변경을 돕는 도우미."""
-
-    def __init__(self) -> None:
-        base_root = Path(
-            os.environ.get("APPDATA")
-            or os.environ.get("XDG_CONFIG_HOME")
-            or Path.home() / ".config"
-        )
-        self._default_dir = base_root / "auto_close_studio"
-        self._default_dir.mkdir(parents=True, exist_ok=True)
-        self._pointer_file = self._default_dir / "storage_location.json"
-        self._config_dir = self._load_pointer()
-        self._config_dir.mkdir(parents=True, exist_ok=True)
-
-    def _load_pointer(self) -> Path:
-        if self._pointer_file.exists():
-            try:
-                data = json.loads(self._pointer_file.read_text(encoding="utf-8"))
-                stored = data.get("path")
-                if stored:
-                    path = Path(stored).expanduser()
-                    return path
-            except Exception:
-                pass
-        return self._default_dir
-
-    @property
-    def config_dir(self) -> Path:
-        return self._config_dir
-
-    @property
-    def config_file(self) -> Path:
-        return self._config_dir / "settings.json"
-
-    def change_dir(self, new_dir: Path) -> None:
-        target = Path(new_dir).expanduser()
-        target.mkdir(parents=True, exist_ok=True)
-        try:
-            resolved = target.resolve()
-        except Exception:
-            resolved = target
-        self._config_dir = resolved
-        payload = {"path": str(self._config_dir)}
-        self._pointer_file.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
-
-CONFIG_LOCATOR = ConfigLocator()
-
-DAY_KEYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
-DAY_LABEL = {
-    "mon": "월요일",
-    "tue": "화요일",
-    "wed": "수요일",
-    "thu": "목요일",
-    "fri": "금요일",
-    "sat": "토요일",
-    "sun": "일요일",
-}
-
-DEFAULT_TARGETS = ["chrome.exe", "msedge.exe", "vlc.exe", "YouTube Music.exe"]
-DEFAULT_REMOTE = [
-    {"host": "192.168.0.31", "username": "admin", "password": "1234", "method": "ssh"},
-]
-
-
-@dataclass
-class DaySchedule:
-    enabled: bool = True
-    time: str = "09:00"  # HH:MM
-    auto_assign: bool = True
-    audio_path: Optional[str] = None
-    allow_remote: bool = True
-    allow_local_shutdown: bool = True
-    last_ran: Optional[str] = None  # yyyy-mm-dd
-
-    def as_dict(self) -> Dict[str, object]:
-        data = asdict(self)
-        return data
-
-    @staticmethod
-    def from_dict(data: Dict[str, object]) -> "DaySchedule":
-        base = DaySchedule()
-        for key in ("enabled", "time", "auto_assign", "audio_path", "allow_remote", "allow_local_shutdown", "last_ran"):
-            if key in data:
-                setattr(base, key, data[key])
-        return base
-
-
-@dataclass
-class SchedulerConfig:
-    playlist: List[str] = field(default_factory=list)
-    playlist_rotation: int = 0
-    targets: List[str] = field(default_factory=lambda: DEFAULT_TARGETS.copy())
-    remote_hosts: List[Dict[str, str]] = field(default_factory=lambda: DEFAULT_REMOTE.copy())
-    enable_remote_shutdown: bool = True
-    enable_local_shutdown: bool = True
-    shutdown_delay: int = 5
-    holidays_enabled: bool = True
-    auto_skip_weekends: bool = True
-    holidays: List[str] = field(default_factory=list)
-    holiday_ranges: List[Dict[str, str]] = field(default_factory=list)
-    holiday_labels: Dict[str, str] = field(default_factory=dict)
-    start_with_os: bool = False
-    theme_accent: str = "#2A5CAA"
-    header_logo_path: Optional[str] = None
-    audio_volume: float = 0.9
-    shutdown_logs: List[Dict[str, str]] = field(default_factory=list)
-    user_password_hash: str = field(default_factory=lambda: hash_password(DEFAULT_USER_PASSWORD))
-    admin_password_hash: str = field(default_factory=lambda: hash_password(DEFAULT_ADMIN_PASSWORD))
-    days: Dict[str, DaySchedule] = field(
-        default_factory=lambda: {key: DaySchedule(enabled=(key not in {"sat", "sun"})) for key in DAY_KEYS}
-    )
-
-    def as_dict(self) -> Dict[str, object]:
-        data = asdict(self)
-        data["days"] = {k: v.as_dict() for k, v in self.days.items()}
-        return data
-
-    @staticmethod
-    def from_dict(data: Dict[str, object]) -> "SchedulerConfig":
-        base = SchedulerConfig()
-        for key in (
-            "playlist",
-            "playlist_rotation",
-            "targets",
-            "remote_hosts",
-            "enable_remote_shutdown",
-            "enable_local_shutdown",
-            "shutdown_delay",
-            "holidays_enabled",
-            "auto_skip_weekends",
-            "holidays",
-            "holiday_ranges",
-            "holiday_labels",
-            "start_with_os",
-            "theme_accent",
-            "audio_volume",
-            "header_logo_path",
-            "shutdown_logs",
-            "user_password_hash",
-            "admin_password_hash",
-        ):
-            if key in data:
-                setattr(base, key, data[key])
-        days = {}
-        for day_key, day_val in data.get("days", {}).items():
-            days[day_key] = DaySchedule.from_dict(day_val)
-        for missing in DAY_KEYS:
-            days.setdefault(missing, DaySchedule(enabled=(missing not in {"sat", "sun"})))
-        base.days = days
-        base.auto_skip_weekends = coerce_bool(data.get("auto_skip_weekends", base.auto_skip_weekends), base.auto_skip_weekends)
-        if not isinstance(base.holiday_labels, dict):
-            base.holiday_labels = {}
-        if not isinstance(base.user_password_hash, str) or not base.user_password_hash:
-            base.user_password_hash = hash_password(DEFAULT_USER_PASSWORD)
-        if not isinstance(base.admin_password_hash, str) or not base.admin_password_hash:
-            base.admin_password_hash = hash_password(DEFAULT_ADMIN_PASSWORD)
-        if base.header_logo_path and not isinstance(base.header_logo_path, str):
-            base.header_logo_path = None
-        try:
-            base.audio_volume = float(base.audio_volume)
-        except (TypeError, ValueError):
-            base.audio_volume = 0.9
-        base.audio_volume = max(0.0, min(1.0, base.audio_volume))
-        return base
-
-def is_holiday(cfg: SchedulerConfig, target: date) -> bool:
-    if cfg.auto_skip_weekends and target.weekday() >= 5:
-        return True
-    if target.isoformat() in cfg.holidays:
-        return True
-    for rng in cfg.holiday_ranges:
-        try:
-            start = datetime.strptime(rng["start"], "%Y-%m-%d").date()
-            end = datetime.strptime(rng["end"], "%Y-%m-%d").date()
-        except Exception:
-            continue
-        if start <= target <= end:
-            return True
-    return False
-
-
-def is_day_eligible(cfg: SchedulerConfig, day_cfg: DaySchedule, current_date: date) -> bool:
-    if not day_cfg.enabled:
-        return False
-    if cfg.holidays_enabled and is_holiday(cfg, current_date):
-        return False
-    if day_cfg.last_ran == current_date.isoformat():
-        return False
-    return True
-
-
-@dataclass
-class UpcomingRun:
-    when: datetime
-    day_key: str
-    audio_path: Optional[str]
-    auto_assign: bool
-    remote_allowed: bool
-    local_allowed: bool
-
-
-def compute_upcoming_runs(cfg: SchedulerConfig, horizon_days: int = 28, limit: Optional[int] = None) -> List[UpcomingRun]:
-    now = datetime.now()
-    playlist_len = len(cfg.playlist)
-    rotation = cfg.playlist_rotation % max(1, playlist_len) if playlist_len else 0
-    index = rotation
-    runs: List[UpcomingRun] = []
-    for offset in range(horizon_days):
-        current = now + timedelta(days=offset)
-        day_key = DAY_KEYS[current.weekday()]
-        day_cfg = cfg.days.get(day_key)
-        if not day_cfg or not is_day_eligible(cfg, day_cfg, current.date()):
-            continue
-        try:
-            hh, mm = map(int, day_cfg.time.split(":"))
-        except Exception:
-            continue
-        scheduled = current.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        if scheduled < now:
-            continue
-        if day_cfg.auto_assign and playlist_len:
-            audio = cfg.playlist[index % playlist_len]
-        else:
-            audio = day_cfg.audio_path if day_cfg.audio_path else (cfg.playlist[index % playlist_len] if day_cfg.auto_assign and playlist_len else None)
-        runs.append(
-            UpcomingRun(
-                when=scheduled,
-                day_key=day_key,
-                audio_path=audio,
-                auto_assign=day_cfg.auto_assign,
-                remote_allowed=cfg.enable_remote_shutdown and day_cfg.allow_remote,
-                local_allowed=cfg.enable_local_shutdown and day_cfg.allow_local_shutdown,
-            )
-        )
-        if day_cfg.auto_assign and playlist_len:
-            index = (index + 1) % playlist_len
-        if limit is not None and len(runs) >= limit:
-            break
-    return runs
-
-
-def predict_playlist_for_day(cfg: SchedulerConfig, target_day: str) -> Optional[str]:
-    if target_day not in DAY_KEYS:
-        return None
-    for run in compute_upcoming_runs(cfg, horizon_days=28):
-        if run.day_key == target_day:
-            return run.audio_path
-    return None
-
-
-class ConfigManager(QtCore.QObject):
-    config_changed = Signal(SchedulerConfig)
-    storage_dir_changed = Signal(str)
-
-    def __init__(self) -> None:
-        super().__init__()
-        self._lock = threading.Lock()
-        self.locator = CONFIG_LOCATOR
-        self.config = self._load()
-        atexit.register(self._flush_on_exit)
-
-    def _load(self) -> SchedulerConfig:
-        config_file = self.locator.config_file
-        backup_file = config_file.with_suffix(config_file.suffix + ".bak")
-        raw_data: Optional[Dict[str, object]] = None
-        used_backup = False
-        if config_file.exists():
-            try:
-                raw_data = json.loads(config_file.read_text(encoding="utf-8"))
-            except Exception as exc:  # pragma: no cover - fall back to backup/default
-                print("[설정 읽기 실패]", exc)
-        if raw_data is None and backup_file.exists():
-            try:
-                raw_data = json.loads(backup_file.read_text(encoding="utf-8"))
-                used_backup = True
-            except Exception as exc:  # pragma: no cover - still fall back to default
-                print("[백업 설정 읽기 실패]", exc)
-        if raw_data is not None:
-            try:
-                config = SchedulerConfig.from_dict(raw_data)
-                if self._apply_migrations(config, raw_data) or used_backup:
-                    try:
-                        self._write(config)
-                    except Exception as exc:  # pragma: no cover - non critical
-                        print("[설정 마이그레이션 실패]", exc)
-                return config
-            except Exception as exc:  # pragma: no cover - fall back to default
-                print("[설정 변환 실패]", exc)
-        config = SchedulerConfig()
-        if self._apply_migrations(config, raw_data):
-            try:
-                self._write(config)
-            except Exception as exc:  # pragma: no cover - non critical
-                print("[기본 설정 저장 실패]", exc)
-        return config
-
-    def _apply_migrations(self, config: SchedulerConfig, data: Optional[Dict[str, object]]) -> bool:
-        changed = False
-        if data is None or "auto_skip_weekends" not in data:
-            if config.auto_skip_weekends is not True:
-                config.auto_skip_weekends = True
-                changed = True
-        return changed
-
-    def _write(self, config: SchedulerConfig) -> None:
-        config_file = self.locator.config_file
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        backup_file = config_file.with_suffix(config_file.suffix + ".bak")
-        tmp_file = config_file.with_suffix(config_file.suffix + ".tmp")
-        payload = json.dumps(config.as_dict(), ensure_ascii=False, indent=2)
-        try:
-            if config_file.exists():
-                shutil.copy2(config_file, backup_file)
-        except Exception:
-            pass
-        tmp_file.write_text(payload, encoding="utf-8")
-        try:
-            os.replace(tmp_file, config_file)
-        except Exception:
-            shutil.move(str(tmp_file), str(config_file))
-
-    def save(self) -> None:
-        with self._lock:
-            self._write(self.config)
-            config = self.config
-        self.config_changed.emit(config)
-
-    def update(self, updater) -> None:
-        with self._lock:
-            updater(self.config)
-            config = self.config
-            self._write(config)
-        self.config_changed.emit(config)
-
-    def change_storage_dir(self, path: Path) -> None:
-        with self._lock:
-            self.locator.change_dir(path)
-            self._write(self.config)
-            config = self.config
-        self.storage_dir_changed.emit(str(self.locator.config_dir))
-        self.config_changed.emit(config)
-
-    def storage_directory(self) -> Path:
-        return self.locator.config_dir
-
-    def _flush_on_exit(self) -> None:
-        with self._lock:
-            try:
-                self._write(self.config)
-            except Exception:
-                pass
-
-class SchedulerEngine(QtCore.QObject):
-    schedule_triggered = Signal(str, str, bool, bool)  # day_key, audio_path, allow_remote, allow_local
-    next_run_changed = Signal(object)
 
-    def __init__(self, cfg_mgr: ConfigManager) -> None:
-        super().__init__()
-        self.cfg_mgr = cfg_mgr
-        self._thread: Optional[threading.Thread] = None
-        self._stop = threading.Event()
-        self._last_trigger_marker: Optional[Tuple[str, date]] = None
+def load_multimedia() -> None:
+    """Qt Multimedia(와 플랫폼 음성 백엔드)를 불러온다. 이미 불러왔으면 아무 일도 하지 않는다."""
 
-    def start(self) -> None:
-        if self._thread and self._thread.is_alive():
-            return
-        self._stop.clear()
-        self._thread = threading.Thread(target=self._loop, name="SchedulerEngine", daemon=True)
-        self._thread.start()
-
-    def stop(self) -> None:
-        self._stop.set()
-        if self._thread:
-            self._thread.join(timeout=1.5)
+    global QAudioOutput, QMediaPlayer
+    if QMediaPlayer is None:
+        from PySide6.QtMultimedia import QAudioOutput, QMediaPlayer
 
-    def _loop(self) -> None:
-        while not self._stop.is_set():
-            self._compute_next_run()
-            self._check_trigger()
-            self._stop.wait(15)
 
-    def _compute_next_run(self) -> None:
-        cfg = self.cfg_mgr.config
-        runs = compute_upcoming_runs(cfg, horizon_days=28, limit=1)
-        self.next_run_changed.emit(runs[0] if runs else None)
-
-    def _is_day_eligible(self, cfg: SchedulerConfig, day_cfg: DaySchedule, current_date: date) -> bool:
-        return is_day_eligible(cfg, day_cfg, current_date)
-
-    def _is_holiday(self, cfg: SchedulerConfig, target: date) -> bool:
-        return is_holiday(cfg, target)
-
-    def _check_trigger(self) -> None:
-        now = datetime.now()
-        cfg = self.cfg_mgr.config
-        day_key = DAY_KEYS[now.weekday()]
-        day_cfg = cfg.days[day_key]
-        if day_cfg.last_ran != now.date().isoformat():
-            self._last_trigger_marker = None
-        if not self._is_day_eligible(cfg, day_cfg, now.date()):
-            return
-        hh, mm = map(int, day_cfg.time.split(":"))
-        target_time = now.replace(hour=hh, minute=mm, second=0, microsecond=0)
-        delta = (now - target_time).total_seconds()
-        if 0 <= delta <= 30:
-            marker = (day_key, now.date())
-            if self._last_trigger_marker == marker:
-                return
-            self._last_trigger_marker = marker
-            audio_path = self._resolve_audio(cfg, day_cfg)
-            self.schedule_triggered.emit(
-                day_key,
-                audio_path or "",
-                cfg.enable_remote_shutdown and day_cfg.allow_remote,
-                cfg.enable_local_shutdown and day_cfg.allow_local_shutdown,
-            )
-            self.cfg_mgr.update(lambda c: c.days[day_key].__setattr__("last_ran", now.date().isoformat()))
-
-    def _resolve_audio(self, cfg: SchedulerConfig, day_cfg: DaySchedule) -> Optional[str]:
-        if not day_cfg.auto_assign and day_cfg.audio_path:
-            return day_cfg.audio_path
-        if not cfg.playlist:
-            return day_cfg.audio_path
-        index = cfg.playlist_rotation % len(cfg.playlist)
-        path = cfg.playlist[index]
-        def _bump(config: SchedulerConfig) -> None:
-            config.playlist_rotation = (config.playlist_rotation + 1) % max(1, len(config.playlist))
-        self.cfg_mgr.update(_bump)
-        return path
-
-
-class AudioService(QtCore.QObject):
-    playback_started = Signal(str)
-    playback_finished = Signal(str)
-    playback_error = Signal(str, str)
+class AudioService(AudioBackend):
+    """Qt Multimedia(QMediaPlayer)로 음성 파일을 재생한다. 재생기는 처음 쓸 때 만든다."""
 
     def __init__(self) -> None:
         super().__init__()
-        self.player = QMediaPlayer(self)
-        self.audio_output = QAudioOutput(self)
-        self.player.setAudioOutput(self.audio_output)
-        self.player.mediaStatusChanged.connect(self._status_changed)
-        self.player.playbackStateChanged.connect(self._playback_changed)
-        self.player.errorOccurred.connect(self._on_error)
-        self._current: Optional[str] = None
-        self._volume: float = 0.9
-        self.audio_output.setVolume(self._volume)
-
-    def set_volume(self, value: float) -> None:
-        try:
-            volume = float(value)
-        except (TypeError, ValueError):
-            volume = 0.9
-        self._volume = max(0.0, min(1.0, volume))
-        self.audio_output.setVolume(self._volume)
+        self.player = None
+        self.audio_output = None
+
+    def preload(self) -> None:
+        self._ensure_player()
+
+    def _ensure_player(self) -> None:
+        if self.player is None:
+            load_multimedia()
+            self.player = QMediaPlayer(self)
+            self.audio_output = QAudioOutput(self)
+            self.player.setAudioOutput(self.audio_output)
+            self.player.mediaStatusChanged.connect(self._status_changed)
+            self.player.playbackStateChanged.connect(self._playback_changed)
+            self.player.errorOccurred.connect(self._on_error)
+            self.player.durationChanged.connect(self._duration_changed)
+            self.audio_output.setVolume(self._volume)
+
+    def _apply_volume(self) -> None:
+        if self.audio_output is not None:
+            self.audio_output.setVolume(self._volume)
 
     def play(self, path: str) -> None:
         if not path:
             self._current = None
-            self.player.stop()
+            self.stop()
             self.playback_finished.emit("")
             return
-        file_path = Path(path).expanduser()
-        if not file_path.exists():
-            resolved = str(file_path)
+        play_path, source = self._source_path(path)
+        if source is None:
+            resolved = str(play_path)
             self._current = None
-            self.player.stop()
+            self.stop()
             self.playback_error.emit(resolved, "파일을 찾을 수 없습니다. 경로를 다시 확인하세요.")
             self.playback_finished.emit(resolved)
             return
-        url = QtCore.QUrl.fromLocalFile(str(file_path))
+        self._ensure_player()
+        url = QtCore.QUrl.fromLocalFile(str(play_path))
         if self.player.playbackState() != QMediaPlayer.StoppedState:
             self._current = None
             self.player.stop()
         self.player.setSource(url)
         self.player.setPosition(0)
         self.audio_output.setVolume(self._volume)
-        try:
-            normalized = file_path.resolve(strict=False)
-        except Exception:
-            normalized = file_path.absolute()
-        self._current = str(normalized)
+        self._current = source
+        if self.player.duration() > 0:
+            # 이미 길이를 읽은 소스라면 durationChanged가 다시 오지 않을 수 있다.
+            self.remember_duration(self._current, self.player.duration() / 1000.0)
         self.player.play()
         self.playback_started.emit(self._current)
 
     def stop(self) -> None:
-        if self.player.playbackState() != QMediaPlayer.StoppedState:
+        if self.player is not None and self.player.playbackState() != QMediaPlayer.StoppedState:
             self.player.stop()
 
-    def current_source(self) -> Optional[str]:
-        return self._current if self.player.playbackState() != QMediaPlayer.StoppedState else None
+    def is_active(self) -> bool:
+        return self.player is not None and self.player.playbackState() != QMediaPlayer.StoppedState
 
-    def is_playing_source(self, path: Optional[str]) -> bool:
-        if self.player.playbackState() != QMediaPlayer.PlayingState:
-            return False
-        if not path or not self._current:
-            return False
-        candidate = Path(path).expanduser()
-        try:
-            candidate_norm = candidate.resolve(strict=False)
-        except Exception:
-            candidate_norm = candidate.absolute()
-        try:
-            current_norm = Path(self._current).resolve(strict=False)
-        except Exception:
-            current_norm = Path(self._current).absolute()
-        return os.path.normcase(str(current_norm)) == os.path.normcase(str(candidate_norm))
+    def is_playing(self) -> bool:
+        return self.player is not None and self.player.playbackState() == QMediaPlayer.PlayingState
+
+    def position_seconds(self) -> float:
+        if self.player is None:
+            return 0.0
+        return max(0, self.player.position()) / 1000.0
+
+    def _duration_changed(self, duration_ms: int) -> None:  # pragma: no cover - Qt callback
+        if duration_ms > 0 and self._current:
+            self.remember_duration(self._current, duration_ms / 1000.0)
+            self.duration_known.emit(self._current, duration_ms / 1000.0)
 
     def _status_changed(self, status: QMediaPlayer.MediaStatus) -> None:  # pragma: no cover - Qt callback
         if status == QMediaPlayer.InvalidMedia:
@@ -659,134 +242,97 @@ class AudioService(QtCore.QObject):
         self.playback_error.emit(path, message)
         self.playback_finished.emit(path)
 
-def terminate_programs(targets: List[str]) -> None:
-    lowered = {t.lower() for t in targets}
-    for proc in psutil.process_iter(["name"]):
-        try:
-            name = (proc.info.get("name") or "").lower()
-            if name in lowered and proc.pid != os.getpid():
-                proc.terminate()
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            continue
+# 사전 점검에서 파일 읽기 확인에 쓰는 크기와, 디코딩 확인을 기다리는 최대 시간(초).
+PREFLIGHT_READ_BYTES = 256 * 1024
+PREFLIGHT_DECODE_TIMEOUT = 20.0
 
 
-def _escape_powershell(value: str) -> str:
-    return value.replace("`", "``").replace("\"", "`\"")
+class AudioPreflight(QtCore.QObject):
+    """예약 시각 전에 음성 파일을 점검한다.
 
+    작업 스레드에서 파일이 있는지, 읽을 수 있는지 확인하고(선택 시 음성 캐시에 사본도 만든다),
+    이어서 재생용과 별개인 QMediaPlayer로 불러와 디코딩 가능 여부와 길이를 확인한다.
+    결과는 `finished(원본 경로, 성공 여부, 안내문, 길이(초), 로컬 사본 경로)`로 알린다.
+    """
 
-def shutdown_remote(
-    hosts: List[Dict[str, str]],
-    result_callback: Optional[Callable[[str, bool, str], None]] = None,
-) -> None:
-    def notify(target: str, success: bool, message: str) -> None:
-        if result_callback is not None:
-            try:
-                result_callback(target, success, message)
-            except Exception:
-                pass
-        else:
-            status = "성공" if success else "실패"
-            print(f"[원격 종료 {status}] {target or '알 수 없음'}: {message}")
-
-    for host in hosts:
-        method = (host.get("method") or "winrm").lower()
-        target = (host.get("host") or "").strip()
-        if not target:
-            notify("", False, "대상 호스트가 비어 있습니다.")
-            continue
-        target = (host.get("host") or "").strip()
-        if not target:
-            continue
-        try:
-            if method == "ssh":
-                if not paramiko:
-                    raise RuntimeError("paramiko가 포함되지 않아 SSH 원격 종료를 실행할 수 없습니다.")
-
-                def _collect_ssh_commands() -> List[str]:
-                    commands: List[str] = []
-                    for key in ("command", "shutdown_command"):
-                        value = host.get(key)
-                        if isinstance(value, str) and value.strip():
-                            commands.append(value.strip())
-                    extra = host.get("commands") or host.get("shutdown_commands")
-                    if isinstance(extra, (list, tuple)):
-                        for item in extra:
-                            if isinstance(item, str) and item.strip():
-                                commands.append(item.strip())
-                    platform_hint = (host.get("platform") or "").lower()
-                    if platform_hint:
-                        if "win" in platform_hint:
-                            commands.append("shutdown /s /t 0")
-                        elif any(token in platform_hint for token in ("linux", "unix", "mac", "darwin")):
-                            commands.append("shutdown -h now")
-                    if not commands:
-                        commands.extend(["shutdown /s /t 0", "shutdown -h now"])
-                    seen: List[str] = []
-                    for cmd in commands:
-                        if cmd not in seen:
-                            seen.append(cmd)
-                    return seen
-
-                ssh_commands = _collect_ssh_commands()
-                ssh = paramiko.SSHClient()
-                ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-                ssh.connect(
-                    hostname=target,
-                    username=host.get("username") or None,
-                    password=host.get("password") or None,
-                    timeout=10,
-                    look_for_keys=False,
-                    allow_agent=False,
-                )
+    finished = Signal(str, bool, str, float, str)
+    _file_checked = Signal(str, str, str)  # path, playable path, error
 
-                errors: List[str] = []
-                success = False
-                try:
-                    for command in ssh_commands:
-                        try:
-                            stdin, stdout, stderr = ssh.exec_command(command)
-                            exit_status = stdout.channel.recv_exit_status()
-                            if exit_status == 0:
-                                notify(target, True, f"SSH 명령 전송: {command}")
-                                success = True
-                                break
-                            detail = stderr.read().decode("utf-8", errors="ignore").strip()
-                            if not detail:
-                                detail = stdout.read().decode("utf-8", errors="ignore").strip()
-                            detail = detail or f"종료 코드 {exit_status}"
-                            errors.append(f"{command}: {detail}")
-                        except Exception as ssh_exc:  # pragma: no cover - network dependent
-                            errors.append(f"{command}: {ssh_exc}")
-                    if not success:
-                        raise RuntimeError("; ".join(errors) or "알 수 없는 이유로 종료 명령 실패")
-                finally:
-                    ssh.close()
-                if success:
-                    continue
-            elif method == "winrm":
-                command = ["shutdown", "/m", f"\\\\{target}", "/s", "/t", "0"]
-                username = (host.get("username") or "").strip()
-                password = host.get("password") or ""
-                if username:
-                    command.extend(["/u", username])
-                    if password:
-                        command.extend(["/p", password])
-                completed = subprocess.run(command, capture_output=True, text=True)
-                if completed.returncode != 0:
-                    detail = completed.stderr.strip() or completed.stdout.strip() or f"종료 코드 {completed.returncode}"
-                    raise RuntimeError(detail)
-            else:
-                raise ValueError(f"지원하지 않는 원격 종료 방식: {method}")
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.player = None
+        self._timeout = QtCore.QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.timeout.connect(lambda: self._finish(False, "디코딩 확인 시간이 초과되었습니다."))
+        self._file_checked.connect(self._load)
+        self._path: Optional[str] = None
+        self._local: str = ""
+
+    def busy(self) -> bool:
+        return self._path is not None
+
+    def check(self, path: str, cache: Optional[AudioCache] = None) -> None:
+        if self._path is not None:
+            return
+        self._path = path
+        self._local = ""
+        threading.Thread(target=self._check_file, args=(path, cache), name="AudioPreflight", daemon=True).start()
+
+    def _check_file(self, path: str, cache: Optional[AudioCache]) -> None:
+        source = Path(path).expanduser()
+        try:
+            if not source.is_file():
+                raise FileNotFoundError("파일을 찾을 수 없습니다.")
+            with source.open("rb") as handle:
+                handle.read(PREFLIGHT_READ_BYTES)
+            local = cache.ensure(path) if cache is not None else None
+            playable = str(local or source)
         except Exception as exc:
-            print(f"[원격 종료 실패] {target}: {exc}")
+            self._file_checked.emit(path, "", str(exc) or exc.__class__.__name__)
+            return
+        self._file_checked.emit(path, playable, "")
+
+    def _load(self, path: str, playable: str, error: str) -> None:
+        if path != self._path:
+            return
+        if error:
+            self._finish(False, error)
+            return
+        if playable != str(Path(path).expanduser()):
+            self._local = playable
+        if self.player is None:
+            load_multimedia()
+            self.player = QMediaPlayer(self)
+            self.player.mediaStatusChanged.connect(self._status_changed)
+            self.player.errorOccurred.connect(self._on_error)
+        self._timeout.start(int(PREFLIGHT_DECODE_TIMEOUT * 1000))
+        self.player.setSource(QtCore.QUrl.fromLocalFile(playable))
+        if self.player.mediaStatus() == QMediaPlayer.LoadedMedia:
+            self._status_changed(QMediaPlayer.LoadedMedia)
+
+    def _status_changed(self, status: QMediaPlayer.MediaStatus) -> None:  # pragma: no cover - Qt callback
+        if self._path is None:
+            return
+        if status == QMediaPlayer.InvalidMedia:
+            self._finish(False, "지원하지 않는 형식이거나 손상된 파일입니다.")
+        elif status == QMediaPlayer.LoadedMedia:
+            self._finish(True, "재생 준비 완료")
 
+    def _on_error(self, error: QMediaPlayer.Error, error_string: str) -> None:  # pragma: no cover - Qt callback
+        if error != QMediaPlayer.NoError and self._path is not None:
+            self._finish(False, error_string or "음성 파일을 불러올 수 없습니다.")
 
-def shutdown_local(delay: int) -> None:
-    if sys.platform.startswith("win"):
-        os.system(f"shutdown /s /t {max(0, delay)}")
-    else:  # linux/mac
-        time.sleep(max(0, delay))
-        os.system("shutdown -h now")
+    def _finish(self, success: bool, message: str) -> None:
+        path = self._path
+        if path is None:
+            return
+        self._timeout.stop()
+        duration = max(0, self.player.duration()) / 1000.0 if success else 0.0
+        local = self._local if success else ""
+        self._path = None
+        if self.player is not None:
+            self.player.setSource(QtCore.QUrl())
+        self.finished.emit(path, success, message, duration, local)
 
 
 def set_startup(start_with_os: bool) -> None:
@@ -876,6 +422,7 @@ class FancyCard(QtWidgets.QFrame):
         layout.addWidget(self.subtitle)
         self.body_layout = QtWidgets.QVBoxLayout()
         layout.addLayout(self.body_layout)
+        self._subscriptions: List[Tuple[ConfigManager, Callable[[SchedulerConfig], None]]] = []
         self._apply_styles()
 
     def _apply_styles(self) -> None:
@@ -911,6 +458,21 @@ class FancyCard(QtWidgets.QFrame):
         self._accent = accent
         self._apply_styles()
 
+    def subscribe_config(
+        self, cfg_mgr: ConfigManager, sections, callback: Callable[[SchedulerConfig], None]
+    ) -> None:
+        """`release()`에서 함께 해제되도록 기록해 두고 설정 항목을 구독한다."""
+
+        cfg_mgr.subscribe(sections, callback)
+        self._subscriptions.append((cfg_mgr, callback))
+
+    def release(self) -> None:
+        """카드를 지우기 전에 창 밖의 객체와 맺은 연결을 끊는다."""
+
+        for cfg_mgr, callback in self._subscriptions:
+            cfg_mgr.unsubscribe(callback)
+        self._subscriptions.clear()
+
 
 class DayCard(FancyCard):
     changed = Signal(str)
@@ -922,6 +484,8 @@ class DayCard(FancyCard):
         self.set_subtitle("해당 요일의 실행 시간과 동작을 설정합니다")
         self._build_ui()
         self.sync_from_config()
+        cfg_mgr.subscribe({f"days.{day_key}", "playlist"}, lambda _: self.sync_from_config())
+        cfg_mgr.subscribe(SCHEDULE_SECTIONS, lambda _: self._update_auto_hint())
 
     def _build_ui(self) -> None:
         layout = QtWidgets.QGridLayout()
@@ -932,6 +496,9 @@ class DayCard(FancyCard):
         auto_chk = StyledToggle()
         time_edit = QtWidgets.QTimeEdit()
         time_edit.setDisplayFormat("HH:mm")
+        extra_times_edit = QtWidgets.QLineEdit()
+        extra_times_edit.setPlaceholderText("추가 실행 시간 (예: 12:30, 18:00)")
+        extra_times_edit.setToolTip("같은 날 여러 번 실행하려면 시간을 쉼표로 구분해 입력합니다.")
         manual_combo = QtWidgets.QComboBox()
         manual_combo.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
         manual_combo.setInsertPolicy(QtWidgets.QComboBox.NoInsert)
@@ -952,14 +519,16 @@ class DayCard(FancyCard):
         layout.addWidget(create_toggle_field("원격 종료 허용", remote_chk), 1, 0)
         local_chk.setToolTip("일정 종료 시 이 PC를 종료합니다.")
         layout.addWidget(create_toggle_field("본체 종료", local_chk), 1, 1)
-        layout.addWidget(manual_combo, 2, 0, 1, 3)
-        layout.addWidget(auto_hint, 3, 0, 1, 3)
+        layout.addWidget(extra_times_edit, 2, 0, 1, 3)
+        layout.addWidget(manual_combo, 3, 0, 1, 3)
+        layout.addWidget(auto_hint, 4, 0, 1, 3)
         container = QtWidgets.QWidget()
         container.setLayout(layout)
         self.body_layout.addWidget(container)
         self.enable_chk = enable_chk
         self.auto_chk = auto_chk
         self.time_edit = time_edit
+        self.extra_times_edit = extra_times_edit
         self.manual_combo = manual_combo
         self.remote_chk = remote_chk
         self.local_chk = local_chk
@@ -969,6 +538,7 @@ class DayCard(FancyCard):
         remote_chk.stateChanged.connect(lambda _: self._persist())
         local_chk.stateChanged.connect(lambda _: self._persist())
         time_edit.timeChanged.connect(lambda _: self._persist())
+        extra_times_edit.editingFinished.connect(self._persist)
         manual_combo.currentIndexChanged.connect(lambda _: self._persist())
         auto_chk.stateChanged.connect(lambda _: self._update_mode())
         self._update_mode()
@@ -985,6 +555,9 @@ class DayCard(FancyCard):
         self.time_edit.blockSignals(True)
         self.time_edit.setTime(QtCore.QTime(hh, mm))
         self.time_edit.blockSignals(False)
+        self.extra_times_edit.blockSignals(True)
+        self.extra_times_edit.setText(", ".join(cfg.extra_times))
+        self.extra_times_edit.blockSignals(False)
         self._populate_manual_options(cfg.audio_path)
         self.remote_chk.blockSignals(True)
         self.remote_chk.setChecked(cfg.allow_remote)
@@ -1019,17 +592,29 @@ class DayCard(FancyCard):
         self.auto_hint.setVisible(is_auto)
         self._update_auto_hint()
 
+    def _parse_extra_times(self, primary: str) -> List[str]:
+        slots: List[str] = []
+        for part in self.extra_times_edit.text().split(","):
+            slot = normalize_slot_time(part)
+            if slot and slot != primary and slot not in slots:
+                slots.append(slot)
+        return sorted(slots)
+
     def _persist(self) -> None:
+        primary = self.time_edit.time().toString("HH:mm")
+        extra_times = self._parse_extra_times(primary)
+
         def updater(cfg: SchedulerConfig) -> None:
             day_cfg = cfg.days[self.day_key]
             day_cfg.enabled = self.enable_chk.isChecked()
             day_cfg.auto_assign = self.auto_chk.isChecked()
             selected = self.manual_combo.currentData()
             day_cfg.audio_path = selected if selected else None
-            day_cfg.time = self.time_edit.time().toString("HH:mm")
+            day_cfg.time = primary
+            day_cfg.extra_times = extra_times
             day_cfg.allow_remote = self.remote_chk.isChecked()
             day_cfg.allow_local_shutdown = self.local_chk.isChecked()
-        self.cfg_mgr.update(updater)
+        self.cfg_mgr.update(updater, sections=(f"days.{self.day_key}",))
         self.changed.emit(self.day_key)
         self._update_mode()
 
@@ -1041,7 +626,7 @@ class DayCard(FancyCard):
         if not day_cfg.auto_assign:
             self.auto_hint.hide()
             return
-        next_audio = predict_playlist_for_day(self.cfg_mgr.config, self.day_key)
+        next_audio = self.cfg_mgr.calendar.predict_for_day(self.day_key)
         if next_audio:
             name = Path(next_audio).name
             self.auto_hint.setText(f"자동 음성: {name}")
@@ -1111,6 +696,8 @@ class PlaylistPanel(FancyCard):
         self._volume_timer.setInterval(300)
         self._volume_timer.timeout.connect(self._persist_volume)
         self.volume_slider.valueChanged.connect(self._on_volume_changed)
+        self.cfg_mgr.subscribe({"playlist"}, lambda _: self.refresh())
+        self.cfg_mgr.subscribe({"audio_volume"}, lambda _: self._sync_volume())
         self.refresh()
 
     def refresh(self) -> None:
@@ -1130,8 +717,7 @@ class PlaylistPanel(FancyCard):
             for path in paths:
                 if path not in cfg.playlist:
                     cfg.playlist.append(path)
-        self.cfg_mgr.update(updater)
-        self.refresh()
+        self.cfg_mgr.update(updater, sections=("playlist",))
 
     def _remove_selected(self) -> None:
         selected = self.list_widget.selectedItems()
@@ -1141,8 +727,7 @@ class PlaylistPanel(FancyCard):
         def updater(cfg: SchedulerConfig) -> None:
             cfg.playlist = [p for p in cfg.playlist if p not in remove_paths]
             cfg.playlist_rotation = 0
-        self.cfg_mgr.update(updater)
-        self.refresh()
+        self.cfg_mgr.update(updater, sections=("playlist", "playlist_rotation"))
 
     def _move_selected(self, direction: int) -> None:
         row = self.list_widget.currentRow()
@@ -1153,8 +738,7 @@ class PlaylistPanel(FancyCard):
             return
         def updater(cfg: SchedulerConfig) -> None:
             cfg.playlist[row], cfg.playlist[target] = cfg.playlist[target], cfg.playlist[row]
-        self.cfg_mgr.update(updater)
-        self.refresh()
+        self.cfg_mgr.update(updater, sections=("playlist",))
         self.list_widget.setCurrentRow(target)
 
     def _preview_selected(self) -> None:
@@ -1163,9 +747,10 @@ class PlaylistPanel(FancyCard):
             show_info_message(self, "안내", "미리 듣기할 파일을 선택하세요.")
             return
         path = item.data(Qt.UserRole)
-        if not path or not Path(path).exists():
+        if not path:
             show_warning_message(self, "재생 불가", "파일을 찾을 수 없습니다. 경로를 확인해주세요.")
             return
+        # 파일 확인은 AudioService.play가 캐시를 먼저 본 뒤에 한다(없으면 재생 오류로 알린다).
         self._emit_preview(path)
 
     def add_preview_listener(self, callback: Callable[[str], None]) -> None:
@@ -1203,7 +788,7 @@ class PlaylistPanel(FancyCard):
         def updater(cfg: SchedulerConfig) -> None:
             cfg.audio_volume = value
 
-        self.cfg_mgr.update(updater)
+        self.cfg_mgr.update(updater, sections=("audio_volume",))
 
     def _sync_volume(self) -> None:
         target = int(round(self.cfg_mgr.config.audio_volume * 100))
@@ -1244,11 +829,11 @@ class AutoAssignmentPreviewCard(FancyCard):
         wrapper = QtWidgets.QWidget()
         wrapper.setLayout(layout)
         self.body_layout.addWidget(wrapper)
+        self.subscribe_config(self.cfg_mgr, SCHEDULE_SECTIONS, lambda _: self.refresh())
         self.refresh()
 
     def refresh(self) -> None:
-        cfg = self.cfg_mgr.config
-        runs = compute_upcoming_runs(cfg, horizon_days=35, limit=14)
+        runs = self.cfg_mgr.calendar.upcoming(horizon_days=35, limit=14)
         self.table.clearContents()
         self.table.clearSpans()
         if runs:
@@ -1345,6 +930,7 @@ class HolidayPanel(FancyCard):
         self.toggle = toggle
         self.weekend_toggle = weekend_toggle
         self.summary_label = summary
+        self.subscribe_config(self.cfg_mgr, HOLIDAY_SECTIONS, lambda _: self.refresh())
         self.refresh()
 
     def refresh(self) -> None:
@@ -1388,7 +974,7 @@ class HolidayPanel(FancyCard):
             cfg.holidays_enabled = enabled
             cfg.auto_skip_weekends = skip_weekends
 
-        self.cfg_mgr.update(updater)
+        self.cfg_mgr.update(updater, sections=("holidays_enabled", "auto_skip_weekends"))
 
     def _add_single(self) -> None:
         dlg = QtWidgets.QCalendarWidget()
@@ -1408,8 +994,7 @@ class HolidayPanel(FancyCard):
                 if selected not in cfg.holidays:
                     cfg.holidays.append(selected)
 
-            self.cfg_mgr.update(updater)
-            self.refresh()
+            self.cfg_mgr.update(updater, sections=("holidays",))
 
     def _add_range(self) -> None:
         dialog = DateRangeDialog(self)
@@ -1419,8 +1004,7 @@ class HolidayPanel(FancyCard):
             def updater(cfg: SchedulerConfig) -> None:
                 cfg.holiday_ranges.append({"start": start, "end": end})
 
-            self.cfg_mgr.update(updater)
-            self.refresh()
+            self.cfg_mgr.update(updater, sections=("holiday_ranges",))
 
     def _add_weekend_range(self) -> None:
         dialog = DateRangeDialog(self)
@@ -1444,8 +1028,7 @@ class HolidayPanel(FancyCard):
                             cfg.holidays.append(iso)
                     current += timedelta(days=1)
 
-            self.cfg_mgr.update(updater)
-            self.refresh()
+            self.cfg_mgr.update(updater, sections=("holidays",))
 
     def _import_ics(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "iCalendar 가져오기", str(Path.home()), "iCalendar (*.ics)")
@@ -1505,6 +1088,7 @@ class HolidayPanel(FancyCard):
 
         def updater(cfg: SchedulerConfig) -> None:
             nonlocal added, labeled
+            added = labeled = 0
             for iso, summary in events:
                 if iso not in cfg.holidays:
                     cfg.holidays.append(iso)
@@ -1514,8 +1098,7 @@ class HolidayPanel(FancyCard):
                         cfg.holiday_labels[iso] = summary
                         labeled += 1
 
-        self.cfg_mgr.update(updater)
-        self.refresh()
+        self.cfg_mgr.update(updater, sections=("holidays", "holiday_labels"))
         show_success_message(
             self,
             "가져오기 완료",
@@ -1548,27 +1131,27 @@ class HolidayPanel(FancyCard):
                         if not (start and end and rng.get("start") == start and rng.get("end") == end)
                     ]
 
-            self.cfg_mgr.update(updater)
-            self.refresh()
+            self.cfg_mgr.update(updater, sections=("holidays", "holiday_labels", "holiday_ranges"))
 
     def _remove_selected(self, widget: QtWidgets.QListWidget) -> None:
         items = widget.selectedItems()
         if not items:
             show_info_message(self, "안내", "삭제할 항목을 선택하세요.")
             return
-        for item in items:
-            key = item.data(Qt.UserRole)
+        # 변경 알림으로 목록이 다시 채워지면 항목 객체가 사라지므로 값만 먼저 모아 한 번에 반영한다.
+        selected = [(item.data(Qt.UserRole), item.text()) for item in items]
 
-            def updater(cfg: SchedulerConfig, item=item, key=key) -> None:
+        def updater(cfg: SchedulerConfig) -> None:
+            for key, text in selected:
                 if widget is self.single_list:
-                    iso = key or item.text()
+                    iso = key or text
                     cfg.holidays = [d for d in cfg.holidays if d != iso]
                     cfg.holiday_labels.pop(iso, None)
                 else:
                     if isinstance(key, tuple):
                         start, end = key
                     else:
-                        parts = item.text().split(" ~ ")
+                        parts = text.split(" ~ ")
                         start, end = parts if len(parts) == 2 else (None, None)
                     cfg.holiday_ranges = [
                         rng
@@ -1576,23 +1159,37 @@ class HolidayPanel(FancyCard):
                         if not (start and end and rng.get("start") == start and rng.get("end") == end)
                     ]
 
-            self.cfg_mgr.update(updater)
-        self.refresh()
+        self.cfg_mgr.update(updater, sections=("holidays", "holiday_labels", "holiday_ranges"))
 
 
 class SettingsPanel(FancyCard):
     test_completed = Signal(bool, str)
     log_generated = Signal(str)
-
-    def __init__(self, cfg_mgr: ConfigManager, accent: str, parent=None) -> None:
+    bulk_result = Signal(str, str, bool, float, str)  # host, method, success, elapsed, message
+    bulk_completed = Signal(int, int, float)  # total, succeeded, elapsed
+
+    def __init__(
+        self,
+        cfg_mgr: ConfigManager,
+        accent: str,
+        parent=None,
+        reachability: Optional[HostReachabilityCache] = None,
+        process_index: Optional[ProcessIndex] = None,
+    ) -> None:
         super().__init__("고급 설정", accent, parent)
         self.cfg_mgr = cfg_mgr
+        self.reachability = reachability
+        self.process_index = process_index
         self.set_subtitle("종료 정책과 네트워크, 테마 설정")
         outer = QtWidgets.QVBoxLayout()
         outer.setSpacing(16)
         form = QtWidgets.QFormLayout()
         form.setSpacing(12)
         self.target_edit = QtWidgets.QLineEdit(", ".join(cfg_mgr.config.targets))
+        self.running_targets_label = QtWidgets.QLabel()
+        self.running_targets_label.setWordWrap(True)
+        self.running_targets_label.setProperty("role", "subtitle")
+        self.running_targets_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self.remote_toggle = StyledToggle()
         self.remote_toggle.setChecked(cfg_mgr.config.enable_remote_shutdown)
         self.remote_toggle.setToolTip("스케줄 종료 후 원격 PC 종료 명령을 전송합니다.")
@@ -1602,9 +1199,78 @@ class SettingsPanel(FancyCard):
         self.startup_toggle = StyledToggle()
         self.startup_toggle.setChecked(cfg_mgr.config.start_with_os)
         self.startup_toggle.setToolTip("Windows 로그인 시 프로그램을 자동 실행합니다.")
+        self.journal_toggle = StyledToggle()
+        self.journal_toggle.setChecked(cfg_mgr.config.storage_journal)
+        self.journal_toggle.setToolTip("변경된 부분만 기록해 느린 네트워크 폴더에서도 저장 부담을 줄입니다.")
         self.delay_spin = QtWidgets.QSpinBox()
         self.delay_spin.setRange(0, 300)
         self.delay_spin.setValue(cfg_mgr.config.shutdown_delay)
+        terminate_row = QtWidgets.QHBoxLayout()
+        self.terminate_timeout_spin = QtWidgets.QSpinBox()
+        self.terminate_timeout_spin.setRange(0, 60)
+        self.terminate_timeout_spin.setValue(cfg_mgr.config.terminate_timeout)
+        self.terminate_timeout_spin.setSuffix("초 후 강제 종료")
+        self.terminate_timeout_spin.setToolTip("종료 요청 후 이 시간 안에 닫히지 않은 프로그램은 강제로 종료합니다.")
+        self.terminate_children_toggle = StyledToggle()
+        self.terminate_children_toggle.setChecked(cfg_mgr.config.terminate_children)
+        self.terminate_children_toggle.setToolTip("대상 프로그램이 띄운 하위 프로세스도 함께 종료합니다.")
+        terminate_row.addWidget(self.terminate_timeout_spin)
+        terminate_row.addWidget(create_toggle_field("하위 프로세스 포함", self.terminate_children_toggle))
+        terminate_row.addStretch(1)
+        remote_mode_row = QtWidgets.QHBoxLayout()
+        self.remote_backend_combo = QtWidgets.QComboBox()
+        for key, label in REMOTE_BACKENDS.items():
+            self.remote_backend_combo.addItem(label, key)
+        self.remote_backend_combo.setCurrentIndex(
+            max(0, self.remote_backend_combo.findData(cfg_mgr.config.remote_backend))
+        )
+        self.remote_backend_combo.setToolTip("원격 PC가 수백 대라면 비동기 방식이 스레드를 적게 사용합니다.")
+        self.remote_concurrency_spin = QtWidgets.QSpinBox()
+        self.remote_concurrency_spin.setRange(1, 256)
+        self.remote_concurrency_spin.setValue(cfg_mgr.config.remote_concurrency)
+        self.remote_concurrency_spin.setSuffix("대 동시")
+        self.remote_concurrency_spin.setToolTip("동시에 종료 명령을 보내는 원격 PC 수입니다.")
+        remote_mode_row.addWidget(self.remote_backend_combo, 1)
+        remote_mode_row.addWidget(self.remote_concurrency_spin)
+        self.prewarm_spin = QtWidgets.QSpinBox()
+        self.prewarm_spin.setRange(0, 600)
+        self.prewarm_spin.setValue(cfg_mgr.config.remote_prewarm_seconds)
+        self.prewarm_spin.setSpecialValueText("사용 안 함")
+        self.prewarm_spin.setToolTip("예약 시각 전에 SSH 세션을 미리 열어 두어 종료 명령이 바로 전달되게 합니다.")
+        self.probe_interval_spin = QtWidgets.QSpinBox()
+        self.probe_interval_spin.setRange(0, 3600)
+        self.probe_interval_spin.setSingleStep(30)
+        self.probe_interval_spin.setValue(cfg_mgr.config.remote_probe_interval)
+        self.probe_interval_spin.setSpecialValueText("사용 안 함")
+        self.probe_interval_spin.setToolTip("원격 PC 응답 여부를 백그라운드에서 확인하는 주기입니다.")
+        self.remote_lead_spin = QtWidgets.QSpinBox()
+        self.remote_lead_spin.setRange(0, 600)
+        self.remote_lead_spin.setValue(cfg_mgr.config.remote_lead_seconds)
+        self.remote_lead_spin.setSpecialValueText("방송이 끝난 뒤")
+        self.remote_lead_spin.setToolTip(
+            "방송 음성이 끝나기 이 시간 전에 원격 종료를 보내, 방송이 끝날 즈음 원격 PC 종료가 마무리되게 합니다."
+        )
+        preflight_row = QtWidgets.QHBoxLayout()
+        self.preflight_spin = QtWidgets.QSpinBox()
+        self.preflight_spin.setRange(0, 3600)
+        self.preflight_spin.setSingleStep(30)
+        self.preflight_spin.setValue(cfg_mgr.config.audio_preflight_seconds)
+        self.preflight_spin.setSpecialValueText("사용 안 함")
+        self.preflight_spin.setSuffix("초 전")
+        self.preflight_spin.setToolTip("예약 시각 전에 음성 파일을 열어 보고 재생할 수 있는지 확인합니다.")
+        self.preflight_copy_toggle = StyledToggle()
+        self.preflight_copy_toggle.setChecked(cfg_mgr.config.audio_preflight_copy)
+        self.preflight_copy_toggle.setToolTip("점검할 때 음성 파일을 음성 로컬 캐시에 최신 사본으로 복사해 둡니다.")
+        preflight_row.addWidget(self.preflight_spin)
+        preflight_row.addWidget(create_toggle_field("로컬에 복사", self.preflight_copy_toggle))
+        preflight_row.addStretch(1)
+        self.audio_cache_spin = QtWidgets.QSpinBox()
+        self.audio_cache_spin.setRange(0, 100_000)
+        self.audio_cache_spin.setSingleStep(128)
+        self.audio_cache_spin.setValue(cfg_mgr.config.audio_cache_mb)
+        self.audio_cache_spin.setSpecialValueText("사용 안 함")
+        self.audio_cache_spin.setSuffix(" MB")
+        self.audio_cache_spin.setToolTip("플레이리스트 음성을 설정 폴더 옆에 복사해 두고 재생합니다. 한도를 넘으면 오래된 사본부터 지웁니다.")
         self.accent_btn = QtWidgets.QPushButton("테마 색상 변경")
         self.accent_btn.setCursor(Qt.PointingHandCursor)
         path_row = QtWidgets.QHBoxLayout()
@@ -1635,12 +1301,22 @@ class SettingsPanel(FancyCard):
         password_row.addWidget(self.admin_password_btn)
         password_row.addStretch(1)
         form.addRow("종료 대상 프로그램", self.target_edit)
+        if self.process_index is not None:
+            form.addRow("현재 실행 중", self.running_targets_label)
+        form.addRow("프로그램 종료 방식", terminate_row)
         form.addRow("원격 종료", create_toggle_field("사용", self.remote_toggle))
         form.addRow("본체 종료", create_toggle_field("사용", self.local_toggle))
         form.addRow("종료 지연(초)", self.delay_spin)
+        form.addRow("원격 종료 실행", remote_mode_row)
+        form.addRow("SSH 미리 연결(초 전)", self.prewarm_spin)
+        form.addRow("원격 상태 확인 주기(초)", self.probe_interval_spin)
+        form.addRow("원격 종료 미리 시작(초 전)", self.remote_lead_spin)
+        form.addRow("음성 사전 점검", preflight_row)
+        form.addRow("음성 로컬 캐시", self.audio_cache_spin)
         form.addRow("시작 프로그램 등록", create_toggle_field("사용", self.startup_toggle))
         form.addRow("테마", self.accent_btn)
         form.addRow("설정 저장 위치", path_row)
+        form.addRow("변경분 기록(저널)", create_toggle_field("사용", self.journal_toggle))
         form.addRow("상단 로고", logo_row)
         form.addRow("비밀번호 관리", password_row)
         outer.addLayout(form)
@@ -1651,8 +1327,8 @@ class SettingsPanel(FancyCard):
         hosts_hint = QtWidgets.QLabel("IP 또는 호스트 이름과 접속 정보를 입력하면 원격 종료에 활용됩니다.")
         hosts_hint.setWordWrap(True)
         hosts_layout.addWidget(hosts_hint)
-        self.host_table = QtWidgets.QTableWidget(0, 4)
-        self.host_table.setHorizontalHeaderLabels(["IP/호스트", "계정", "비밀번호", "방식"])
+        self.host_table = QtWidgets.QTableWidget(0, 5)
+        self.host_table.setHorizontalHeaderLabels(["IP/호스트", "계정", "비밀번호", "방식", "상태"])
         self.host_table.horizontalHeader().setStretchLastSection(True)
         self.host_table.verticalHeader().setVisible(False)
         self.host_table.setAlternatingRowColors(True)
@@ -1667,12 +1343,16 @@ class SettingsPanel(FancyCard):
         self.add_host_btn = QtWidgets.QPushButton("추가")
         self.remove_host_btn = QtWidgets.QPushButton("삭제")
         self.test_host_btn = QtWidgets.QPushButton("연결 시험")
+        self.test_all_btn = QtWidgets.QPushButton("전체 시험")
+        self.test_all_btn.setToolTip("등록된 원격 PC를 동시에 모두 시험합니다.")
         for btn in (self.add_host_btn, self.remove_host_btn):
             btn.setCursor(Qt.PointingHandCursor)
         self.test_host_btn.setCursor(Qt.PointingHandCursor)
+        self.test_all_btn.setCursor(Qt.PointingHandCursor)
         host_btn_row.addWidget(self.add_host_btn)
         host_btn_row.addWidget(self.remove_host_btn)
         host_btn_row.addWidget(self.test_host_btn)
+        host_btn_row.addWidget(self.test_all_btn)
         host_btn_row.addStretch(1)
         hosts_layout.addLayout(host_btn_row)
         outer.addWidget(hosts_group)
@@ -1683,11 +1363,23 @@ class SettingsPanel(FancyCard):
         self.remote_toggle.stateChanged.connect(lambda _: self._persist())
         self.local_toggle.stateChanged.connect(lambda _: self._persist())
         self.startup_toggle.stateChanged.connect(lambda _: self._persist())
+        self.journal_toggle.stateChanged.connect(lambda _: self._persist())
         self.delay_spin.valueChanged.connect(lambda _: self._persist())
+        self.terminate_timeout_spin.valueChanged.connect(lambda _: self._persist())
+        self.terminate_children_toggle.stateChanged.connect(lambda _: self._persist())
+        self.remote_backend_combo.currentIndexChanged.connect(lambda _: self._persist())
+        self.remote_concurrency_spin.valueChanged.connect(lambda _: self._persist())
+        self.prewarm_spin.valueChanged.connect(lambda _: self._persist())
+        self.probe_interval_spin.valueChanged.connect(lambda _: self._persist())
+        self.remote_lead_spin.valueChanged.connect(lambda _: self._persist())
+        self.preflight_spin.valueChanged.connect(lambda _: self._persist())
+        self.preflight_copy_toggle.stateChanged.connect(lambda _: self._persist())
+        self.audio_cache_spin.valueChanged.connect(lambda _: self._persist())
         self.accent_btn.clicked.connect(self._pick_color)
         self.add_host_btn.clicked.connect(self._add_host)
         self.remove_host_btn.clicked.connect(self._remove_host)
         self.test_host_btn.clicked.connect(self._test_host)
+        self.test_all_btn.clicked.connect(self._test_all_hosts)
         self.host_table.itemChanged.connect(lambda _: self._persist_hosts())
         path_change_btn.clicked.connect(self._choose_config_dir)
         self.cfg_mgr.storage_dir_changed.connect(self._on_storage_dir_changed)
@@ -1697,15 +1389,66 @@ class SettingsPanel(FancyCard):
         self.logo_clear_btn.clicked.connect(self._clear_logo_image)
         self.test_completed.connect(self._on_test_result)
         self.log_generated.connect(self._append_test_log)
+        self.bulk_result.connect(self._on_bulk_result)
+        self.bulk_completed.connect(self._on_bulk_completed)
         self._targets_timer = QtCore.QTimer(self)
         self._targets_timer.setSingleShot(True)
         self._targets_timer.setInterval(400)
         self._targets_timer.timeout.connect(self._persist_targets)
         self.target_edit.textChanged.connect(lambda _: self._targets_timer.start())
         self._loading_hosts = False
+        self._saving_hosts = False
+        self._bulk_total = 0
+        self._bulk_done = 0
         self._update_logo_summary(self.cfg_mgr.config.header_logo_path)
         self._load_hosts()
         self._log_dialog: Optional[TerminalLogDialog] = None
+        self.subscribe_config(
+            self.cfg_mgr, SETTINGS_SECTIONS - {"remote_hosts", "header_logo_path"}, lambda _: self._sync_fields()
+        )
+        self.subscribe_config(self.cfg_mgr, {"remote_hosts"}, lambda _: self._on_hosts_changed())
+        self.subscribe_config(
+            self.cfg_mgr, {"header_logo_path"}, lambda cfg: self._update_logo_summary(cfg.header_logo_path)
+        )
+        if self.process_index is not None:
+            self.process_index.changed.connect(self._update_running_targets)
+            self._update_running_targets()
+        if self.reachability is not None:
+            self.reachability.updated.connect(self._update_host_states)
+            # 검사 없이 "n분 전" 표시만 새로 고친다.
+            self._freshness_timer = QtCore.QTimer(self)
+            self._freshness_timer.setInterval(15000)
+            self._freshness_timer.timeout.connect(self._update_host_states)
+            self._freshness_timer.start()
+
+    def is_busy(self) -> bool:
+        """연결 시험이 돌고 있거나 시험 로그 창이 열려 있으면 패널을 지우지 않는다."""
+
+        if not self.test_host_btn.isEnabled() or not self.test_all_btn.isEnabled():
+            return True
+        return self._log_dialog is not None and self._log_dialog.isVisible()
+
+    def release(self) -> None:
+        super().release()
+        self.cfg_mgr.storage_dir_changed.disconnect(self._on_storage_dir_changed)
+        if self.process_index is not None:
+            self.process_index.changed.disconnect(self._update_running_targets)
+        if self.reachability is not None:
+            self.reachability.updated.disconnect(self._update_host_states)
+            self._freshness_timer.stop()
+
+    def _update_running_targets(self) -> None:
+        running = self.process_index.running() if self.process_index is not None else {}
+        if not running:
+            self.running_targets_label.setText("실행 중인 대상 프로그램이 없습니다.")
+            return
+        parts = []
+        for name, pids in running.items():
+            shown = ", ".join(str(pid) for pid in pids[:6])
+            if len(pids) > 6:
+                shown += f" 외 {len(pids) - 6}개"
+            parts.append(f"{name} ×{len(pids)} (PID {shown})")
+        self.running_targets_label.setText("\n".join(parts))
 
     def _persist_targets(self) -> None:
         raw = [p.strip() for p in self.target_edit.text().split(",") if p.strip()]
@@ -1713,7 +1456,7 @@ class SettingsPanel(FancyCard):
             raw = DEFAULT_TARGETS.copy()
         def updater(cfg: SchedulerConfig) -> None:
             cfg.targets = raw
-        self.cfg_mgr.update(updater)
+        self.cfg_mgr.update(updater, sections=("targets",))
 
     def _persist(self) -> None:
         start = self.startup_toggle.isChecked()
@@ -1721,17 +1464,53 @@ class SettingsPanel(FancyCard):
             cfg.enable_remote_shutdown = self.remote_toggle.isChecked()
             cfg.enable_local_shutdown = self.local_toggle.isChecked()
             cfg.start_with_os = start
+            cfg.storage_journal = self.journal_toggle.isChecked()
             cfg.shutdown_delay = self.delay_spin.value()
-        self.cfg_mgr.update(updater)
+            cfg.terminate_timeout = self.terminate_timeout_spin.value()
+            cfg.terminate_children = self.terminate_children_toggle.isChecked()
+            cfg.remote_backend = self.remote_backend_combo.currentData() or "threads"
+            cfg.remote_concurrency = self.remote_concurrency_spin.value()
+            cfg.remote_prewarm_seconds = self.prewarm_spin.value()
+            cfg.remote_probe_interval = self.probe_interval_spin.value()
+            cfg.remote_lead_seconds = self.remote_lead_spin.value()
+            cfg.audio_preflight_seconds = self.preflight_spin.value()
+            cfg.audio_preflight_copy = self.preflight_copy_toggle.isChecked()
+            cfg.audio_cache_mb = self.audio_cache_spin.value()
+        self.cfg_mgr.update(
+            updater,
+            sections=(
+                "enable_remote_shutdown",
+                "enable_local_shutdown",
+                "start_with_os",
+                "storage_journal",
+                "shutdown_delay",
+                "terminate_timeout",
+                "terminate_children",
+                "remote_backend",
+                "remote_concurrency",
+                "remote_prewarm_seconds",
+                "remote_probe_interval",
+                "remote_lead_seconds",
+                "audio_preflight_seconds",
+                "audio_preflight_copy",
+                "audio_cache_mb",
+            ),
+        )
         set_startup(start)
 
     def _pick_color(self) -> None:
         color = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.cfg_mgr.config.theme_accent), self)
         if color.isValid():
             hex_color = color.name()
-            self.cfg_mgr.update(lambda cfg: setattr(cfg, "theme_accent", hex_color))
+            self.cfg_mgr.update(lambda cfg: setattr(cfg, "theme_accent", hex_color), sections=("theme_accent",))
 
     def sync_from_config(self) -> None:
+        self._sync_fields()
+        self._load_hosts()
+        self._update_config_path_label()
+        self._update_logo_summary(self.cfg_mgr.config.header_logo_path)
+
+    def _sync_fields(self) -> None:
         cfg = self.cfg_mgr.config
         self.target_edit.blockSignals(True)
         self.target_edit.setText(", ".join(cfg.targets))
@@ -1740,6 +1519,9 @@ class SettingsPanel(FancyCard):
             (self.remote_toggle, cfg.enable_remote_shutdown),
             (self.local_toggle, cfg.enable_local_shutdown),
             (self.startup_toggle, cfg.start_with_os),
+            (self.journal_toggle, cfg.storage_journal),
+            (self.terminate_children_toggle, cfg.terminate_children),
+            (self.preflight_copy_toggle, cfg.audio_preflight_copy),
         ):
             toggle.blockSignals(True)
             toggle.setChecked(value)
@@ -1747,9 +1529,35 @@ class SettingsPanel(FancyCard):
         self.delay_spin.blockSignals(True)
         self.delay_spin.setValue(cfg.shutdown_delay)
         self.delay_spin.blockSignals(False)
-        self._load_hosts()
-        self._update_config_path_label()
-        self._update_logo_summary(cfg.header_logo_path)
+        self.terminate_timeout_spin.blockSignals(True)
+        self.terminate_timeout_spin.setValue(cfg.terminate_timeout)
+        self.terminate_timeout_spin.blockSignals(False)
+        self.remote_backend_combo.blockSignals(True)
+        self.remote_backend_combo.setCurrentIndex(max(0, self.remote_backend_combo.findData(cfg.remote_backend)))
+        self.remote_backend_combo.blockSignals(False)
+        self.remote_concurrency_spin.blockSignals(True)
+        self.remote_concurrency_spin.setValue(cfg.remote_concurrency)
+        self.remote_concurrency_spin.blockSignals(False)
+        self.prewarm_spin.blockSignals(True)
+        self.prewarm_spin.setValue(cfg.remote_prewarm_seconds)
+        self.prewarm_spin.blockSignals(False)
+        self.probe_interval_spin.blockSignals(True)
+        self.probe_interval_spin.setValue(cfg.remote_probe_interval)
+        self.probe_interval_spin.blockSignals(False)
+        self.remote_lead_spin.blockSignals(True)
+        self.remote_lead_spin.setValue(cfg.remote_lead_seconds)
+        self.remote_lead_spin.blockSignals(False)
+        self.preflight_spin.blockSignals(True)
+        self.preflight_spin.setValue(cfg.audio_preflight_seconds)
+        self.preflight_spin.blockSignals(False)
+        self.audio_cache_spin.blockSignals(True)
+        self.audio_cache_spin.setValue(cfg.audio_cache_mb)
+        self.audio_cache_spin.blockSignals(False)
+
+    def _on_hosts_changed(self) -> None:
+        # 표에서 직접 고친 내용을 저장하는 중이면 편집 중인 표를 다시 채우지 않는다.
+        if not self._saving_hosts:
+            self._load_hosts()
 
     def _load_hosts(self) -> None:
         self._loading_hosts = True
@@ -1760,10 +1568,36 @@ class SettingsPanel(FancyCard):
             for col, key in enumerate(["host", "username", "password", "method"]):
                 value = host.get(key, "")
                 if key == "method" and not value:
-                    value = "ssh"
+                    value = DEFAULT_REMOTE_METHOD
                 item = QtWidgets.QTableWidgetItem(value)
                 self.host_table.setItem(row, col, item)
+            status_item = QtWidgets.QTableWidgetItem()
+            status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
+            self.host_table.setItem(row, 4, status_item)
         self._loading_hosts = False
+        self._update_host_states()
+
+    def _update_host_states(self) -> None:
+        """캐시에 남은 마지막 검사 결과로 상태 열을 채운다. 새 검사는 하지 않는다."""
+
+        if self.reachability is None:
+            return
+        now = time.time()
+        self._loading_hosts = True
+        try:
+            for row in range(self.host_table.rowCount()):
+                item = self.host_table.item(row, 4)
+                if item is None:
+                    continue
+                entry = {"host": self._table_text(row, 0), "method": self._table_text(row, 3) or DEFAULT_REMOTE_METHOD}
+                state = self.reachability.state_for(entry)
+                item.setText(state.describe(now) if state is not None else "확인 전")
+                if state is not None and state.online is False:
+                    item.setForeground(QtGui.QColor("#C62828"))
+                elif state is not None and state.online:
+                    item.setForeground(QtGui.QColor("#2E7D32"))
+        finally:
+            self._loading_hosts = False
 
     def _table_text(self, row: int, column: int) -> str:
         item = self.host_table.item(row, column)
@@ -1778,12 +1612,16 @@ class SettingsPanel(FancyCard):
                 "host": self._table_text(row, 0),
                 "username": self._table_text(row, 1) or "",
                 "password": self._table_text(row, 2) or "",
-                "method": self._table_text(row, 3) or "ssh",
+                "method": self._table_text(row, 3) or DEFAULT_REMOTE_METHOD,
             }
             if not host_entry["host"]:
                 continue
             hosts.append(host_entry)
-        self.cfg_mgr.update(lambda cfg: setattr(cfg, "remote_hosts", hosts))
+        self._saving_hosts = True
+        try:
+            self.cfg_mgr.update(lambda cfg: setattr(cfg, "remote_hosts", hosts), sections=("remote_hosts",))
+        finally:
+            self._saving_hosts = False
 
     def _test_host(self) -> None:
         row = self.host_table.currentRow()
@@ -1794,7 +1632,7 @@ class SettingsPanel(FancyCard):
             "host": self._table_text(row, 0),
             "username": self._table_text(row, 1) or "",
             "password": self._table_text(row, 2) or "",
-            "method": (self._table_text(row, 3) or "ssh").lower(),
+            "method": (self._table_text(row, 3) or DEFAULT_REMOTE_METHOD).lower(),
         }
         host = entry["host"].strip()
         if not host:
@@ -1823,6 +1661,77 @@ class SettingsPanel(FancyCard):
 
         threading.Thread(target=worker, args=(entry,), daemon=True).start()
 
+    def _test_all_hosts(self) -> None:
+        cfg = self.cfg_mgr.config
+        entries = [
+            {
+                "host": (host.get("host") or "").strip(),
+                "username": host.get("username") or "",
+                "password": host.get("password") or "",
+                "method": remote_method(host),
+            }
+            for host in cfg.remote_hosts
+            if (host.get("host") or "").strip()
+        ]
+        if not entries:
+            show_info_message(self, "안내", "시험할 원격 PC가 없습니다.")
+            return
+        self.test_all_btn.setEnabled(False)
+        self.test_all_btn.setText("시험 중…")
+        self._bulk_total = len(entries)
+        self._bulk_done = 0
+        self._ensure_log_dialog().start_bulk_session(len(entries))
+        workers = max(1, min(cfg.remote_concurrency, len(entries)))
+        threading.Thread(target=self._run_bulk_test, args=(entries, workers), name="BulkHostTest", daemon=True).start()
+
+    def _run_bulk_test(self, entries: List[Dict[str, str]], workers: int) -> None:
+        """작업자 `workers`개로 모든 원격 PC를 동시에 시험하고, 끝나는 순서대로 결과를 알린다."""
+
+        started = time.perf_counter()
+        # 모든 호스트의 도달성을 셀렉터 한 번으로 먼저 확인해, 응답 없는 호스트는 로그인 시도 없이 끝낸다.
+        probes = probe_hosts([remote_probe_target(entry) for entry in entries], timeout=3.0, icmp=True)
+        if self.reachability is not None:
+            self.reachability.record(probes)
+
+        def check(entry: Dict[str, str], probe: ProbeResult) -> Tuple[Dict[str, str], bool, str, float]:
+            host = entry["host"]
+
+            def emit_log(line: str) -> None:
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                self.log_generated.emit(f"[{timestamp}] {host} | {line}")
+
+            host_started = time.perf_counter()
+            try:
+                success, message = self._perform_connection_test(entry, emit_log, probe)
+            except Exception as exc:  # pragma: no cover - 네트워크 예외 보호
+                success, message = False, f"예상치 못한 오류: {exc}"
+            return entry, success, message, time.perf_counter() - host_started
+
+        succeeded = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="BulkHostTest") as executor:
+            futures = [executor.submit(check, entry, probe) for entry, probe in zip(entries, probes)]
+            for future in as_completed(futures):
+                entry, success, message, elapsed = future.result()
+                succeeded += int(success)
+                self.bulk_result.emit(entry["host"], entry["method"], success, elapsed, message)
+        self.bulk_completed.emit(len(entries), succeeded, time.perf_counter() - started)
+
+    def _on_bulk_result(self, host: str, method: str, success: bool, elapsed: float, message: str) -> None:
+        dialog = self._ensure_log_dialog()
+        dialog.add_result(host, method, success, elapsed, message)
+        self._bulk_done += 1
+        dialog.set_summary(f"{self._bulk_done} / {self._bulk_total}대 완료")
+        mark = "✔" if success else "✖"
+        self.log_generated.emit(f"{mark} {host} ({elapsed:.2f}s)")
+
+    def _on_bulk_completed(self, total: int, succeeded: int, elapsed: float) -> None:
+        self.test_all_btn.setEnabled(True)
+        self.test_all_btn.setText("전체 시험")
+        summary = f"전체 {total}대 중 성공 {succeeded}대 · 실패 {total - succeeded}대 · 총 {elapsed:.2f}초"
+        self._ensure_log_dialog().set_summary(summary)
+        self.log_generated.emit("============================================================")
+        self.log_generated.emit(f"SUMMARY> {summary}")
+
     def _ensure_log_dialog(self) -> TerminalLogDialog:
         if self._log_dialog is None:
             self._log_dialog = TerminalLogDialog(self)
@@ -1832,94 +1741,37 @@ class SettingsPanel(FancyCard):
         dialog = self._ensure_log_dialog()
         dialog.append_line(line)
 
-    @staticmethod
-    def _split_host_port(raw: str, default_port: int) -> Tuple[str, int]:
-        target = raw.strip()
-        if not target:
-            return "", default_port
-        if "://" in target:
-            target = target.split("://", 1)[1]
-        if target.startswith("[") and "]" in target:
-            host_part, _, remainder = target.partition("]")
-            host = host_part.strip("[]")
-            if remainder.startswith(":"):
-                try:
-                    return host, int(remainder[1:])
-                except ValueError:
-                    return host, default_port
-            return host, default_port
-        if target.count(":") == 1:
-            name, port_str = target.split(":", 1)
-            if port_str.isdigit():
-                return name, int(port_str)
-        return target, default_port
-
-    @staticmethod
-    def _ping_host(host: str, timeout: int = 2) -> Tuple[Optional[bool], str]:
-        if not shutil.which("ping"):
-            return None, "ping 명령을 찾을 수 없어 포트 연결만 확인했습니다."
-        system = platform.system().lower()
-        if "win" in system:
-            command = ["ping", "-n", "1", "-w", str(max(1, timeout) * 1000), host]
-        else:
-            command = ["ping", "-c", "1", "-W", str(max(1, timeout)), host]
-        try:
-            result = subprocess.run(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                encoding="utf-8",
-                errors="ignore",
-                timeout=max(3, timeout + 2),
-            )
-        except Exception as exc:
-            return None, f"ping 명령을 실행할 수 없습니다: {exc}"
-        output = (result.stdout or "").strip()
-        return (result.returncode == 0), output
-
     def _perform_connection_test(
-        self, entry: Dict[str, str], log: Optional[Callable[[str], None]] = None
+        self,
+        entry: Dict[str, str],
+        log: Optional[Callable[[str], None]] = None,
+        probe: Optional[ProbeResult] = None,
     ) -> Tuple[bool, str]:
         def emit(message: str) -> None:
             if log is not None:
                 log(message)
 
-        method = entry.get("method", "ssh").lower()
-        host_text = entry.get("host", "").strip()
-        if method == "ssh":
-            default_port = 22
-        elif method in {"winrm", "winrm-http"}:
-            default_port = 5985
-        elif method in {"winrm-https"}:
-            default_port = 5986
-        else:
-            default_port = 22
-        host_name, port = self._split_host_port(host_text, default_port)
+        method = remote_method(entry)
+        host_name, port = remote_probe_target(entry)
         if not host_name:
             return False, "호스트 정보를 해석할 수 없습니다."
         emit(f"호스트 분석 완료 → {host_name}:{port}")
-        emit("ping 검사 시작")
-        ping_result, ping_detail = self._ping_host(host_name)
-        if ping_result is False:
-            detail = ping_detail or "네트워크 응답이 없습니다."
-            emit("ping 실패")
-            if ping_detail:
-                for line in ping_detail.splitlines():
-                    emit(f"PING> {line}")
-            return False, f"{host_name}에 ping 응답이 없습니다.\n{detail}"
-        notes: List[str] = []
-        if ping_result is True:
-            notes.append(f"{host_name} ping 응답 확인")
-            emit("ping 성공")
-        elif ping_detail:
-            notes.append(ping_detail)
-            emit("ping 상세 로그 수신")
-            for line in ping_detail.splitlines():
-                emit(f"PING> {line}")
-        else:
-            emit("ping 명령을 사용할 수 없어 포트 검사로 계속 진행")
+        if probe is None:
+            emit("도달성 검사 시작 (TCP 연결 + ICMP)")
+            probe = probe_hosts([(host_name, port)], timeout=3.0, icmp=True)[0]
+            if self.reachability is not None:
+                self.reachability.record([probe])
+        emit(f"PROBE> {probe.describe()}")
+        if probe.icmp_ok is None:
+            emit("ICMP를 사용할 수 없어 포트 검사 결과로 판단")
+        if not probe.reachable:
+            emit("도달성 검사 실패")
+            return False, f"{host_name}에 네트워크 응답이 없습니다.\n{probe.describe()}"
+        notes: List[str] = [f"{host_name} 응답 확인 ({probe.describe()})"]
+        emit("도달성 검사 성공")
         if method == "ssh":
             emit("SSH 연결 시도 준비")
+            paramiko = load_paramiko()
             if not paramiko:
                 details = "Paramiko 모듈이 설치되어 있지 않아 SSH 연결을 시험할 수 없습니다."
                 emit(details)
@@ -1946,17 +1798,14 @@ class SettingsPanel(FancyCard):
                 notes.append(f"{host_name}:{port} SSH 연결 실패: {exc}")
                 emit(f"SSH 예외: {exc}")
                 return False, "\n".join(notes)
+        elif probe.tcp_open:
+            notes.append(f"{host_name}:{port} 포트에 접속할 수 있습니다.")
+            emit("포트 연결 성공")
+            return True, "\n".join(notes)
         else:
-            try:
-                emit(f"소켓 연결 시도 ({host_name}:{port})")
-                with socket.create_connection((host_name, port), timeout=6):
-                    notes.append(f"{host_name}:{port} 포트에 접속할 수 있습니다.")
-                    emit("포트 연결 성공")
-                    return True, "\n".join(notes)
-            except Exception as exc:
-                notes.append(f"{host_name}:{port} 포트 연결 실패: {exc}")
-                emit(f"포트 연결 실패: {exc}")
-                return False, "\n".join(notes)
+            notes.append(f"{host_name}:{port} 포트 연결 실패: {probe.error}")
+            emit(f"포트 연결 실패: {probe.error}")
+            return False, "\n".join(notes)
 
     def _on_test_result(self, success: bool, message: str) -> None:
         self.test_host_btn.setEnabled(True)
@@ -2059,8 +1908,7 @@ class SettingsPanel(FancyCard):
         def updater(cfg: SchedulerConfig) -> None:
             cfg.header_logo_path = path
 
-        self.cfg_mgr.update(updater)
-        self._update_logo_summary(path)
+        self.cfg_mgr.update(updater, sections=("header_logo_path",))
         show_success_message(self, "상단 로고", "선택한 이미지가 상단 바에 적용되었습니다.")
 
     def _clear_logo_image(self) -> None:
@@ -2071,8 +1919,7 @@ class SettingsPanel(FancyCard):
         def updater(cfg: SchedulerConfig) -> None:
             cfg.header_logo_path = None
 
-        self.cfg_mgr.update(updater)
-        self._update_logo_summary(None)
+        self.cfg_mgr.update(updater, sections=("header_logo_path",))
         show_info_message(self, "상단 로고", "기본 로고로 돌아갔습니다.")
 
 class DateRangeDialog(QtWidgets.QDialog):
@@ -2439,6 +2286,19 @@ class TerminalLogDialog(QtWidgets.QDialog):
             "background-color: #071425; color: #6CFFB8; border-radius: 12px; padding: 12px;"
         )
         layout.addWidget(self.output, 1)
+        self.results_table = QtWidgets.QTableWidget(0, 5)
+        self.results_table.setHorizontalHeaderLabels(["호스트", "방식", "결과", "소요(초)", "상세"])
+        self.results_table.horizontalHeader().setStretchLastSection(True)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.results_table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.results_table.setAlternatingRowColors(True)
+        self.results_table.hide()
+        layout.addWidget(self.results_table, 1)
+        self.summary_label = QtWidgets.QLabel()
+        self.summary_label.setProperty("popup-role", "body")
+        self.summary_label.hide()
+        layout.addWidget(self.summary_label)
         self.close_btn = QtWidgets.QPushButton("닫기")
         self.close_btn.clicked.connect(self.hide)
         layout.addWidget(self.close_btn, 0, Qt.AlignRight)
@@ -2446,7 +2306,38 @@ class TerminalLogDialog(QtWidgets.QDialog):
 
     def start_session(self, target: str) -> None:
         self.output.clear()
+        self.results_table.hide()
+        self.summary_label.hide()
         self.append_line(f"▶ {datetime.now():%H:%M:%S} - {target} 연결 시험을 시작합니다")
+        self._present()
+
+    def start_bulk_session(self, count: int) -> None:
+        self.output.clear()
+        self.results_table.setRowCount(0)
+        self.results_table.show()
+        self.summary_label.setText(f"0 / {count}대 완료")
+        self.summary_label.show()
+        self.append_line(f"▶ {datetime.now():%H:%M:%S} - 원격 PC {count}대 전체 연결 시험을 시작합니다")
+        self._present()
+
+    def add_result(self, host: str, method: str, success: bool, elapsed: float, message: str) -> None:
+        row = self.results_table.rowCount()
+        self.results_table.insertRow(row)
+        detail = message.splitlines()[-1] if message else ""
+        values = [host, method.upper(), "성공" if success else "실패", f"{elapsed:.2f}", detail]
+        for col, value in enumerate(values):
+            item = QtWidgets.QTableWidgetItem(value)
+            if col == 2:
+                item.setForeground(QtGui.QColor("#2E7D32" if success else "#C62828"))
+            if col == 4:
+                item.setToolTip(message)
+            self.results_table.setItem(row, col, item)
+        self.results_table.scrollToBottom()
+
+    def set_summary(self, text: str) -> None:
+        self.summary_label.setText(text)
+
+    def _present(self) -> None:
         self.show()
         self.raise_()
         self.activateWindow()
@@ -2567,8 +2458,15 @@ class DashboardCard(FancyCard):
         action.setCursor(Qt.PointingHandCursor)
         action.clicked.connect(self.request_force_run.emit)
         self.body_layout.addWidget(action)
+        self._run: Optional[UpcomingRun] = None
+        # 스케줄러는 다음 기한까지 잠들어 있으므로 남은 시간 표시는 카드가 직접 갱신한다.
+        self._countdown_timer = QtCore.QTimer(self)
+        self._countdown_timer.setInterval(30_000)
+        self._countdown_timer.timeout.connect(lambda: self.update_next_run(self._run))
+        self._countdown_timer.start()
 
     def update_next_run(self, run: Optional[UpcomingRun]) -> None:
+        self._run = run
         if run is None:
             self.timer_label.setText("예정된 실행이 없습니다")
             self.detail_label.setText("활성화된 요일과 휴일 설정을 확인하세요")
@@ -2642,7 +2540,7 @@ class TodaySummaryCard(FancyCard):
             self.local_value.setText("-")
             return
         self.status_value.setText("예정된 일정이 활성화되어 있습니다")
-        self.time_value.setText(day_cfg.time)
+        self.time_value.setText(", ".join(day_cfg.slot_times()) or day_cfg.time)
         if audio_preview:
             name = Path(audio_preview).name
             self.audio_value.setText(name)
@@ -2749,6 +2647,10 @@ def create_tray_icon(accent_color: str) -> QIcon:
     return QIcon(pixmap)
 
 
+# 창이 트레이에 숨은 채 이 시간(초)이 지나면 처음 열 때 만든 페이지를 다시 지운다.
+LAZY_PAGE_RELEASE_SECONDS = 600
+
+
 class MainWindow(QtWidgets.QMainWindow):
     show_login_requested = Signal()
     logout_requested = Signal()
@@ -2761,27 +2663,43 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setFixedSize(1040, 720)
         self.cfg_mgr = cfg_mgr
         self._brand_icon = brand_icon
-        self.scheduler = SchedulerEngine(cfg_mgr)
-        self.audio_service = AudioService()
-        self.audio_service.set_volume(self.cfg_mgr.config.audio_volume)
+        # 예약 실행은 화면 없이도 도는 실행기가 맡고, 창은 그 신호를 받아 표시만 한다.
+        with STARTUP_TRACE.phase("실행기 생성"):
+            self.runner = ScheduleRunner(cfg_mgr, AudioService(), AudioPreflight(), parent=self)
+        self.scheduler = self.runner.scheduler
+        self.audio_service = self.runner.audio_service
+        self.audio_cache = self.runner.audio_cache
+        self.ssh_pool = self.runner.ssh_pool
+        self.reachability = self.runner.reachability
+        self.process_index = self.runner.process_index
         self.overlay = StatusOverlay()
-        self._pending_follow_up: Optional[Tuple[bool, bool]] = None
-        self._playback_mode: str = "idle"
-        self._active_day_key: Optional[str] = None
         self._cards: List[FancyCard] = []
-        self._ignore_playback_finished = False
         self._mode: str = "user"
         self._locked: bool = True
         self._secret_clicks: int = 0
         self._last_secret_time: float = 0.0
         self.tray: Optional[QtWidgets.QSystemTrayIcon] = None
-        self._build_palette()
+        self.assignment_preview: Optional[AutoAssignmentPreviewCard] = None
+        self.holiday_panel: Optional[HolidayPanel] = None
+        self.settings_panel: Optional[SettingsPanel] = None
+        # 페이지 이름 -> (자리 위젯, 만드는 함수), 만들어진 페이지 -> (넣은 위젯, 카드)
+        self._lazy_pages: Dict[str, Tuple[QtWidgets.QWidget, Callable[[], Tuple[QtWidgets.QWidget, FancyCard]]]] = {}
+        self._built_pages: Dict[str, Tuple[QtWidgets.QWidget, FancyCard]] = {}
+        self._release_timer = QtCore.QTimer(self)
+        self._release_timer.setSingleShot(True)
+        self._release_timer.setInterval(LAZY_PAGE_RELEASE_SECONDS * 1000)
+        self._release_timer.timeout.connect(self._release_hidden_pages)
+        with STARTUP_TRACE.phase("팔레트"):
+            self._build_palette()
         initial_icon = self._brand_icon or create_tray_icon(self.cfg_mgr.config.theme_accent)
         self.setWindowIcon(initial_icon)
-        self._build_ui()
+        with STARTUP_TRACE.phase("화면 구성"):
+            self._build_ui()
         self._connect_signals()
-        self.scheduler.start()
-        self._update_header_logo(self.cfg_mgr.config.header_logo_path)
+        with STARTUP_TRACE.phase("실행기 시작"):
+            self.runner.start()
+        with STARTUP_TRACE.phase("상단 로고"):
+            self._update_header_logo(self.cfg_mgr.config.header_logo_path)
 
     def _build_palette(self) -> None:
         accent = QtGui.QColor(self.cfg_mgr.config.theme_accent)
@@ -3044,33 +2962,18 @@ class MainWindow(QtWidgets.QMainWindow):
         day_page = self._wrap_scroll(day_wrapper)
 
         self.playlist_panel = PlaylistPanel(self.cfg_mgr, self.cfg_mgr.config.theme_accent)
-        self.assignment_preview = AutoAssignmentPreviewCard(self.cfg_mgr, self.cfg_mgr.config.theme_accent)
         playlist_wrapper = QtWidgets.QWidget()
         playlist_layout = QtWidgets.QVBoxLayout(playlist_wrapper)
         playlist_layout.setContentsMargins(24, 20, 24, 24)
         playlist_layout.setSpacing(16)
         playlist_layout.addWidget(self.playlist_panel)
-        playlist_layout.addWidget(self.assignment_preview)
+        playlist_layout.addWidget(self._lazy_slot("플레이리스트", self._build_assignment_preview))
         playlist_layout.addStretch(1)
         playlist_page = self._wrap_scroll(playlist_wrapper)
 
-        self.holiday_panel = HolidayPanel(self.cfg_mgr, self.cfg_mgr.config.theme_accent)
-        holiday_wrapper = QtWidgets.QWidget()
-        holiday_layout = QtWidgets.QVBoxLayout(holiday_wrapper)
-        holiday_layout.setContentsMargins(24, 20, 24, 24)
-        holiday_layout.setSpacing(16)
-        holiday_layout.addWidget(self.holiday_panel)
-        holiday_layout.addStretch(1)
-        holiday_page = self._wrap_scroll(holiday_wrapper)
-
-        self.settings_panel = SettingsPanel(self.cfg_mgr, self.cfg_mgr.config.theme_accent)
-        settings_wrapper = QtWidgets.QWidget()
-        settings_layout = QtWidgets.QVBoxLayout(settings_wrapper)
-        settings_layout.setContentsMargins(24, 20, 24, 24)
-        settings_layout.setSpacing(16)
-        settings_layout.addWidget(self.settings_panel)
-        settings_layout.addStretch(1)
-        settings_page = self._wrap_scroll(settings_wrapper)
+        # 휴일·고급 설정 페이지와 배정 미리보기는 처음 열 때 만든다(`_ensure_page`).
+        holiday_page = self._lazy_slot("휴일", self._build_holiday_page)
+        settings_page = self._lazy_slot("고급 설정", self._build_settings_page)
 
         page_definitions = [
             ("홈", home_page),
@@ -3106,9 +3009,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.log_card,
                 *self.day_cards.values(),
                 self.playlist_panel,
-                self.assignment_preview,
-                self.holiday_panel,
-                self.settings_panel,
             ]
         )
         self._set_active_page("홈")
@@ -3119,6 +3019,95 @@ class MainWindow(QtWidgets.QMainWindow):
         self.logo_label.installEventFilter(self)
         self.set_mode("user")
 
+    def _lazy_slot(
+        self, name: str, factory: Callable[[], Tuple[QtWidgets.QWidget, FancyCard]]
+    ) -> QtWidgets.QWidget:
+        """나중에 만들 페이지가 들어갈 빈 자리를 만든다."""
+
+        slot = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(slot)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._lazy_pages[name] = (slot, factory)
+        return slot
+
+    def _build_assignment_preview(self) -> Tuple[QtWidgets.QWidget, FancyCard]:
+        self.assignment_preview = AutoAssignmentPreviewCard(self.cfg_mgr, self.cfg_mgr.config.theme_accent)
+        return self.assignment_preview, self.assignment_preview
+
+    def _build_holiday_page(self) -> Tuple[QtWidgets.QWidget, FancyCard]:
+        self.holiday_panel = HolidayPanel(self.cfg_mgr, self.cfg_mgr.config.theme_accent)
+        holiday_wrapper = QtWidgets.QWidget()
+        holiday_layout = QtWidgets.QVBoxLayout(holiday_wrapper)
+        holiday_layout.setContentsMargins(24, 20, 24, 24)
+        holiday_layout.setSpacing(16)
+        holiday_layout.addWidget(self.holiday_panel)
+        holiday_layout.addStretch(1)
+        return self._wrap_scroll(holiday_wrapper), self.holiday_panel
+
+    def _build_settings_page(self) -> Tuple[QtWidgets.QWidget, FancyCard]:
+        self.settings_panel = SettingsPanel(
+            self.cfg_mgr,
+            self.cfg_mgr.config.theme_accent,
+            reachability=self.reachability,
+            process_index=self.process_index,
+        )
+        settings_wrapper = QtWidgets.QWidget()
+        settings_layout = QtWidgets.QVBoxLayout(settings_wrapper)
+        settings_layout.setContentsMargins(24, 20, 24, 24)
+        settings_layout.setSpacing(16)
+        settings_layout.addWidget(self.settings_panel)
+        settings_layout.addStretch(1)
+        return self._wrap_scroll(settings_wrapper), self.settings_panel
+
+    def _ensure_page(self, name: str) -> None:
+        """아직 만들지 않은 페이지면 지금 만들어 자리에 넣는다."""
+
+        if name not in self._lazy_pages or name in self._built_pages:
+            return
+        slot, factory = self._lazy_pages[name]
+        widget, card = factory()
+        slot.layout().addWidget(widget)
+        self._built_pages[name] = (widget, card)
+        self._cards.append(card)
+
+    def _release_page(self, name: str) -> None:
+        widget, card = self._built_pages.pop(name)
+        card.release()
+        self._cards.remove(card)
+        if card is self.assignment_preview:
+            self.assignment_preview = None
+        elif card is self.holiday_panel:
+            self.holiday_panel = None
+        elif card is self.settings_panel:
+            self.settings_panel = None
+        widget.hide()
+        widget.deleteLater()
+
+    def _release_hidden_pages(self) -> None:
+        """트레이에 숨은 채 오래 지나면 나중에 만든 페이지를 지워 메모리를 돌려준다."""
+
+        if self.isVisible():
+            return
+        busy = False
+        for name in list(self._built_pages):
+            card = self._built_pages[name][1]
+            if isinstance(card, SettingsPanel) and card.is_busy():
+                busy = True
+                continue
+            self._release_page(name)
+        if busy:
+            self._release_timer.start()
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:  # pragma: no cover - Qt callback
+        self._release_timer.stop()
+        self._ensure_page(self.page_title.text())
+        super().showEvent(event)
+
+    def hideEvent(self, event: QtGui.QHideEvent) -> None:  # pragma: no cover - Qt callback
+        if self._built_pages:
+            self._release_timer.start()
+        super().hideEvent(event)
+
     def _wrap_scroll(self, content: QtWidgets.QWidget) -> QtWidgets.QScrollArea:
         scroll = QtWidgets.QScrollArea()
         scroll.setWidgetResizable(True)
@@ -3169,6 +3158,7 @@ class MainWindow(QtWidgets.QMainWindow):
         index = self._page_indices.get(name)
         if index is None:
             return
+        self._ensure_page(name)
         current = self.content_stack.currentIndex()
         if current != index:
             self.content_stack.setCurrentIndex(index)
@@ -3185,7 +3175,7 @@ class MainWindow(QtWidgets.QMainWindow):
         day_cfg = cfg.days.get(today_key)
         if not day_cfg or not day_cfg.enabled:
             return None
-        return predict_playlist_for_day(cfg, today_key)
+        return self.cfg_mgr.calendar.predict_for_day(today_key)
 
     def _on_next_run_changed(self, run: Optional[UpcomingRun]) -> None:
         self.dashboard.update_next_run(run)
@@ -3194,22 +3184,8 @@ class MainWindow(QtWidgets.QMainWindow):
     def _update_today_summary(self) -> None:
         self.today_card.update_from_config(self.cfg_mgr.config, self._preview_audio_for_today())
 
-    def _append_shutdown_log(self, kind: str, detail: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        def updater(cfg: SchedulerConfig) -> None:
-            entry = {"at": timestamp, "type": kind, "detail": detail}
-            cfg.shutdown_logs.insert(0, entry)
-            del cfg.shutdown_logs[30:]
-
-        self.cfg_mgr.update(updater)
-
     def _clear_logs(self) -> None:
-        self.cfg_mgr.update(lambda cfg: setattr(cfg, "shutdown_logs", []))
-
-    def _on_day_card_changed(self, _: str) -> None:
-        self.scheduler._compute_next_run()
-        self._update_today_summary()
+        self.cfg_mgr.update(lambda cfg: setattr(cfg, "shutdown_logs", []), sections=("shutdown_logs",))
 
     def _create_tray(self) -> None:
         self.tray = QtWidgets.QSystemTrayIcon(create_tray_icon(self.cfg_mgr.config.theme_accent), self)
@@ -3219,7 +3195,7 @@ class MainWindow(QtWidgets.QMainWindow):
         menu.addSeparator()
         exit_action = menu.addAction("완전히 종료")
         show_action.triggered.connect(self._handle_tray_show)
-        run_action.triggered.connect(self._force_execute)
+        run_action.triggered.connect(self.runner.force_run)
         exit_action.triggered.connect(self._exit_all)
         self.tray.setContextMenu(menu)
         self.tray.setToolTip(APP_NAME)
@@ -3227,12 +3203,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tray.show()
 
     def _connect_signals(self) -> None:
-        self.dashboard.request_force_run.connect(self._force_execute)
-        self.scheduler.schedule_triggered.connect(self._on_schedule_triggered)
+        self.dashboard.request_force_run.connect(self.runner.force_run)
         self.scheduler.next_run_changed.connect(self._on_next_run_changed)
-        self.audio_service.playback_started.connect(self._on_playback_started)
-        self.audio_service.playback_finished.connect(self._on_playback_finished)
         self.audio_service.playback_error.connect(self._on_playback_error)
+        self.runner.stage_message.connect(self.overlay.show_message)
+        self.runner.stage_cleared.connect(self.overlay.hide)
+        self.runner.notice.connect(self._show_notice)
+        self.runner.mode_changed.connect(self._on_mode_changed)
         preview_signal = getattr(self.playlist_panel, "preview_requested", None)
         if preview_signal is not None:
             preview_signal.connect(self._on_preview_requested)
@@ -3243,9 +3220,7 @@ class MainWindow(QtWidgets.QMainWindow):
             stop_signal.connect(self._on_stop_preview)
         else:
             self.playlist_panel.add_stop_preview_listener(self._on_stop_preview)
-        self.cfg_mgr.config_changed.connect(self._on_config_changed)
-        for card in self.day_cards.values():
-            card.changed.connect(self._on_day_card_changed)
+        self._subscribe_config_sections()
         self.info_button.clicked.connect(self._show_credits_dialog)
 
     def _apply_theme(self, accent: str) -> None:
@@ -3266,19 +3241,26 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog.exec()
 
 
-    def _on_config_changed(self, cfg: SchedulerConfig) -> None:
-        self.audio_service.set_volume(cfg.audio_volume)
+    def _subscribe_config_sections(self) -> None:
+        """창 전체를 다시 그리지 않도록 바뀐 설정 항목에 해당하는 부분만 갱신한다.
+
+        각 패널은 생성될 때 자기 항목을 직접 구독하며, 여기서는 창 수준의 요소만 연결한다.
+        """
+
+        subscribe = self.cfg_mgr.subscribe
+        subscribe({"theme_accent"}, self._on_theme_changed)
+        subscribe({"header_logo_path"}, lambda cfg: self._update_header_logo(cfg.header_logo_path))
+        subscribe(SCHEDULE_SECTIONS, lambda _: self._on_schedule_changed())
+        subscribe({"shutdown_logs"}, lambda cfg: self.log_card.update_logs(cfg.shutdown_logs))
+
+    def _on_theme_changed(self, cfg: SchedulerConfig) -> None:
         self._apply_theme(cfg.theme_accent)
+        # 기본 로고는 테마 색상으로 그리므로 함께 다시 만든다.
         self._update_header_logo(cfg.header_logo_path)
-        self.playlist_panel.refresh()
-        self.assignment_preview.refresh()
-        self.holiday_panel.refresh()
-        self.settings_panel.sync_from_config()
-        for card in self.day_cards.values():
-            card.sync_from_config()
-        self._update_today_summary()
-        self.log_card.update_logs(cfg.shutdown_logs)
+
+    def _on_schedule_changed(self) -> None:
         self.scheduler._compute_next_run()
+        self._update_today_summary()
 
     def _generate_header_logo(self) -> QtGui.QPixmap:
         width, height = 320, 56
@@ -3435,160 +3417,82 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.logout_requested.emit()
 
-    def _on_schedule_triggered(self, day_key: str, audio_path: str, allow_remote: bool, allow_local: bool) -> None:
-        if (
-            self._playback_mode == "schedule"
-            and self._active_day_key == day_key
-            and self.audio_service.is_playing_source(audio_path)
-        ):
-            prev_remote, prev_local = self._pending_follow_up or (False, False)
-            self._pending_follow_up = (prev_remote or allow_remote, prev_local or allow_local)
-            return
-        if self.audio_service.player.playbackState() != QMediaPlayer.StoppedState:
-            if self._playback_mode == "schedule":
-                self._pending_follow_up = None
-            if self._playback_mode != "idle":
-                self._ignore_playback_finished = True
-            self.overlay.hide()
-            self.audio_service.stop()
-        self._active_day_key = day_key
-        self._pending_follow_up = (allow_remote, allow_local)
-        self._playback_mode = "schedule"
-        day_label = DAY_LABEL[day_key]
-        terminate_programs(self.cfg_mgr.config.targets)
-        if audio_path:
-            self.overlay.show_message(f"{day_label} 일정 실행 준비 - {Path(audio_path).name}")
-        else:
-            self.overlay.show_message(f"{day_label} 일정 실행 준비")
+    def _show_notice(self, message: str, level: str, msec: int) -> None:
         if self.tray:
-            self.tray.showMessage(APP_NAME, f"{day_label} 일정이 시작되었습니다.", QtWidgets.QSystemTrayIcon.Information, 3000)
-        self.audio_service.play(audio_path)
+            icon = QtWidgets.QSystemTrayIcon.Warning if level == "warning" else QtWidgets.QSystemTrayIcon.Information
+            self.tray.showMessage(APP_NAME, message, icon, msec)
 
-    def _force_execute(self) -> None:
-        now_key = DAY_KEYS[datetime.now().weekday()]
-        cfg = self.cfg_mgr.config
-        day_cfg = cfg.days[now_key]
-        audio = self.scheduler._resolve_audio(cfg, day_cfg) or ""
-        allow_remote = cfg.enable_remote_shutdown and day_cfg.allow_remote
-        allow_local = cfg.enable_local_shutdown and day_cfg.allow_local_shutdown
-        self._on_schedule_triggered(now_key, audio, allow_remote, allow_local)
+    def _on_mode_changed(self, mode: str) -> None:
+        if mode == "idle":
+            self._update_today_summary()
 
     def _on_preview_requested(self, path: str) -> None:
-        if self._playback_mode == "schedule":
+        if not self.runner.preview(path):
             show_warning_message(self, "진행 중", "일정 실행 중에는 미리 듣기를 사용할 수 없습니다.")
-            return
-        if self.audio_service.player.playbackState() != QMediaPlayer.StoppedState:
-            self._ignore_playback_finished = True
-            self.audio_service.stop()
-        self._pending_follow_up = None
-        self._active_day_key = None
-        self.overlay.hide()
-        self._playback_mode = "preview"
-        self.audio_service.play(path)
-        if self.tray:
-            self.tray.showMessage(APP_NAME, f"미리 듣기: {Path(path).name}", QtWidgets.QSystemTrayIcon.Information, 3000)
 
     def _on_stop_preview(self) -> None:
-        if self._playback_mode == "preview":
-            self.audio_service.stop()
-        else:
+        if not self.runner.stop_preview():
             show_info_message(self, "안내", "현재 미리 듣기 중이 아닙니다.")
 
-    def _on_playback_started(self, path: str) -> None:
-        if self._playback_mode != "schedule":
-            return
-        day_label = DAY_LABEL.get(self._active_day_key or "", "일정")
-        name = Path(path).name if path else "음성 없음"
-        self.overlay.show_message(f"{day_label} - {name} 재생 중")
-
     def _on_playback_error(self, path: str, message: str) -> None:
         readable = Path(path).name if path else "음성 파일"
         detail = message or "음성 재생 중 오류가 발생했습니다."
         body = f"{readable}\n{detail}" if readable else detail
         show_error_message(self, "재생 오류", body)
-        if self.tray:
-            self.tray.showMessage(APP_NAME, f"재생 오류: {detail}", QtWidgets.QSystemTrayIcon.Warning, 4000)
-        if self._playback_mode == "schedule":
-            day_label = DAY_LABEL.get(self._active_day_key or "", "일정")
-            self.overlay.show_message(f"{day_label} - 음성 재생 실패, 다음 단계 진행")
-
-    def _on_playback_finished(self, _: str) -> None:
-        if self._ignore_playback_finished:
-            self._ignore_playback_finished = False
-            return
-        if self._playback_mode == "schedule":
-            allow_remote, allow_local = self._pending_follow_up or (False, False)
-            cfg_snapshot = self.cfg_mgr.config
-            if self._active_day_key:
-                day_cfg = cfg_snapshot.days.get(self._active_day_key)
-            else:
-                day_cfg = None
-            if day_cfg is not None:
-                allow_remote = allow_remote and cfg_snapshot.enable_remote_shutdown and day_cfg.allow_remote
-                allow_local = allow_local and cfg_snapshot.enable_local_shutdown and day_cfg.allow_local_shutdown
-            else:
-                allow_remote = allow_remote and cfg_snapshot.enable_remote_shutdown
-                allow_local = allow_local and cfg_snapshot.enable_local_shutdown
-            self._pending_follow_up = None
-            self.overlay.hide()
-            if allow_remote:
-                hosts = [host.get("host", "") for host in self.cfg_mgr.config.remote_hosts if host.get("host")]
-                detail = ", ".join(hosts) if hosts else "등록된 대상 없음"
-                self._append_shutdown_log("원격 종료", detail)
-                threading.Thread(target=shutdown_remote, args=(self.cfg_mgr.config.remote_hosts,), daemon=True).start()
-            if allow_local:
-                self._append_shutdown_log(
-                    "본체 종료",
-                    f"{self.cfg_mgr.config.shutdown_delay}초 후 종료",
-                )
-                threading.Thread(target=shutdown_local, args=(self.cfg_mgr.config.shutdown_delay,), daemon=True).start()
-            if self.tray:
-                self.tray.showMessage(APP_NAME, "일정 실행이 완료되었습니다.", QtWidgets.QSystemTrayIcon.Information, 3000)
-            self.scheduler._compute_next_run()
-        elif self._playback_mode == "preview":
-            if self.tray:
-                self.tray.showMessage(APP_NAME, "미리 듣기가 종료되었습니다.", QtWidgets.QSystemTrayIcon.Information, 2000)
-        self._playback_mode = "idle"
-        self._active_day_key = None
-        self._update_today_summary()
 
     def _exit_all(self) -> None:
-        self.scheduler.stop()
-        self.audio_service.stop()
+        self.runner.stop()
         self.tray.hide()
         QtWidgets.QApplication.quit()
 
 
 class App(QtWidgets.QApplication):
-    def __init__(self, argv: List[str]) -> None:
-        super().__init__(argv)
+    def __init__(self, argv: List[str], control: Optional[ControlServer] = None) -> None:
+        with STARTUP_TRACE.phase("QApplication 생성"):
+            super().__init__(argv)
         QtCore.QCoreApplication.setApplicationName(APP_NAME)
         QtCore.QCoreApplication.setApplicationVersion(APP_VERSION)
         QtCore.QCoreApplication.setOrganizationName(ORGANIZATION_NAME)
         QtCore.QCoreApplication.setOrganizationDomain(ORGANIZATION_DOMAIN)
         self.setQuitOnLastWindowClosed(False)
-        self.cfg_mgr = ConfigManager()
-        brand_icon = _load_brand_icon()
-        accent = self.cfg_mgr.config.theme_accent
-        tray_icon = create_tray_icon(accent)
-        self.setWindowIcon(brand_icon or tray_icon)
-        self.window = MainWindow(self.cfg_mgr, brand_icon)
+        with STARTUP_TRACE.phase("설정 불러오기"):
+            self.cfg_mgr = ConfigManager()
+        with STARTUP_TRACE.phase("아이콘"):
+            brand_icon = _load_brand_icon()
+            accent = self.cfg_mgr.config.theme_accent
+            tray_icon = create_tray_icon(accent)
+            self.setWindowIcon(brand_icon or tray_icon)
+        with STARTUP_TRACE.phase("창 만들기"):
+            self.window = MainWindow(self.cfg_mgr, brand_icon)
         self.window.set_locked(True)
         self.window.show_login_requested.connect(lambda: self._show_user_login(initial=False))
         self.window.logout_requested.connect(self._lock_from_user)
         self.window.admin_login_requested.connect(self._show_admin_login)
         self.window.help_requested.connect(self._show_help)
+        if control is not None:
+            install_control_commands(control, self.window.runner)
+            control.register("show", self._show_from_control)
+            self.aboutToQuit.connect(control.stop)
         self._show_user_login(initial=True)
 
+    def _show_from_control(self, _: Dict[str, object]) -> Dict[str, object]:
+        # 로그인 창은 모달이므로 제어 요청에 먼저 답한 뒤에 띄운다.
+        QtCore.QTimer.singleShot(0, self.window._handle_tray_show)
+        return {"locked": self.window.is_locked()}
+
     def _show_user_login(self, *, initial: bool) -> None:
         if not self.window.is_locked():
             return
-        prompt = PasswordPrompt(
-            "일반 사용자 로그인",
-            "일반 사용자 비밀번호를 입력하세요.",
-            lambda pw: verify_password(self.cfg_mgr.config.user_password_hash, pw),
-            parent=self.window,
-        )
+        with STARTUP_TRACE.phase("로그인 창 준비"):
+            prompt = PasswordPrompt(
+                "일반 사용자 로그인",
+                "일반 사용자 비밀번호를 입력하세요.",
+                lambda pw: verify_password(self.cfg_mgr.config.user_password_hash, pw),
+                parent=self.window,
+            )
+        if initial:
+            # 로그인 창이 떠서 이벤트 루프가 처음 돌 때를 시작 완료로 본다.
+            QtCore.QTimer.singleShot(0, lambda: STARTUP_TRACE.finish(startup_trace_path(), "gui"))
         result = prompt.exec()
         if result == QtWidgets.QDialog.Accepted:
             self.window.set_locked(False)
@@ -3651,5 +3555,13 @@ class App(QtWidgets.QApplication):
 
 
 if __name__ == "__main__":
-    app = App(sys.argv)
-    sys.exit(app.exec())
\ No newline at end of file
+    if _import_profiler is not None:
+        sys.exit(_import_profiler.finish([("Qt Multimedia", load_multimedia), ("paramiko", load_paramiko)]))
+    control = ControlServer()
+    with STARTUP_TRACE.phase("제어 채널 열기"):
+        started = control.start()
+    if not started:
+        print(f"{APP_NAME}가 이미 실행 중입니다.", file=sys.stderr)
+        sys.exit(1)
+    app = App(sys.argv, control)
+    sys.exit(app.exec())
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+AutoClose Studio 로컬 제어 채널 (클라이언트 쪽)
+
+실행 중인 인스턴스는 사용자별 이름 있는 파이프(Windows) 또는 유닉스 소켓으로 제어 요청을 받는다.
+요청과 응답은 JSON 한 덩어리씩 주고받는다.
+
+    요청  {"cmd": "status", "args": {}}
+    응답  {"ok": true, "result": {...}}  또는  {"ok": false, "error": "..."}
+
+이 모듈은 표준 라이브러리만 쓰므로 두 번째 실행이 Qt·paramiko를 불러오기 전에
+인자를 넘기고 바로 끝낼 수 있다. 서버 쪽은 `autoclose_core.ControlServer`다.
+
+    python desktop_scheduler_qt.py status
+    python desktop_scheduler_qt.py next-run
+    python desktop_scheduler_qt.py force-run
+    python desktop_scheduler_qt.py reload
+    python desktop_scheduler_qt.py patch audio_volume=0.5 enable_remote_shutdown=false
+    python desktop_scheduler_qt.py patch --admin terminate_timeout=10 targets='["a.exe"]'
+
+`patch`는 음량·사용 여부 같은 운영 항목만 바꾼다. 그 밖의 항목은 `--admin`으로 관리자 비밀번호를
+입력해야 바꿀 수 있고, 비밀번호 해시는 제어 채널로 바꿀 수 없다. `force-run`은 프로그램과 PC를
+바로 종료하므로 항상 관리자 비밀번호를 묻는다. 제어 명령이 아닌 인자는 명령으로 보지 않고
+인자 없이 실행한 것처럼 다룬다.
+"""
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import stat
+import sys
+import tempfile
+from multiprocessing.connection import Client
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+CONTROL_NAME = "AutoCloseStudio"
+# 응답을 기다리는 최대 시간(초). 명령은 GUI 스레드에서 처리되므로 넉넉히 둔다.
+CONTROL_TIMEOUT = 5.0
+CONTROL_MAX_BYTES = 1024 * 1024
+
+# 인자 없이 두 번째로 실행하면 보내는 명령(이미 떠 있는 창을 앞으로 꺼낸다).
+DEFAULT_FORWARD_COMMAND = "show"
+CONTROL_COMMANDS = ("show", "status", "next-run", "force-run", "reload", "patch")
+# `patch`로 운영 항목 밖의 설정을 바꿀 때 관리자 비밀번호를 묻는 옵션.
+ADMIN_OPTION = "--admin"
+# 옵션 없이도 항상 관리자 비밀번호를 묻는 명령.
+ADMIN_COMMANDS = ("force-run",)
+
+
+def control_address() -> Tuple[str, str]:
+    """이 사용자의 제어 채널 주소와 `multiprocessing.connection` 주소 종류."""
+
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    safe_user = "".join(ch if ch.isalnum() else "_" for ch in user) or "user"
+    if sys.platform.startswith("win"):
+        # 파이프 기본 보안 설정은 만든 사용자와 관리자만 쓰기를 허용한다.
+        return rf"\\.\pipe\{CONTROL_NAME}-{safe_user}", "AF_PIPE"
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(runtime) if runtime else Path(tempfile.gettempdir()) / f"autoclose-{safe_user}"
+    return str(base / f"{CONTROL_NAME}.sock"), "AF_UNIX"
+
+
+def control_dir_error(directory: Path) -> Optional[str]:
+    """유닉스 소켓 폴더를 이 사용자만 쓸 수 있는지 확인하고, 아니면 그 이유를 돌려준다.
+
+    임시 폴더의 `autoclose-<사용자>`는 다른 사용자가 먼저 만들어 소켓을 가로챌 수 있으므로
+    이 사용자 소유의 실제 폴더이고 권한이 0o700일 때만 쓴다.
+    """
+
+    try:
+        info = os.lstat(directory)
+    except OSError as exc:
+        return str(exc)
+    if not stat.S_ISDIR(info.st_mode):
+        return "폴더가 아닙니다."
+    if info.st_uid != os.getuid():
+        return "다른 사용자가 만든 폴더입니다."
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        return f"권한이 {stat.S_IMODE(info.st_mode):o}입니다(700이어야 함)."
+    return None
+
+
+def encode_message(message: Dict[str, object]) -> bytes:
+    return json.dumps(message, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def decode_message(payload: bytes) -> Dict[str, object]:
+    message = json.loads(payload.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("제어 메시지는 JSON 객체여야 합니다.")
+    return message
+
+
+def send_command(
+    command: str, args: Optional[Dict[str, object]] = None, timeout: float = CONTROL_TIMEOUT
+) -> Optional[Dict[str, object]]:
+    """실행 중인 인스턴스에 명령을 보내고 응답을 돌려준다. 받는 인스턴스가 없으면 None."""
+
+    address, family = control_address()
+    if family == "AF_UNIX" and control_dir_error(Path(address).parent):
+        # 남이 만든 폴더의 소켓에는 명령(관리자 비밀번호 포함)을 보내지 않는다.
+        return None
+    try:
+        conn = Client(address, family)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    except OSError:
+        # 남은 소켓 파일이나 닫히는 중인 파이프도 "실행 중인 인스턴스 없음"으로 본다.
+        return None
+    with conn:
+        conn.send_bytes(encode_message({"cmd": command, "args": args or {}}))
+        if not conn.poll(timeout):
+            return {"ok": False, "error": f"{timeout:g}초 안에 응답이 없습니다."}
+        try:
+            return decode_message(conn.recv_bytes(CONTROL_MAX_BYTES))
+        except (EOFError, OSError, ValueError) as exc:
+            return {"ok": False, "error": f"응답을 읽을 수 없습니다: {exc}"}
+
+
+def _parse_value(raw: str) -> object:
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def parse_command_line(argv: List[str]) -> Tuple[str, Dict[str, object]]:
+    """실행 인자에서 제어 명령과 인자를 꺼낸다. `--`로 시작하는 실행 옵션은 무시한다.
+
+    첫 인자가 제어 명령이 아니면(Qt 옵션, 탐색기에서 넘긴 파일 경로 등) 인자가 없을 때와 같다.
+    `ADMIN_COMMANDS`와 `--admin`을 붙인 `patch`는 관리자 비밀번호를 입력받아 함께 보낸다.
+    """
+
+    words = [arg for arg in argv[1:] if not arg.startswith("--")]
+    if not words or words[0].lower() not in CONTROL_COMMANDS:
+        return DEFAULT_FORWARD_COMMAND, {}
+    command, rest = words[0].lower(), words[1:]
+    if command in ADMIN_COMMANDS:
+        return command, {"admin_password": _read_admin_password()}
+    if command != "patch":
+        return command, {}
+    values: Dict[str, object] = {}
+    for word in rest:
+        if word.lstrip().startswith("{"):
+            parsed = _parse_value(word)
+            if not isinstance(parsed, dict):
+                raise ValueError(f"JSON 객체가 아닙니다: {word}")
+            values.update(parsed)
+            continue
+        key, sep, raw = word.partition("=")
+        if not sep or not key:
+            raise ValueError(f"'이름=값' 형식이 아닙니다: {word}")
+        values[key.strip()] = _parse_value(raw)
+    if not values:
+        raise ValueError("바꿀 설정을 '이름=값' 또는 JSON 객체로 지정하세요.")
+    if ADMIN_OPTION in argv[1:]:
+        return command, {"values": values, "admin_password": _read_admin_password()}
+    return command, {"values": values}
+
+
+def _read_admin_password() -> str:
+    # 다른 프로세스 목록에 드러나지 않도록 실행 인자가 아니라 입력으로 받는다.
+    try:
+        return getpass.getpass("관리자 비밀번호: ")
+    except (EOFError, KeyboardInterrupt):
+        raise ValueError("관리자 비밀번호를 입력받지 못했습니다.") from None
+
+
+def forward_to_running_instance(argv: List[str]) -> Optional[int]:
+    """이미 실행 중인 인스턴스가 있으면 인자를 넘기고 종료 코드를 돌려준다.
+
+    인스턴스가 없고 인자가 제어 명령도 아니면 None을 돌려주어 호출한 쪽이 정상 시작하게 한다.
+    """
+
+    try:
+        command, args = parse_command_line(argv)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    response = send_command(command, args)
+    if response is None:
+        if command == DEFAULT_FORWARD_COMMAND:
+            return None
+        print("실행 중인 AutoClose Studio가 없습니다.", file=sys.stderr)
+        return 1
+    if not response.get("ok"):
+        print(response.get("error") or "명령을 처리하지 못했습니다.", file=sys.stderr)
+        return 1
+    result = response.get("result")
+    if result is not None:
+        print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+    return 0
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""
+AutoClose Studio 시작 성능 측정 도구
+
+* `STARTUP_TRACE`: 시작 단계별 소요 시간을 재어 첫 화면이 뜬 뒤 설정 폴더의
+  `startup_trace.jsonl`에 한 줄씩 남긴다(최근 `STARTUP_TRACE_KEEP`개만 유지).
+  `benchmarks/startup_time.py`가 이 기록으로 첫 실행·재실행 시간을 비교한다.
+* `ImportProfiler`: `--profile-imports`로 실행하면 진입점이 불러오는 모듈마다 걸린 시간을 재어 보고서를 남긴다.
+  `python -X importtime`과 같은 방식(자기 시간·누적 시간)이지만, 패키징된 exe처럼
+  인터프리터 옵션을 줄 수 없는 환경에서도 쓸 수 있도록 import 훅으로 직접 잰다.
+
+    python desktop_scheduler_qt.py --profile-imports
+    python desktop_scheduler_qt.py --headless --profile-imports=imports.txt
+
+  보고서는 지정한 파일(기본: 임시 폴더의 AutoCloseStudio-imports.txt)에 쓰고, 콘솔이 있으면 함께 출력한다.
+
+진입점이 가장 먼저 불러오는 모듈이므로 측정 대상에 섞이지 않도록 표준 라이브러리만 쓴다.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from importlib.abc import MetaPathFinder
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+STARTUP_TRACE_FILE = "startup_trace.jsonl"
+STARTUP_TRACE_KEEP = 30
+
+PROFILE_IMPORTS_OPTION = "--profile-imports"
+DEFAULT_IMPORT_REPORT = "AutoCloseStudio-imports.txt"
+# 보고서에 자세히 적는 모듈 수(누적 시간 순).
+IMPORT_REPORT_LIMIT = 40
+
+
+class StartupTrace:
+    """시작 단계별 소요 시간을 모아 두었다가 `finish()`에서 기록 한 줄로 남긴다.
+
+    단계는 `with STARTUP_TRACE.phase("이름"):`으로 감싸며 중첩할 수 있고, `mark()`는 시점만 남긴다.
+    시각은 이 모듈을 처음 불러온 때를 0으로 한 밀리초다. 기록을 남긴 뒤의 단계는 무시한다.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._depth = 0
+        self.phases: List[Dict[str, object]] = []
+        self.finished = False
+        self._listeners: List[Callable[[Dict[str, object]], None]] = []
+
+    def _offset(self) -> float:
+        return round((time.perf_counter() - self._origin) * 1000, 2)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self.finished:
+            yield
+            return
+        entry: Dict[str, object] = {"name": name, "start_ms": self._offset(), "depth": self._depth}
+        self.phases.append(entry)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            entry["ms"] = round(self._offset() - entry["start_ms"], 2)
+
+    def mark(self, name: str) -> None:
+        if not self.finished:
+            self.phases.append({"name": name, "start_ms": self._offset(), "depth": self._depth})
+
+    def add_listener(self, callback: Callable[[Dict[str, object]], None]) -> None:
+        """기록을 남긴 직후 그 기록(dict)으로 호출할 함수를 등록한다."""
+
+        self._listeners.append(callback)
+
+    def finish(self, path: Optional[Path], mode: str) -> Optional[Dict[str, object]]:
+        """첫 화면이 뜬 시점에 한 번 불러 기록을 `path`에 덧붙이고 그 기록을 돌려준다."""
+
+        if self.finished:
+            return None
+        record: Dict[str, object] = {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "mode": mode,
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "total_ms": self._offset(),
+        }
+        record["phases"] = self.phases
+        self.finished = True
+        if path is not None:
+            try:
+                self._append(Path(path), record)
+            except OSError as exc:
+                print(f"[시작 기록 저장 실패] {exc}")
+        for callback in self._listeners:
+            callback(record)
+        return record
+
+    @staticmethod
+    def _append(path: Path, record: Dict[str, object]) -> None:
+        lines: List[str] = []
+        if path.exists():
+            lines = path.read_text(encoding="utf-8").splitlines()[-(STARTUP_TRACE_KEEP - 1):]
+        lines.append(json.dumps(record, ensure_ascii=False))
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+STARTUP_TRACE = StartupTrace()
+
+
+class _TimedLoader:
+    """원래 로더에 위임하면서 모듈을 만들고 실행하는 시간을 잰다."""
+
+    def __init__(self, loader, profiler: "ImportProfiler", name: str) -> None:
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, attr: str):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        self._profiler._enter(self._name)
+        try:
+            create = getattr(self._loader, "create_module", None)
+            return create(spec) if create is not None else None
+        except BaseException:
+            self._profiler._leave(self._name)
+            raise
+
+    def exec_module(self, module) -> None:
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._leave(self._name)
+
+
+class ImportProfiler(MetaPathFinder):
+    """`sys.meta_path` 맨 앞에서 새로 불러오는 모듈의 자기 시간과 누적 시간을 기록한다.
+
+    확장 모듈(Qt 등)은 DLL을 여는 시간이 `create_module`에 들어가므로 그 시점부터 잰다.
+    """
+
+    def __init__(self, report_path: Optional[Path] = None) -> None:
+        self.report_path = report_path
+        self.phase = "시작 경로"
+        # 모듈 이름 -> (단계, 자기 시간, 누적 시간, 깊이)
+        self.records: Dict[str, Tuple[str, float, float, int]] = {}
+        self._stack: List[List[object]] = []  # [이름, 시작 시각, 하위 모듈 누적 시간]
+        self._finding = False
+        self._started = time.perf_counter()
+
+    @classmethod
+    def from_argv(cls, argv: Sequence[str]) -> Optional["ImportProfiler"]:
+        """실행 인자에 `--profile-imports`가 있으면 측정을 시작한 프로파일러를 돌려준다."""
+
+        for arg in argv[1:]:
+            if arg == PROFILE_IMPORTS_OPTION or arg.startswith(PROFILE_IMPORTS_OPTION + "="):
+                _, _, path = arg.partition("=")
+                profiler = cls(Path(path) if path else None)
+                profiler.install()
+                return profiler
+        return None
+
+    def install(self) -> "ImportProfiler":
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        if self._finding:
+            return None
+        self._finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self:
+                    continue
+                find = getattr(finder, "find_spec", None)
+                if find is None:
+                    continue
+                spec = find(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._finding = False
+        if spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = _TimedLoader(spec.loader, self, fullname)
+        return spec
+
+    def _enter(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _leave(self, name: str) -> None:
+        if not self._stack or self._stack[-1][0] != name:
+            return
+        _, started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+        if self._stack:
+            self._stack[-1][2] += cumulative
+        self.records[name] = (self.phase, cumulative - children, cumulative, len(self._stack))
+
+    def measure(self, phase: str, loader: Callable[[], object]) -> float:
+        """`loader`를 실행해 그동안 불러온 모듈을 `phase` 단계로 기록하고 걸린 시간을 돌려준다."""
+
+        self.phase = phase
+        started = time.perf_counter()
+        loader()
+        return time.perf_counter() - started
+
+    def report(self, startup: float, deferred: Sequence[Tuple[str, float]] = ()) -> str:
+        def summary(phase: str, elapsed: float) -> str:
+            count = sum(1 for record in self.records.values() if record[0] == phase)
+            return f"{phase:<24} 모듈 {count:4d}개 · {elapsed * 1000:8.1f} ms"
+
+        loaded = sum(record[2] for record in self.records.values() if record[0] == "시작 경로" and record[3] == 0)
+        lines = [
+            "AutoClose Studio 모듈 불러오기 시간",
+            "",
+            summary("시작 경로", loaded) + f" (측정 시작부터 {startup * 1000:.1f} ms)",
+        ]
+        lines += [summary(f"지연 로딩: {label}", elapsed) for label, elapsed in deferred]
+        lines += ["", f"{'자기':>8} {'누적':>8}  단계 / 모듈"]
+        ranked = sorted(self.records.items(), key=lambda item: item[1][2], reverse=True)
+        for name, (phase, own, cumulative, depth) in ranked[:IMPORT_REPORT_LIMIT]:
+            lines.append(f"{own * 1000:8.1f} {cumulative * 1000:8.1f}  {phase} / {'  ' * depth}{name}")
+        return "\n".join(lines) + "\n"
+
+    def finish(self, deferred: Sequence[Tuple[str, Callable[[], object]]] = ()) -> int:
+        """처음 쓸 때 불러오는 모듈을 따로 재어 보고서를 쓰고 종료 코드를 돌려준다."""
+
+        startup = time.perf_counter() - self._started
+        timings = [(label, self.measure(f"지연 로딩: {label}", loader)) for label, loader in deferred]
+        self.uninstall()
+        text = self.report(startup, timings)
+        target = self.report_path or Path(tempfile.gettempdir()) / DEFAULT_IMPORT_REPORT
+        try:
+            target.write_text(text, encoding="utf-8")
+        except OSError as exc:
+            text += f"\n보고서를 저장하지 못했습니다: {exc}\n"
+        else:
+            text += f"\n보고서: {target}\n"
+        if sys.stdout is not None:
+            sys.stdout.write(text)
+        return 0
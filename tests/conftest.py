@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""공용 준비: 설정 폴더를 임시 폴더로 돌리고 Qt 이벤트 루프를 하나 만든다(창 시험도 같은 루프를 쓴다)."""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+# autoclose_core가 불러올 때 기본 설정 폴더를 정하므로 그 전에 바꿔 둔다.
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="autoclose_test_")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from PySide6 import QtWidgets  # noqa: E402
+
+import autoclose_core  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """테스트마다 빈 설정 폴더를 쓴다."""
+
+    monkeypatch.setattr(autoclose_core.CONFIG_LOCATOR, "_config_dir", tmp_path)
+    return tmp_path
+
+
+def wait_until(qapp, predicate, timeout: float = 5.0) -> bool:
+    """이벤트를 돌리며 `predicate()`가 참이 될 때까지 기다린다."""
+
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        qapp.processEvents()
+        time.sleep(0.01)
+    return True
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""음성 로컬 캐시."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import autoclose_core as core
+
+
+def test_replaced_source_is_a_miss_until_resynced(qapp, tmp_path):
+    source = tmp_path / "share" / "bell.mp3"
+    source.parent.mkdir()
+    source.write_bytes(b"old")
+    cache = core.AudioCache(tmp_path / "cache", lambda: [str(source)])
+    cache.sync()
+    assert Path(cache.lookup(str(source))).read_bytes() == b"old"
+
+    # 같은 경로에 다른 파일을 넣으면 이전 사본을 쓰지 않는다.
+    source.write_bytes(b"newer")
+    os.utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 1_000_000_000))
+    assert cache.lookup(str(source)) is None
+    cache.sync()
+    assert Path(cache.lookup(str(source))).read_bytes() == b"newer"
+
+    # 다시 불러온 색인도 원본 크기·수정 시각을 기억한다.
+    reloaded = core.AudioCache(tmp_path / "cache", lambda: [str(source)])
+    assert Path(reloaded.lookup(str(source))).read_bytes() == b"newer"
+
+
+def test_unreachable_source_uses_last_copy(qapp, tmp_path):
+    source = tmp_path / "bell.mp3"
+    source.write_bytes(b"data")
+    cache = core.AudioCache(tmp_path / "cache", lambda: [str(source)])
+    cache.sync()
+    source.unlink()
+    assert Path(cache.lookup(str(source))).read_bytes() == b"data"
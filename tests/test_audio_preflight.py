@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""예약 시각 전 음성 파일 사전 점검."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from PySide6 import QtCore
+
+import autoclose_core as core
+import desktop_scheduler_qt as gui
+from conftest import wait_until
+
+RUN_AT = datetime(2026, 10, 12, 9, 0)
+
+
+class FakePreflight(QtCore.QObject):
+    finished = QtCore.Signal(str, bool, str, float, str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.checked = []
+
+    def busy(self) -> bool:
+        return False
+
+    def check(self, path, cache=None) -> None:
+        self.checked.append((path, cache))
+
+
+def _runner(config_dir, preflight, **settings):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+
+    def prepare(cfg: core.SchedulerConfig) -> None:
+        cfg.audio_preflight_seconds = 60
+        for key, value in settings.items():
+            setattr(cfg, key, value)
+
+    cfg_mgr.update(prepare)
+    return core.ScheduleRunner(cfg_mgr, core.AudioBackend(), preflight, clock=lambda: RUN_AT - timedelta(seconds=30))
+
+
+def _run(path: str) -> core.UpcomingRun:
+    return core.UpcomingRun(RUN_AT, "mon", path, False, False, True, "09:00")
+
+
+def test_missing_file_fails_without_loading_multimedia(qapp, tmp_path):
+    preflight = gui.AudioPreflight()
+    results = []
+    preflight.finished.connect(lambda *args: results.append(args))
+    missing = str(tmp_path / "없는 파일.mp3")
+    preflight.check(missing)
+    assert preflight.busy()
+    # 점검 중에는 다른 요청을 받지 않는다.
+    preflight.check(str(tmp_path / "other.mp3"))
+    assert wait_until(qapp, lambda: bool(results))
+    path, success, message, duration, local = results[0]
+    assert (path, success, duration, local) == (missing, False, 0.0, "")
+    assert "찾을 수 없습니다" in message
+    assert preflight.player is None
+    assert not preflight.busy()
+    assert len(results) == 1
+
+
+def test_each_run_is_checked_once(qapp, config_dir):
+    preflight = FakePreflight()
+    runner = _runner(config_dir, preflight)
+    try:
+        runner._schedule_audio_preflight(_run("a.mp3"))
+        runner._schedule_audio_preflight(_run("a.mp3"))
+        assert preflight.checked == [("a.mp3", None)]
+        # 같은 회차라도 음성이 바뀌면 다시 점검한다.
+        runner._schedule_audio_preflight(_run("b.mp3"))
+        assert [path for path, _ in preflight.checked] == ["a.mp3", "b.mp3"]
+    finally:
+        runner.stop()
+
+
+def test_copy_option_hands_the_cache_to_the_check(qapp, config_dir):
+    preflight = FakePreflight()
+    runner = _runner(config_dir, preflight, audio_preflight_copy=True)
+    try:
+        runner._schedule_audio_preflight(_run("a.mp3"))
+        assert preflight.checked == [("a.mp3", runner.audio_cache)]
+    finally:
+        runner.stop()
+
+
+def test_results_feed_duration_or_warn(qapp, config_dir):
+    preflight = FakePreflight()
+    runner = _runner(config_dir, preflight)
+    notices = []
+    runner.notice.connect(lambda text, level, ms: notices.append((text, level)))
+    try:
+        preflight.finished.emit("a.mp3", True, "재생 준비 완료", 12.5, "")
+        assert runner.audio_service.duration_for("a.mp3") == 12.5
+        assert notices == []
+
+        preflight.finished.emit("b.mp3", False, "지원하지 않는 형식", 0.0, "")
+        assert notices and notices[0][1] == "warning" and "b.mp3" in notices[0][0]
+        log = runner.cfg_mgr.config.shutdown_logs[-1]
+        assert log["type"] == "음성 사전 점검" and "지원하지 않는 형식" in log["detail"]
+    finally:
+        runner.stop()
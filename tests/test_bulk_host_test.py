@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""원격 PC 목록 `전체 시험`의 동시 실행과 결과 보고."""
+from __future__ import annotations
+
+import threading
+import time
+
+import autoclose_core as core
+import desktop_scheduler_qt as gui
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def emit(self, *args) -> None:
+        self.calls.append(args)
+
+
+class _Panel:
+    """`SettingsPanel._run_bulk_test`가 쓰는 속성만 가진 가짜 패널."""
+
+    def __init__(self, reachability, delay: float) -> None:
+        self.reachability = reachability
+        self.log_generated = _Recorder()
+        self.bulk_result = _Recorder()
+        self.bulk_completed = _Recorder()
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def _perform_connection_test(self, entry, log, probe):
+        if not probe.reachable:
+            return gui.SettingsPanel._perform_connection_test(self, entry, log, probe)
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        log("로그인 시험")
+        time.sleep(self.delay[entry["host"]])
+        with self.lock:
+            self.active -= 1
+        return True, "ok"
+
+
+def test_all_hosts_are_probed_once_and_checked_concurrently(qapp, monkeypatch):
+    entries = [{"host": f"10.0.5.{i}", "method": "ssh", "username": "", "password": ""} for i in range(1, 7)]
+    offline = "10.0.5.1"
+    probe_calls = []
+
+    def fake_probe(targets, timeout, icmp=False):
+        probe_calls.append(list(targets))
+        return [
+            core.ProbeResult(host, port, tcp_open=None, error="응답 없음")
+            if host == offline
+            else core.ProbeResult(host, port, tcp_open=True, tcp_rtt=0.01)
+            for host, port in targets
+        ]
+
+    monkeypatch.setattr(gui, "probe_hosts", fake_probe)
+    cache = core.HostReachabilityCache(lambda: entries, interval=0)
+    delays = {entry["host"]: 0.2 for entry in entries}
+    delays["10.0.5.3"] = 0.01
+    panel = _Panel(cache, delays)
+
+    started = time.monotonic()
+    gui.SettingsPanel._run_bulk_test(panel, entries, 3)
+    assert time.monotonic() - started < 0.9
+
+    # 도달성은 한 번에 모두 확인하고 캐시에 남긴다.
+    assert probe_calls == [[(entry["host"], 22) for entry in entries]]
+    assert cache.state_for({"host": offline, "method": "ssh"}).failures == 1
+    assert panel.peak == 3
+
+    results = panel.bulk_result.calls
+    assert sorted(host for host, *_ in results) == sorted(entry["host"] for entry in entries)
+    # 응답 없는 호스트와 빨리 끝난 호스트가 먼저 보고된다.
+    assert {host for host, *_ in results[:2]} == {offline, "10.0.5.3"}
+    assert [success for host, _, success, _, _ in results if host == offline] == [False]
+    assert panel.bulk_completed.calls[0][:2] == (6, 5)
+    assert any(line.startswith("[") and "10.0.5.2 | 로그인 시험" in line for (line,) in panel.log_generated.calls)
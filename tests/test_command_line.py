@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""두 번째 실행의 인자 해석."""
+from __future__ import annotations
+
+import pytest
+
+import autoclose_control as control
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["app"],
+        ["app", "--headless"],
+        ["app", "-platform", "offscreen"],
+        ["app", "C:\\음성\\안내.mp3"],
+        ["app", "unknown", "status"],
+    ],
+)
+def test_non_command_arguments_start_normally(argv, monkeypatch):
+    monkeypatch.setattr(control, "send_command", lambda command, args: None)
+    assert control.parse_command_line(argv) == (control.DEFAULT_FORWARD_COMMAND, {})
+    # 실행 중인 인스턴스가 없으면 오류 없이 정상 시작하게 한다.
+    assert control.forward_to_running_instance(argv) is None
+
+
+def test_commands_are_case_insensitive():
+    assert control.parse_command_line(["app", "Status"]) == ("status", {})
+
+
+def test_force_run_prompts_for_admin_password(monkeypatch):
+    monkeypatch.setattr(control.getpass, "getpass", lambda prompt: "secret")
+    assert control.parse_command_line(["app", "force-run"]) == ("force-run", {"admin_password": "secret"})
+
+
+def test_patch_admin_option_prompts(monkeypatch):
+    monkeypatch.setattr(control.getpass, "getpass", lambda prompt: "secret")
+    assert control.parse_command_line(["app", "patch", "audio_volume=0.5"]) == (
+        "patch",
+        {"values": {"audio_volume": 0.5}},
+    )
+    assert control.parse_command_line(["app", "patch", "--admin", "terminate_timeout=10"]) == (
+        "patch",
+        {"values": {"terminate_timeout": 10}, "admin_password": "secret"},
+    )
+
+
+def test_bad_patch_value_is_reported(capsys):
+    assert control.forward_to_running_instance(["app", "patch", "audio_volume"]) == 2
+    assert "이름=값" in capsys.readouterr().err
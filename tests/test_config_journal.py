@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""설정 저널 모드의 기록·재적용."""
+from __future__ import annotations
+
+import json
+
+import autoclose_core as core
+
+
+def _journal_manager() -> core.ConfigManager:
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    cfg_mgr.update(lambda cfg: setattr(cfg, "storage_journal", True))
+    return cfg_mgr
+
+
+def test_replay_restores_changes(qapp, config_dir):
+    cfg_mgr = _journal_manager()
+    cfg_mgr.update(lambda cfg: setattr(cfg, "audio_volume", 0.3))
+    cfg_mgr.update(lambda cfg: setattr(cfg.days["mon"], "last_ran", "2026-10-12"))
+    assert cfg_mgr.journal_file.exists()
+    reloaded = core.ConfigManager(write_interval=None)
+    assert reloaded.config.as_dict() == cfg_mgr.config.as_dict()
+
+
+def test_change_after_torn_line_survives(qapp, config_dir):
+    cfg_mgr = _journal_manager()
+    cfg_mgr.update(lambda cfg: setattr(cfg, "audio_volume", 0.3))
+    journal = cfg_mgr.journal_file
+    with journal.open("a", encoding="utf-8") as handle:
+        handle.write('{"seq": 99, "set": {"audio_vol')
+
+    # 끊긴 줄을 만난 뒤 덧붙인 변경도 다음에 읽을 때 살아 있어야 한다.
+    after_crash = core.ConfigManager(write_interval=None)
+    assert after_crash.config.audio_volume == 0.3
+    after_crash.update(lambda cfg: setattr(cfg, "playlist_rotation", 7))
+
+    reloaded = core.ConfigManager(write_interval=None)
+    assert reloaded.config.audio_volume == 0.3
+    assert reloaded.config.playlist_rotation == 7
+    assert all(json.loads(line)["seq"] for line in journal.read_text(encoding="utf-8").splitlines())
+
+
+def test_exit_without_changes_writes_nothing(qapp, config_dir):
+    cfg_mgr = _journal_manager()
+    cfg_mgr.update(lambda cfg: setattr(cfg, "audio_volume", 0.3))
+    cfg_mgr._flush_on_exit()
+    snapshot = cfg_mgr.locator.config_file
+    stamp = snapshot.stat().st_mtime_ns
+
+    idle = core.ConfigManager(write_interval=None)
+    writes = idle.write_count
+    idle._flush_on_exit()
+    assert idle.write_count == writes
+    assert snapshot.stat().st_mtime_ns == stamp
+    assert not idle.journal_file.exists()
+
+
+def test_journal_bytes_match_file_size(qapp, config_dir):
+    cfg_mgr = _journal_manager()
+    for volume in (0.1, 0.2, 0.3):
+        cfg_mgr.update(lambda cfg, volume=volume: setattr(cfg, "holiday_labels", {"2026-01-01": f"신정 {volume}"}))
+    assert cfg_mgr._journal_bytes == cfg_mgr.journal_file.stat().st_size
+
+
+def test_journal_without_snapshot_applies_over_defaults(qapp, config_dir, capsys):
+    cfg_mgr = _journal_manager()
+    cfg_mgr.update(lambda cfg: setattr(cfg, "audio_volume", 0.3))
+    cfg_mgr.locator.config_file.unlink(missing_ok=True)
+    cfg_mgr.locator.config_file.with_suffix(".json.bak").unlink(missing_ok=True)
+    assert cfg_mgr.journal_file.exists()
+    capsys.readouterr()
+
+    reloaded = core.ConfigManager(write_interval=None)
+    assert "기본 설정 위에 저널을 적용" in capsys.readouterr().out
+    defaults = core.SchedulerConfig()
+    assert reloaded.config.audio_volume == 0.3
+    # 저널에 없는 항목은 빈 값이 아니라 기본값이어야 한다.
+    assert reloaded.config.targets == defaults.targets
+    assert list(reloaded.config.days) == list(defaults.days)
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""설정 스냅샷의 공유 규칙과 비교 후 교체(CAS) 갱신."""
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+
+import pytest
+
+import autoclose_core as core
+
+
+def test_held_snapshot_is_not_touched_by_update(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    revision, held = cfg_mgr.snapshot()
+    before = held.as_dict()
+
+    cfg_mgr.update(lambda cfg: setattr(cfg, "audio_volume", 0.25))
+    cfg_mgr.update(lambda cfg: cfg.days["mon"].extra_times.append("12:30"))
+
+    assert held.as_dict() == before
+    assert cfg_mgr.snapshot()[0] == revision + 2
+    assert cfg_mgr.config is not held
+
+
+def test_failed_updater_leaves_snapshot(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    snapshot = cfg_mgr.snapshot()
+
+    def _broken(cfg: core.SchedulerConfig) -> None:
+        cfg.audio_volume = 0.1
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cfg_mgr.update(_broken)
+    assert cfg_mgr.snapshot() is snapshot
+
+
+def test_concurrent_updates_are_not_lost(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    revision = cfg_mgr.snapshot()[0]
+
+    def _bump(cfg: core.SchedulerConfig) -> None:
+        cfg.playlist_rotation += 1
+
+    def _worker() -> None:
+        for _ in range(50):
+            cfg_mgr.update(_bump, sections=("playlist_rotation",))
+
+    threads = [threading.Thread(target=_worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cfg_mgr.config.playlist_rotation == 400
+    assert cfg_mgr.snapshot()[0] == revision + 400
+
+
+def test_read_paths_do_not_mutate_shared_config(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+
+    def _setup(cfg: core.SchedulerConfig) -> None:
+        cfg.enable_remote_shutdown = False
+        for day in cfg.days.values():
+            day.extra_times = ["18:00", "12:00"]
+
+    cfg_mgr.update(_setup)
+    shared = cfg_mgr.config
+    before = shared.as_dict()
+
+    engine = core.SchedulerEngine(cfg_mgr, clock=lambda: datetime(2026, 10, 14, 11, 0))
+    assert engine.next_run() is not None
+    cfg_mgr.calendar.upcoming(horizon_days=7, now=datetime(2026, 10, 14, 11, 0))
+    runner = core.ScheduleRunner(cfg_mgr, core.CommandAudioService())
+    try:
+        runner.status()
+        runner.next_run_info()
+    finally:
+        runner.stop()
+
+    assert shared.as_dict() == before
+    assert cfg_mgr.config is shared
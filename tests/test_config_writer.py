@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""변경을 모아 두었다가 한 번에 기록하는 설정 지연 기록."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import autoclose_core as core
+from conftest import wait_until
+
+
+@pytest.fixture
+def delayed(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=0.2)
+    yield cfg_mgr
+    cfg_mgr._flush_on_exit()
+
+
+def _on_disk(cfg_mgr: core.ConfigManager) -> dict:
+    return json.loads(cfg_mgr.locator.config_file.read_text(encoding="utf-8"))
+
+
+def test_burst_is_written_once(qapp, delayed):
+    before = delayed.write_count
+    for index in range(50):
+        delayed.update(lambda cfg, index=index: setattr(cfg, "playlist_rotation", index))
+    # 호출한 스레드에서는 기록하지 않는다.
+    assert delayed.write_count == before
+    assert wait_until(qapp, lambda: delayed.write_count > before)
+    wait_until(qapp, lambda: False, timeout=0.4)
+    assert delayed.write_count == before + 1
+    assert _on_disk(delayed)["playlist_rotation"] == 49
+
+
+def test_flush_writes_now_and_only_when_dirty(qapp, delayed):
+    before = delayed.write_count
+    delayed.update(lambda cfg: setattr(cfg, "audio_volume", 0.4))
+    delayed.flush()
+    assert delayed.write_count == before + 1
+    assert _on_disk(delayed)["audio_volume"] == 0.4
+    delayed.flush()
+    wait_until(qapp, lambda: False, timeout=0.4)
+    assert delayed.write_count == before + 1
+
+
+def test_without_interval_every_update_is_written(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    before = cfg_mgr.write_count
+    for volume in (0.1, 0.2, 0.3):
+        cfg_mgr.update(lambda cfg, volume=volume: setattr(cfg, "audio_volume", volume))
+        assert _on_disk(cfg_mgr)["audio_volume"] == volume
+    assert cfg_mgr.write_count == before + 3
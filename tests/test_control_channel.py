@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""제어 채널 소켓 폴더 확인(유닉스)."""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+
+import pytest
+
+import autoclose_control as control
+import autoclose_core as core
+from conftest import wait_until
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="유닉스 소켓 전용")
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "runtime"
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(directory))
+    return directory
+
+
+def test_private_dir_is_used(qapp, runtime_dir):
+    server = core.ControlServer()
+    assert server.start()
+    try:
+        assert control.control_dir_error(runtime_dir) is None
+        # 요청은 Qt 이벤트 루프에서 처리되므로 보내는 쪽은 따로 돌린다.
+        replies = []
+        threading.Thread(target=lambda: replies.append(control.send_command("ping")), daemon=True).start()
+        assert wait_until(qapp, lambda: bool(replies))
+        assert replies[0]["ok"]
+    finally:
+        server.stop()
+
+
+def test_shared_dir_is_refused(qapp, runtime_dir):
+    runtime_dir.mkdir(mode=0o755)
+    os.chmod(runtime_dir, 0o755)
+    assert control.control_dir_error(runtime_dir)
+    server = core.ControlServer()
+    # 단일 실행 확인은 못 하지만 시작은 막지 않고, 그 폴더에 소켓을 만들지 않는다.
+    assert server.start()
+    assert server._listener is None
+    assert not (runtime_dir / f"{control.CONTROL_NAME}.sock").exists()
+    assert control.send_command("ping") is None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="소유자를 바꾸려면 root 권한 필요")
+def test_dir_owned_by_other_user_is_refused(runtime_dir):
+    runtime_dir.mkdir(mode=0o700)
+    os.chown(runtime_dir, 12345, 12345)
+    assert "다른 사용자" in control.control_dir_error(runtime_dir)
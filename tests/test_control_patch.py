@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""제어 채널 `patch` 명령이 바꿀 수 있는 항목과 `force-run`의 관리자 비밀번호 확인."""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import autoclose_core as core
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.handlers = {}
+
+    def register(self, command, handler) -> None:
+        self.handlers[command] = handler
+
+
+@pytest.fixture
+def patch(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    server = _Server()
+    core.install_control_commands(server, SimpleNamespace(cfg_mgr=cfg_mgr))
+    return cfg_mgr, server.handlers["patch"]
+
+
+def test_operational_keys_without_password(patch):
+    cfg_mgr, handler = patch
+    result = handler({"values": {"audio_volume": 0.5, "enable_remote_shutdown": False}})
+    assert result["changed"] == ["audio_volume", "enable_remote_shutdown"]
+    assert cfg_mgr.config.audio_volume == 0.5
+    assert cfg_mgr.config.enable_remote_shutdown is False
+
+
+@pytest.mark.parametrize("key, value", [("targets", ["evil.exe"]), ("remote_hosts", []), ("admin_password_hash", "x")])
+def test_other_keys_need_admin_password(patch, key, value):
+    cfg_mgr, handler = patch
+    before = cfg_mgr.config.as_dict()
+    with pytest.raises(PermissionError):
+        handler({"values": {key: value, "audio_volume": 0.1}})
+    with pytest.raises(PermissionError):
+        handler({"values": {key: value}, "admin_password": "wrong"})
+    assert cfg_mgr.config.as_dict() == before
+
+
+def test_admin_password_allows_other_keys_but_not_hashes(patch):
+    cfg_mgr, handler = patch
+    admin = {"admin_password": core.DEFAULT_ADMIN_PASSWORD}
+    handler({"values": {"targets": ["a.exe"]}, **admin})
+    assert cfg_mgr.config.targets == ["a.exe"]
+    for key in core.CONTROL_PATCH_FORBIDDEN:
+        with pytest.raises(PermissionError):
+            handler({"values": {key: core.hash_password("new")}, **admin})
+    assert core.verify_password(cfg_mgr.config.admin_password_hash, core.DEFAULT_ADMIN_PASSWORD)
+
+
+def test_force_run_needs_admin_password(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    runs = []
+    runner = SimpleNamespace(
+        cfg_mgr=cfg_mgr, force_run=lambda: runs.append(True), playback_mode="schedule", active_day_key="mon"
+    )
+    server = _Server()
+    core.install_control_commands(server, runner)
+    handler = server.handlers["force-run"]
+    with pytest.raises(PermissionError):
+        handler({})
+    with pytest.raises(PermissionError):
+        handler({"admin_password": "wrong"})
+    assert runs == []
+    assert handler({"admin_password": core.DEFAULT_ADMIN_PASSWORD}) == {"mode": "schedule", "day": "mon"}
+    assert runs == [True]
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""화면 없는 모드의 명령 재생기와 예약 실행 흐름."""
+from __future__ import annotations
+
+import sys
+
+import autoclose_core as core
+from conftest import wait_until
+
+
+def _sleeping_player(seconds: float):
+    def command(path, volume):
+        return [sys.executable, "-c", f"import time; time.sleep({seconds})"]
+
+    return command
+
+
+def _runner(config_dir, audio=None):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+
+    def prepare(cfg: core.SchedulerConfig) -> None:
+        cfg.targets = []
+        cfg.enable_remote_shutdown = False
+        cfg.enable_local_shutdown = True
+        for day in cfg.days.values():
+            day.allow_local_shutdown = True
+
+    cfg_mgr.update(prepare)
+    runner = core.ScheduleRunner(cfg_mgr, audio or core.CommandAudioService())
+    follow_ups = []
+    runner._run_follow_up = lambda remote, local: follow_ups.append((remote, local))
+    return runner, follow_ups
+
+
+def test_stop_reports_finished_immediately(qapp, config_dir, monkeypatch):
+    monkeypatch.setattr(core, "playback_command", _sleeping_player(30))
+    audio = config_dir / "a.mp3"
+    audio.write_bytes(b"x")
+    service = core.CommandAudioService()
+    finished = []
+    service.playback_finished.connect(finished.append)
+    service.play(str(audio))
+    assert service.is_active()
+    service.stop()
+    assert finished == [str(audio.resolve())]
+    assert not service.is_active()
+    # 끝낸 재생기의 종료가 늦게 도착해도 다시 알리지 않는다.
+    qapp.processEvents()
+    wait_until(qapp, lambda: False, timeout=0.5)
+    assert len(finished) == 1
+
+
+def test_retrigger_during_command_playback_runs_follow_up(qapp, config_dir, monkeypatch):
+    audio = config_dir / "a.mp3"
+    audio.write_bytes(b"x")
+    monkeypatch.setattr(core, "playback_command", _sleeping_player(30))
+    runner, follow_ups = _runner(config_dir)
+    runner.trigger("mon", str(audio), False, True)
+    assert runner.playback_mode == "schedule"
+
+    # 재생 중에 다른 일정이 시작되면 이전 재생을 멈추고 새 회차를 처음부터 진행한다.
+    monkeypatch.setattr(core, "playback_command", _sleeping_player(0.2))
+    runner.trigger("tue", str(audio), False, True)
+    assert wait_until(qapp, lambda: runner.playback_mode == "idle")
+    assert wait_until(qapp, lambda: bool(follow_ups))
+    assert follow_ups == [(False, True)]
+    runner.stop()
+
+
+def test_base_backend_finishes_without_playing(qapp, config_dir):
+    backend = core.AudioBackend()
+    errors, finished = [], []
+    backend.playback_error.connect(lambda path, message: errors.append(path))
+    backend.playback_finished.connect(finished.append)
+    backend.play("a.mp3")
+    backend.stop()
+    assert errors == ["a.mp3"]
+    assert finished == ["a.mp3"]
+    assert not backend.is_active()
+    assert backend.current_source() is None
+
+
+def test_schedule_with_base_backend_reaches_follow_up(qapp, config_dir):
+    audio = config_dir / "a.mp3"
+    audio.write_bytes(b"x")
+    runner, follow_ups = _runner(config_dir, core.AudioBackend())
+    runner.trigger("mon", str(audio), False, True)
+    assert wait_until(qapp, lambda: runner.playback_mode == "idle")
+    assert wait_until(qapp, lambda: bool(follow_ups))
+    assert follow_ups == [(False, True)]
+    runner.stop()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""미리 해석해 둔 휴일 색인."""
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import autoclose_core as core
+
+
+def _brute_force(singles, ranges, skip_weekends, target: date) -> bool:
+    if skip_weekends and target.weekday() >= 5:
+        return True
+    return target in singles or any(start <= target <= end for start, end in ranges)
+
+
+def test_overlapping_adjacent_and_nested_ranges():
+    ranges = [
+        (date(2026, 12, 24), date(2026, 12, 26)),
+        (date(2026, 12, 20), date(2026, 12, 22)),
+        (date(2026, 12, 23), date(2026, 12, 23)),  # 앞뒤 기간과 맞닿음
+        (date(2026, 12, 21), date(2026, 12, 21)),  # 다른 기간 안
+        (date(2026, 12, 30), date(2027, 1, 2)),
+        (date(2027, 1, 1), date(2027, 1, 10)),  # 겹침
+    ]
+    singles = {date(2026, 11, 3)}
+    index = core.HolidayIndex(singles, ranges, skip_weekends=False)
+    assert index._starts == [date(2026, 12, 20), date(2026, 12, 30)]
+    assert index._ends == [date(2026, 12, 26), date(2027, 1, 10)]
+    day = date(2026, 10, 1)
+    while day < date(2027, 2, 1):
+        assert index.contains(day) == _brute_force(singles, ranges, False, day), day
+        day += timedelta(days=1)
+
+
+def test_from_config_skips_malformed_entries_and_weekends():
+    cfg = core.SchedulerConfig()
+    cfg.auto_skip_weekends = True
+    cfg.holidays = ["2026-10-09", "not-a-date", None]
+    cfg.holiday_ranges = [
+        {"start": "2026-10-20", "end": "2026-10-21"},
+        {"start": "2026-10-30", "end": "2026-10-28"},  # 거꾸로 된 기간
+        {"start": "2026-11-02"},
+    ]
+    index = core.HolidayIndex.from_config(cfg, revision=7)
+    assert index.revision == 7
+    assert index.contains(date(2026, 10, 9))
+    assert index.contains(date(2026, 10, 10))  # 토요일
+    assert index.contains(date(2026, 10, 21))
+    assert not index.contains(date(2026, 10, 22))
+    assert not index.contains(date(2026, 10, 29))
+    assert not index.contains(date(2026, 11, 2))
+
+
+def test_manager_rebuilds_index_only_on_new_revision(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    first = cfg_mgr.holiday_index
+    assert cfg_mgr.holiday_index is first
+    cfg_mgr.update(lambda cfg: cfg.holidays.append("2026-10-14"))
+    second = cfg_mgr.holiday_index
+    assert second is not first
+    assert second.contains(date(2026, 10, 14))
+    assert not first.contains(date(2026, 10, 14))
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""시작을 늦추는 paramiko·Qt Multimedia를 처음 쓸 때(또는 한가할 때) 불러오기."""
+from __future__ import annotations
+
+import importlib.util
+import os
+import subprocess
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+import autoclose_core as core
+import desktop_scheduler_qt as gui
+from conftest import wait_until
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_CHECK = """
+import sys
+import desktop_scheduler_qt  # noqa: F401
+import autoclose_core as core
+heavy = ("paramiko", "asyncssh", "PySide6.QtMultimedia")
+print("start", *[name in sys.modules for name in heavy])
+print("available", core.optional_module_available("paramiko"), "paramiko" in sys.modules)
+first = core.load_paramiko()
+print("loaded", "paramiko" in sys.modules, first is core.load_paramiko())
+"""
+
+
+@pytest.mark.skipif(importlib.util.find_spec("paramiko") is None, reason="paramiko 미설치")
+def test_entry_point_does_not_import_heavy_modules(tmp_path):
+    env = dict(os.environ, APPDATA=str(tmp_path), QT_QPA_PLATFORM="offscreen", PYTHONPATH=str(ROOT))
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0] == "start False False False"
+    # 설치 여부만 확인할 때는 모듈을 불러오지 않는다.
+    assert lines[1] == "available True False"
+    assert lines[2] == "loaded True True"
+
+
+def test_load_multimedia_imports_once(monkeypatch):
+    fake = types.ModuleType("PySide6.QtMultimedia")
+    fake.QMediaPlayer = type("QMediaPlayer", (), {})
+    fake.QAudioOutput = type("QAudioOutput", (), {})
+    monkeypatch.setitem(sys.modules, "PySide6.QtMultimedia", fake)
+    monkeypatch.setattr(gui, "QMediaPlayer", None)
+    monkeypatch.setattr(gui, "QAudioOutput", None)
+
+    service = gui.AudioService()
+    assert service.player is None
+
+    gui.load_multimedia()
+    assert (gui.QMediaPlayer, gui.QAudioOutput) == (fake.QMediaPlayer, fake.QAudioOutput)
+    # 한 번 불러온 뒤에는 다시 import하지 않는다.
+    monkeypatch.setitem(sys.modules, "PySide6.QtMultimedia", types.ModuleType("PySide6.QtMultimedia"))
+    gui.load_multimedia()
+    assert gui.QMediaPlayer is fake.QMediaPlayer
+
+
+class _PreloadAudio(core.AudioBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.preloaded = 0
+
+    def preload(self) -> None:
+        self.preloaded += 1
+
+
+def test_idle_preload_loads_ssh_only_when_needed(qapp, config_dir, monkeypatch):
+    loaded = threading.Event()
+    monkeypatch.setattr(core, "load_paramiko", loaded.set)
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    cfg_mgr.update(lambda cfg: setattr(cfg, "enable_remote_shutdown", False))
+    audio = _PreloadAudio()
+    runner = core.ScheduleRunner(cfg_mgr, audio)
+    try:
+        assert runner._preload_timer.interval() == int(core.IDLE_PRELOAD_DELAY * 1000)
+        runner._preload_deferred()
+        assert audio.preloaded == 1
+        assert not loaded.wait(0.2)
+
+        def enable(cfg: core.SchedulerConfig) -> None:
+            cfg.enable_remote_shutdown = True
+            cfg.remote_hosts = [{"host": "10.0.9.1", "method": "ssh"}]
+
+        cfg_mgr.update(enable)
+        runner._preload_deferred()
+        assert audio.preloaded == 2
+        assert wait_until(qapp, loaded.is_set)
+    finally:
+        runner.stop()
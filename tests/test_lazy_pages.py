@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""처음 열 때 만드는 관리자 페이지와 트레이에 오래 숨었을 때의 해제."""
+from __future__ import annotations
+
+import pytest
+
+import autoclose_core as core
+import desktop_scheduler_qt as gui
+from conftest import wait_until
+
+LAZY = ("고급 설정", "휴일", "플레이리스트")
+
+
+@pytest.fixture
+def window(qapp, config_dir):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+    baseline = len(cfg_mgr._subscribers)
+    win = gui.MainWindow(cfg_mgr)
+    win._locked = False
+    win.set_mode("admin")
+    win.baseline = baseline
+    yield win
+    win.runner.stop()
+    win.hide()
+    win.deleteLater()
+    qapp.processEvents()
+
+
+def _subscribers(win) -> int:
+    return len(win.cfg_mgr._subscribers) - win.baseline
+
+
+def test_pages_are_built_on_first_navigation_only(qapp, window):
+    assert (window.settings_panel, window.holiday_panel, window.assignment_preview) == (None, None, None)
+    assert window._built_pages == {}
+    before = _subscribers(window)
+
+    for name in LAZY:
+        window._set_active_page(name)
+    assert sorted(window._built_pages) == sorted(LAZY)
+    assert _subscribers(window) > before
+    panel = window.settings_panel
+    window._set_active_page("고급 설정")
+    assert window.settings_panel is panel
+
+    # 만든 페이지는 설정 변경을 바로 받는다.
+    window.cfg_mgr.update(lambda cfg: setattr(cfg, "holidays", ["2026-12-25"]), sections=("holidays",))
+    assert window.holiday_panel.single_list.count() == 1
+
+
+def test_hidden_pages_are_released_and_rebuilt_with_current_config(qapp, window):
+    before = _subscribers(window)
+    cards = len(window._cards)
+    for name in LAZY:
+        window._set_active_page(name)
+    window.show()
+    qapp.processEvents()
+    window._release_timer.setInterval(50)
+    window.hide()
+    assert window._release_timer.isActive()
+    assert wait_until(qapp, lambda: not window._built_pages)
+    assert (window.settings_panel, window.holiday_panel, window.assignment_preview) == (None, None, None)
+    assert _subscribers(window) == before
+    assert len(window._cards) == cards
+    # 지운 패널은 실행기 쪽 신호와도 끊겨 있어야 한다.
+    window.process_index.changed.emit()
+    window.reachability.updated.emit()
+
+    window.cfg_mgr.update(lambda cfg: setattr(cfg, "holidays", ["2026-12-25", "2026-12-31"]), sections=("holidays",))
+    window._set_active_page("휴일")
+    assert window.holiday_panel.single_list.count() == 2
+
+
+def test_busy_settings_panel_is_kept(qapp, window):
+    window._set_active_page("고급 설정")
+    window._set_active_page("휴일")
+    window.show()
+    qapp.processEvents()
+    window._release_timer.setInterval(50)
+    window.settings_panel.test_all_btn.setEnabled(False)
+    window.hide()
+    assert wait_until(qapp, lambda: "휴일" not in window._built_pages)
+    assert "고급 설정" in window._built_pages
+    assert window._release_timer.isActive()
+
+    window.settings_panel.test_all_btn.setEnabled(True)
+    assert wait_until(qapp, lambda: not window._built_pages)
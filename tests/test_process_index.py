@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""프로세스 색인과 프로그램 종료."""
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import time
+
+import psutil
+import pytest
+
+import autoclose_core as core
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith("win"), reason="복사한 실행 파일 이름으로 대상을 만든다")
+
+TARGET = "acstarget"
+
+
+@pytest.fixture
+def spawn(tmp_path):
+    executable = shutil.copy(sys.executable, tmp_path / TARGET)
+    started = []
+
+    def start(code: str = "import time; time.sleep(60)") -> subprocess.Popen:
+        process = subprocess.Popen([executable, "-c", code], stdout=subprocess.PIPE, text=True)
+        started.append(process)
+        return process
+
+    yield start
+    for process in started:
+        process.kill()
+        process.wait()
+
+
+def _killed(process: subprocess.Popen) -> bool:
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
+
+
+def test_target_added_after_refresh_falls_back_to_full_scan(qapp, spawn):
+    index = core.ProcessIndex(lambda: ["other"])
+    index.refresh()
+    process = spawn()
+    report = core.terminate_programs([TARGET], timeout=2, index=index)
+    assert process.pid in {outcome.pid for outcome in report.outcomes}
+    assert _killed(process)
+
+
+def test_process_started_after_last_refresh_is_found(qapp, spawn):
+    index = core.ProcessIndex(lambda: [TARGET])
+    index.refresh()
+    process = spawn()
+    report = core.terminate_programs([TARGET], timeout=2, index=index)
+    assert process.pid in {outcome.pid for outcome in report.outcomes}
+    assert _killed(process)
+
+
+def test_access_denied_pid_is_not_queried_again(qapp, monkeypatch):
+    denied_pid = next(pid for pid in psutil.pids() if pid != psutil.Process().pid)
+    calls = []
+    original = psutil.Process.name
+
+    def name(proc):
+        if proc.pid == denied_pid:
+            calls.append(proc.pid)
+            raise psutil.AccessDenied(proc.pid)
+        return original(proc)
+
+    monkeypatch.setattr(psutil.Process, "name", name)
+    index = core.ProcessIndex(lambda: [TARGET])
+    index.refresh()
+    index.refresh()
+    assert calls == [denied_pid]
+
+
+# 준비되면 한 줄을 출력하고, SIGTERM을 무시해 강제 종료가 필요한 대상.
+STUBBORN = (
+    "import signal, sys, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+    "print('ready', flush=True); time.sleep(60)"
+)
+# 대상이 아닌 이름의 하위 프로세스를 하나 띄우고 그 PID를 출력하는 대상.
+PARENT = (
+    "import subprocess, time; "
+    f"child = subprocess.Popen([{sys.executable!r}, '-c', 'import time; time.sleep(60)']); "
+    "print(child.pid, flush=True); time.sleep(60)"
+)
+
+
+def test_stubborn_targets_are_killed_together(qapp, spawn):
+    stubborn = [spawn(STUBBORN) for _ in range(4)]
+    for process in stubborn:
+        assert process.stdout.readline().strip() == "ready"
+    polite = spawn()
+    started = time.monotonic()
+    report = core.terminate_programs([TARGET], timeout=0.5, kill_timeout=2)
+    # 신호를 한꺼번에 보내고 함께 기다리므로 대상 수만큼 제한 시간이 늘지 않는다.
+    assert time.monotonic() - started < 1.5
+    outcomes = {item.pid: item.outcome for item in report.outcomes}
+    assert all(outcomes[process.pid] == "강제 종료" for process in stubborn)
+    assert outcomes[polite.pid] == "종료"
+    assert report.survivors == []
+    assert all(_killed(process) for process in [*stubborn, polite])
+
+
+def test_children_are_terminated_with_the_target(qapp, spawn):
+    parent = spawn(PARENT)
+    child_pid = int(parent.stdout.readline())
+    child = psutil.Process(child_pid)
+    try:
+        report = core.terminate_programs([TARGET], timeout=2, include_children=True)
+        by_pid = {item.pid: item for item in report.outcomes}
+        assert not by_pid[parent.pid].child
+        assert by_pid[child_pid].child and by_pid[child_pid].outcome == "종료"
+        child.wait(timeout=5)
+        assert _killed(parent)
+    finally:
+        if child.is_running():
+            child.kill()
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""원격 대상 연결 확인과 종료."""
+from __future__ import annotations
+
+import asyncio
+import socket
+import sys
+import time
+
+import pytest
+
+import autoclose_core as core
+from conftest import wait_until
+
+
+def test_methodless_host_is_probed_on_the_shutdown_port():
+    host = {"host": "10.0.0.5", "username": "admin"}
+    assert core.remote_method(host) == core.DEFAULT_REMOTE_METHOD == "winrm"
+    assert core.remote_probe_target(host) == ("10.0.0.5", core.REMOTE_METHOD_PORTS["winrm"])
+    assert core.remote_probe_target({**host, "method": "SSH"}) == ("10.0.0.5", 22)
+    assert core.remote_probe_target({"host": "10.0.0.5:2222", "method": "ssh"}) == ("10.0.0.5", 2222)
+    # 세션 풀도 같은 기본값을 따라 방식 없는 대상을 SSH로 다루지 않는다.
+    assert core.SSHSessionPool.key_for(host) is None
+
+
+def _offline(host: str, port: int) -> core.ProbeResult:
+    return core.ProbeResult(host, port, tcp_open=None, error="응답 없음")
+
+
+def test_triage_orders_fastest_first_and_still_tries_offline_hosts(qapp, monkeypatch):
+    fast = {"host": "10.0.0.1", "method": "ssh"}
+    slow = {"host": "10.0.0.2", "method": "ssh"}
+    offline = {"host": "10.0.0.3", "method": "ssh"}
+    hosts = [offline, slow, fast]
+    cache = core.HostReachabilityCache(lambda: hosts, interval=0)
+    cache.record(
+        [
+            core.ProbeResult("10.0.0.1", 22, tcp_open=True, tcp_rtt=0.001),
+            core.ProbeResult("10.0.0.2", 22, tcp_open=True, tcp_rtt=0.050),
+            _offline("10.0.0.3", 22),
+        ]
+    )
+    monkeypatch.setattr(core, "probe_hosts", lambda targets, timeout: [_offline(*target) for target in targets])
+
+    plan = core._triage_remote_hosts(hosts, cache, 20.0)
+    assert plan == [(fast, 20.0), (slow, 20.0), (offline, core.REMOTE_SUSPECT_TIMEOUT)]
+    assert cache.state_for(offline).failures == 2
+
+    attempted = []
+
+    def fake_shutdown(host, timeout, pool=None):
+        attempted.append((host["host"], timeout))
+        return host["host"], True, "ok"
+
+    monkeypatch.setattr(core, "_shutdown_remote_host", fake_shutdown)
+    results = core.shutdown_remote(hosts, result_callback=lambda *_: None, max_workers=1, reachability=cache)
+    assert attempted == [("10.0.0.1", 20.0), ("10.0.0.2", 20.0), ("10.0.0.3", core.REMOTE_SUSPECT_TIMEOUT)]
+    assert all(success for _, success, _ in results)
+
+
+def test_triage_keeps_recovered_host_at_full_timeout(qapp, monkeypatch):
+    host = {"host": "10.0.0.3", "method": "ssh"}
+    cache = core.HostReachabilityCache(lambda: [host], interval=0)
+    cache.record([_offline("10.0.0.3", 22)])
+    monkeypatch.setattr(
+        core, "probe_hosts", lambda targets, timeout: [core.ProbeResult(*target, tcp_open=True, tcp_rtt=0.01) for target in targets]
+    )
+    assert core._triage_remote_hosts([host], cache, 20.0) == [(host, 20.0)]
+    assert cache.state_for(host).online
+
+
+class _FakeAsyncSSH:
+    """`asyncssh` 대신 쓰는 가짜 모듈. 명령별 결과(예외 또는 종료 코드)를 정해 둔다."""
+
+    class Error(Exception):
+        pass
+
+    def __init__(self, outcomes, delays=None):
+        self.outcomes = outcomes
+        self.delays = delays or {}
+        self.connected = []
+        self.ran = []
+        self.active = 0
+        self.peak = 0
+        self.cancelled = []
+
+    def connect(self, host, **_):
+        fake = self
+        fake.connected.append(host)
+
+        class _Conn:
+            async def __aenter__(self):
+                fake.active += 1
+                fake.peak = max(fake.peak, fake.active)
+                return self
+
+            async def __aexit__(self, *exc):
+                fake.active -= 1
+                return False
+
+            async def run(self, command, check=False):
+                fake.ran.append(command)
+                try:
+                    await asyncio.sleep(fake.delays.get(host, 0))
+                except asyncio.CancelledError:
+                    fake.cancelled.append(host)
+                    raise
+                outcome = fake.outcomes.get(command, 0)
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                return type("Result", (), {"exit_status": outcome, "stderr": "", "stdout": ""})()
+
+        return _Conn()
+
+
+class _Pool:
+    def __init__(self, live):
+        self.live = set(live)
+
+    def has_session(self, host):
+        return host["host"] in self.live
+
+
+def test_async_backend_uses_threads_only_for_pooled_hosts(monkeypatch):
+    fake = _FakeAsyncSSH({})
+    monkeypatch.setattr(core, "load_asyncssh", lambda: fake)
+    threaded = []
+
+    def pooled_shutdown(host, target, deadline, pool=None):
+        threaded.append(target)
+        return "pooled"
+
+    monkeypatch.setattr(core, "_shutdown_remote_ssh", pooled_shutdown)
+    hosts = [{"host": f"10.0.1.{i}", "method": "ssh"} for i in range(1, 4)]
+    results = core.shutdown_remote(
+        hosts, result_callback=lambda *_: None, backend="asyncio", pool=_Pool({"10.0.1.2"})
+    )
+    assert threaded == ["10.0.1.2"]
+    assert sorted(fake.connected) == ["10.0.1.1", "10.0.1.3"]
+    assert all(success for _, success, _ in results)
+
+
+def test_async_ssh_tries_fallback_command_after_network_error(monkeypatch):
+    fake = _FakeAsyncSSH({"shutdown /s /t 0": OSError("연결 끊김"), "shutdown -h now": 0})
+    monkeypatch.setattr(core, "load_asyncssh", lambda: fake)
+    results = core.shutdown_remote(
+        [{"host": "10.0.1.9", "method": "ssh"}], result_callback=lambda *_: None, backend="asyncio"
+    )
+    assert fake.ran == ["shutdown /s /t 0", "shutdown -h now"]
+    assert results == [("10.0.1.9", True, "SSH 명령 전송: shutdown -h now")]
+
+
+def _sleeping_host(delays, started=None):
+    """호스트별로 정한 시간만큼 걸리는 가짜 `_shutdown_remote_host`."""
+
+    def fake(host, timeout, pool=None):
+        if started is not None:
+            started.append(host["host"])
+        time.sleep(delays[host["host"]])
+        return host["host"], True, "ok"
+
+    return fake
+
+
+def test_threads_backend_sends_concurrently_in_completion_order(monkeypatch):
+    delays = {"a": 0.3, "b": 0.05, "c": 0.3, "d": 0.3}
+    monkeypatch.setattr(core, "_shutdown_remote_host", _sleeping_host(delays))
+    hosts = [{"host": name, "method": "ssh"} for name in delays]
+    started = time.monotonic()
+    results = core.shutdown_remote(hosts, result_callback=lambda *_: None, max_workers=4)
+    assert time.monotonic() - started < 0.9
+    assert results[0][0] == "b"
+    assert sorted(target for target, _, _ in results) == ["a", "b", "c", "d"]
+
+
+def test_threads_backend_reports_hosts_past_overall_deadline(monkeypatch):
+    delays = {"fast": 0.01, "hung": 1.0}
+    monkeypatch.setattr(core, "_shutdown_remote_host", _sleeping_host(delays))
+    hosts = [{"host": name, "method": "ssh"} for name in delays]
+    started = time.monotonic()
+    results = core.shutdown_remote(hosts, result_callback=lambda *_: None, max_workers=2, overall_timeout=0.3)
+    assert time.monotonic() - started < 0.8
+    assert results[0] == ("fast", True, "ok")
+    assert results[1][:2] == ("hung", False)
+    assert "전체 제한 시간" in results[1][2]
+
+
+def test_sequential_mode_skips_hosts_after_overall_deadline(monkeypatch):
+    delays = {"a": 0.3, "b": 0.01}
+    attempted = []
+    monkeypatch.setattr(core, "_shutdown_remote_host", _sleeping_host(delays, attempted))
+    hosts = [{"host": name, "method": "ssh"} for name in delays]
+    results = core.shutdown_remote(hosts, result_callback=lambda *_: None, max_workers=1, overall_timeout=0.2)
+    assert attempted == ["a"]
+    assert results[1][:2] == ("b", False)
+
+
+def test_host_deadline_stops_a_hanging_winrm_command(monkeypatch):
+    monkeypatch.setattr(
+        core, "_winrm_shutdown_command", lambda host, target: [sys.executable, "-c", "import time; time.sleep(10)"]
+    )
+    started = time.monotonic()
+    target, success, message = core._shutdown_remote_host({"host": "10.0.2.1", "method": "winrm"}, 0.3)
+    assert time.monotonic() - started < 3.0
+    assert (target, success) == ("10.0.2.1", False)
+    assert "제한 시간" in message
+
+
+def test_async_backend_limits_concurrency(monkeypatch):
+    hosts = [{"host": f"10.0.3.{i}", "method": "ssh"} for i in range(8)]
+    fake = _FakeAsyncSSH({}, {host["host"]: 0.05 for host in hosts})
+    monkeypatch.setattr(core, "load_asyncssh", lambda: fake)
+    results = core.shutdown_remote(hosts, result_callback=lambda *_: None, backend="asyncio", max_workers=3)
+    assert fake.peak == 3
+    assert len(results) == 8 and all(success for _, success, _ in results)
+
+
+def test_async_backend_cancels_hosts_past_overall_deadline(monkeypatch):
+    fake = _FakeAsyncSSH({}, {"10.0.3.1": 0.01, "10.0.3.2": 10.0})
+    monkeypatch.setattr(core, "load_asyncssh", lambda: fake)
+    hosts = [{"host": "10.0.3.1", "method": "ssh"}, {"host": "10.0.3.2", "method": "ssh"}]
+    started = time.monotonic()
+    results = core.shutdown_remote(
+        hosts, result_callback=lambda *_: None, backend="asyncio", overall_timeout=0.3
+    )
+    assert time.monotonic() - started < 1.5
+    assert results[0][:2] == ("10.0.3.1", True)
+    assert results[1][:2] == ("10.0.3.2", False)
+    assert "전체 제한 시간" in results[1][2]
+    # 남은 작업은 기다리지 않고 취소해 연결을 닫는다.
+    assert fake.cancelled == ["10.0.3.2"]
+    assert fake.active == 0
+
+
+def test_async_host_deadline_kills_winrm_process(monkeypatch):
+    monkeypatch.setattr(
+        core, "_winrm_shutdown_command", lambda host, target: [sys.executable, "-c", "import time; time.sleep(10)"]
+    )
+    started = time.monotonic()
+    results = core.shutdown_remote(
+        [{"host": "10.0.3.9", "method": "winrm"}], result_callback=lambda *_: None, backend="asyncio", host_timeout=0.3
+    )
+    assert time.monotonic() - started < 3.0
+    assert results == [("10.0.3.9", False, "호스트별 제한 시간을 넘겼습니다.")]
+
+
+@pytest.fixture
+def local_ports():
+    """열린 포트 하나와 닫힌(연결 거부) 포트 하나."""
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(512)
+    closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+    yield listener.getsockname()[1], closed_port
+    listener.close()
+
+
+def test_probe_reports_open_and_refused_ports_in_input_order(local_ports):
+    open_port, closed_port = local_ports
+    targets = [("127.0.0.1", closed_port), ("127.0.0.1", open_port)]
+    refused, opened = core.probe_hosts(targets, timeout=2.0)
+    assert (opened.host, opened.port, opened.tcp_open) == ("127.0.0.1", open_port, True)
+    assert opened.tcp_rtt is not None and opened.reachable
+    assert (refused.port, refused.tcp_open, refused.error) == (closed_port, False, "연결 거부")
+    # 연결 거부도 호스트는 살아 있다는 뜻이다.
+    assert refused.reachable
+
+
+def test_probe_caps_sockets_in_flight(local_ports, monkeypatch):
+    open_port, closed_port = local_ports
+    monkeypatch.setattr(core, "PROBE_MAX_IN_FLIGHT", 4)
+    targets = [("127.0.0.1", open_port if index % 3 else closed_port) for index in range(30)]
+    results = core.probe_hosts(targets, timeout=2.0)
+    assert [result.port for result in results] == [port for _, port in targets]
+    assert [result.tcp_open for result in results] == [bool(index % 3) for index in range(30)]
+
+
+def test_unanswered_probe_is_not_reachable():
+    silent = core.ProbeResult("10.0.6.1", 22)
+    assert not silent.reachable
+    assert core.ProbeResult("10.0.6.1", 22, icmp_ok=True, icmp_rtt=0.002).reachable
+    assert "응답 없음" in silent.describe()
+
+
+def test_reachability_order_and_expiry(qapp):
+    fast = {"host": "10.0.7.1", "method": "ssh"}
+    slow = {"host": "10.0.7.2", "method": "ssh"}
+    unknown = {"host": "10.0.7.3", "method": "ssh"}
+    down = {"host": "10.0.7.4", "method": "ssh"}
+    cache = core.HostReachabilityCache(lambda: [], interval=0)
+    cache.record(
+        [
+            core.ProbeResult("10.0.7.2", 22, tcp_open=True, tcp_rtt=0.040),
+            core.ProbeResult("10.0.7.1", 22, tcp_open=True, tcp_rtt=0.002),
+            _offline("10.0.7.4", 22),
+        ]
+    )
+    assert cache.order([down, unknown, slow, fast]) == [fast, slow, unknown, down]
+    assert cache.probably_offline(down)
+    assert not cache.probably_offline(unknown) and not cache.probably_offline(fast)
+    # 오래된 실패 기록은 응답 없음으로 보지 않는다.
+    assert not cache.probably_offline(down, max_age=-1)
+
+    cache.record([_offline("10.0.7.4", 22)])
+    assert cache.state_for(down).failures == 2
+    cache.record([core.ProbeResult("10.0.7.4", 22, tcp_open=True, tcp_rtt=0.01)])
+    state = cache.state_for(down)
+    assert (state.failures, state.online, state.error) == (0, True, "")
+    # 돌려준 상태는 복사본이다.
+    state.failures = 9
+    assert cache.state_for(down).failures == 0
+
+
+def test_background_refresh_probes_current_hosts_only(qapp, monkeypatch):
+    hosts = [{"host": "10.0.7.1", "method": "ssh"}, {"host": "10.0.7.5"}]
+    probed = []
+
+    def fake_probe(targets, timeout):
+        probed.append(list(targets))
+        return [core.ProbeResult(host, port, tcp_open=True, tcp_rtt=0.01) for host, port in targets]
+
+    monkeypatch.setattr(core, "probe_hosts", fake_probe)
+    cache = core.HostReachabilityCache(lambda: list(hosts), interval=60)
+    updates = []
+    cache.updated.connect(lambda: updates.append(True))
+    cache.start()
+    try:
+        assert wait_until(qapp, lambda: bool(updates))
+        assert probed == [[("10.0.7.1", 22), ("10.0.7.5", core.REMOTE_METHOD_PORTS["winrm"])]]
+
+        hosts.pop(0)
+        cache.refresh_now()
+        assert wait_until(qapp, lambda: len(updates) == 2)
+        assert probed[1] == [("10.0.7.5", core.REMOTE_METHOD_PORTS["winrm"])]
+        # 목록에서 빠진 호스트의 기록은 지운다.
+        assert cache.state_for({"host": "10.0.7.1", "method": "ssh"}) is None
+    finally:
+        cache.stop()
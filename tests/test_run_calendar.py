@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""설정 리비전·날짜가 바뀔 때만 다시 계산하는 예정 실행 달력."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import autoclose_core as core
+
+NOW = datetime(2026, 10, 12, 8, 0)  # 월요일
+
+
+@pytest.fixture
+def calendar(qapp, config_dir, monkeypatch):
+    cfg_mgr = core.ConfigManager(write_interval=None)
+
+    def prepare(cfg: core.SchedulerConfig) -> None:
+        cfg.playlist = ["a.mp3", "b.mp3"]
+        cfg.playlist_rotation = 1
+        for day in cfg.days.values():
+            day.time = "09:00"
+            day.extra_times = ["15:00"]
+            day.auto_assign = True
+            day.last_ran = None
+
+    cfg_mgr.update(prepare)
+    builds = []
+    original = core.RunQueue.from_config.__func__
+
+    def counting(cls, *args, **kwargs):
+        builds.append(args[1])
+        return original(cls, *args, **kwargs)
+
+    monkeypatch.setattr(core.RunQueue, "from_config", classmethod(counting))
+    return cfg_mgr, core.RunCalendar(cfg_mgr), builds
+
+
+def test_same_revision_and_day_reuses_slots(calendar):
+    cfg_mgr, cal, builds = calendar
+    first = cal.upcoming(horizon_days=7, now=NOW)
+    assert cal.upcoming(horizon_days=7, now=NOW + timedelta(minutes=30)) == first
+    assert cal.upcoming(horizon_days=28, limit=3, now=NOW) == first[:3]
+    assert len(builds) == 1
+    # 플레이리스트는 현재 순번부터 회차마다 돌아간다.
+    assert [run.audio_path for run in first[:4]] == ["b.mp3", "a.mp3", "b.mp3", "a.mp3"]
+    assert [(run.when.hour, run.slot) for run in first[:2]] == [(9, "09:00"), (15, "15:00")]
+
+
+def test_passed_slot_drops_without_rebuild(calendar):
+    _, cal, builds = calendar
+    before = cal.upcoming(horizon_days=7, now=NOW)
+    after = cal.upcoming(horizon_days=7, now=NOW.replace(hour=10))
+    assert [run.when for run in after] == [run.when for run in before[1:]]
+    # 지난 슬롯은 실행되지 않았으므로 순번이 그대로이고, 남은 첫 회차가 같은 곡을 받는다.
+    assert after[0].audio_path == before[0].audio_path
+    assert len(builds) == 1
+
+
+def test_config_change_rebuilds(calendar):
+    cfg_mgr, cal, builds = calendar
+    cal.upcoming(horizon_days=7, now=NOW)
+    cfg_mgr.update(lambda cfg: setattr(cfg.days["mon"], "time", "08:30"))
+    runs = cal.upcoming(horizon_days=7, now=NOW)
+    assert runs[0].when == NOW.replace(minute=30)
+    assert len(builds) == 2
+
+
+def test_new_day_wider_horizon_and_invalidate_rebuild(calendar):
+    _, cal, builds = calendar
+    cal.upcoming(horizon_days=7, now=NOW)
+    cal.upcoming(horizon_days=7, now=NOW + timedelta(days=1))
+    assert len(builds) == 2
+    runs = cal.upcoming(horizon_days=core.CALENDAR_HORIZON_DAYS + 7, now=NOW + timedelta(days=1))
+    assert len(builds) == 3
+    assert runs[-1].when.date() >= (NOW + timedelta(days=core.CALENDAR_HORIZON_DAYS)).date()
+    cal.invalidate()
+    cal.upcoming(horizon_days=7, now=NOW + timedelta(days=1))
+    assert len(builds) == 4
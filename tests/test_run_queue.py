@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""요일별 여러 실행 슬롯을 시각 순으로 꺼내는 대기열."""
+from __future__ import annotations
+
+from datetime import datetime
+
+import autoclose_core as core
+
+MONDAY = datetime(2026, 10, 12)
+
+
+def _config(**days) -> core.SchedulerConfig:
+    cfg = core.SchedulerConfig()
+    for key, day in cfg.days.items():
+        day.enabled = False
+    for key, (time, extra) in days.items():
+        cfg.days[key].enabled = True
+        cfg.days[key].time = time
+        cfg.days[key].extra_times = list(extra)
+    return cfg
+
+
+def test_pops_in_time_order_and_keeps_ties_in_push_order():
+    queue = core.RunQueue()
+    queue.push(MONDAY.replace(hour=12), "mon", "12:00")
+    queue.push(MONDAY.replace(hour=9), "mon", "09:00")
+    queue.push(MONDAY.replace(hour=12), "tue", "12:00")
+    assert len(queue) == 3
+    assert queue.peek() == (MONDAY.replace(hour=9), "mon", "09:00")
+    assert [day for _, day, _ in queue.drain()] == ["mon", "mon", "tue"]
+    assert queue.pop() is None
+
+
+def test_pop_due_takes_only_slots_at_or_before_now():
+    queue = core.RunQueue()
+    for hour in (8, 9, 10):
+        queue.push(MONDAY.replace(hour=hour), "mon", f"{hour:02d}:00")
+    assert [slot for _, _, slot in queue.pop_due(MONDAY.replace(hour=9))] == ["08:00", "09:00"]
+    assert [slot for _, _, slot in queue.pop_due(MONDAY.replace(hour=9, minute=59))] == []
+    assert len(queue) == 1
+
+
+def test_from_config_expands_every_slot_of_a_day():
+    cfg = _config(mon=("12:00", ["9:5", "18:30", "12:00", "bad"]), wed=("07:00", []))
+    queue = core.RunQueue.from_config(cfg, MONDAY, horizon_days=7)
+    assert [(when, day) for when, day, _ in queue.drain()] == [
+        (MONDAY.replace(hour=9, minute=5), "mon"),
+        (MONDAY.replace(hour=12), "mon"),
+        (MONDAY.replace(hour=18, minute=30), "mon"),
+        (MONDAY.replace(day=14, hour=7), "wed"),
+    ]
+
+
+def test_from_config_skips_past_and_completed_slots():
+    cfg = _config(mon=("09:00", ["12:00", "18:00"]))
+    cfg.days["mon"].last_ran = MONDAY.date().isoformat()
+    cfg.days["mon"].last_slot = "09:00"
+    queue = core.RunQueue.from_config(cfg, MONDAY.replace(hour=13), horizon_days=8)
+    # 12:00은 이미 지났고 09:00은 실행했으니 오늘은 18:00만, 다음 주 월요일은 모두 남는다.
+    assert [when for when, _, _ in queue.drain()] == [
+        MONDAY.replace(hour=18),
+        MONDAY.replace(day=19, hour=9),
+        MONDAY.replace(day=19, hour=12),
+        MONDAY.replace(day=19, hour=18),
+    ]
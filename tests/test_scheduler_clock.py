@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""주입한 시계로 본 스케줄러 기한 계산과 실행 전 타이머."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from PySide6 import QtCore
+
+import autoclose_core as core
+
+RUN_AT = datetime(2026, 10, 12, 9, 0)  # 월요일
+
+
+class FakeClock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class FakePreflight(QtCore.QObject):
+    finished = QtCore.Signal(str, bool, str, float, str)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.checked = []
+
+    def busy(self) -> bool:
+        return False
+
+    def check(self, path, cache=None) -> None:
+        self.checked.append(path)
+
+
+def _monday_only(config_dir, audio_path=None) -> core.ConfigManager:
+    cfg_mgr = core.ConfigManager(write_interval=None)
+
+    def prepare(cfg: core.SchedulerConfig) -> None:
+        cfg.playlist = []
+        cfg.targets = []
+        cfg.enable_remote_shutdown = False
+        cfg.audio_preflight_seconds = 60
+        for key, day in cfg.days.items():
+            day.enabled = key == "mon"
+            day.time = "09:00"
+            day.extra_times = []
+            day.auto_assign = False
+            day.audio_path = audio_path
+            day.last_ran = None
+
+    cfg_mgr.update(prepare)
+    return cfg_mgr
+
+
+def test_sleeps_exactly_until_deadline(qapp, config_dir):
+    clock = FakeClock(RUN_AT - timedelta(seconds=42.5))
+    engine = core.SchedulerEngine(_monday_only(config_dir), clock=clock)
+    run = engine.next_run()
+    assert run.when == RUN_AT
+    assert engine._seconds_until(run) == 42.5
+
+
+def test_fires_at_exact_deadline_once(qapp, config_dir):
+    clock = FakeClock(RUN_AT - timedelta(microseconds=1))
+    cfg_mgr = _monday_only(config_dir)
+    engine = core.SchedulerEngine(cfg_mgr, clock=clock)
+    fired = []
+    engine.schedule_triggered.connect(lambda day, *_: fired.append(day))
+
+    engine._check_trigger()
+    assert fired == []
+
+    clock.now = RUN_AT
+    engine._check_trigger()
+    assert fired == ["mon"]
+    assert cfg_mgr.config.days["mon"].last_ran == RUN_AT.date().isoformat()
+
+    clock.now = RUN_AT + timedelta(seconds=1)
+    engine._check_trigger()
+    assert fired == ["mon"]
+    assert engine.next_run().when == RUN_AT + timedelta(days=7)
+
+
+def test_preflight_timer_follows_injected_clock(qapp, config_dir):
+    audio = config_dir / "a.mp3"
+    audio.write_bytes(b"x")
+    clock = FakeClock(RUN_AT - timedelta(seconds=90))
+    preflight = FakePreflight()
+    runner = core.ScheduleRunner(_monday_only(config_dir, str(audio)), core.AudioBackend(), preflight, clock=clock)
+    try:
+        run = runner.scheduler.next_run()
+        runner._schedule_audio_preflight(run)
+        # 실제 시각과 상관없이 주입한 시계로 60초 전까지 남은 30초를 기다린다.
+        assert runner._preflight_timer.isActive()
+        assert runner._preflight_timer.interval() == 30000
+        assert preflight.checked == []
+
+        clock.now = RUN_AT - timedelta(seconds=60)
+        runner._run_audio_preflight()
+        assert preflight.checked == [str(audio)]
+    finally:
+        runner.stop()
+
+
+def test_early_preflight_wake_waits_again(qapp, config_dir):
+    audio = config_dir / "a.mp3"
+    audio.write_bytes(b"x")
+    clock = FakeClock(RUN_AT - timedelta(seconds=120))
+    preflight = FakePreflight()
+    runner = core.ScheduleRunner(_monday_only(config_dir, str(audio)), core.AudioBackend(), preflight, clock=clock)
+    try:
+        runner._preflight_run = runner.scheduler.next_run()
+        runner._run_audio_preflight()
+        assert preflight.checked == []
+        assert runner._preflight_timer.interval() == 60000
+    finally:
+        runner.stop()
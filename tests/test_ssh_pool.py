@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""예약 실행 전에 SSH 세션을 미리 열어 두는 풀."""
+from __future__ import annotations
+
+import io
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+import autoclose_core as core
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def set_keepalive(self, seconds) -> None:
+        self.keepalive = seconds
+
+
+class _Channel:
+    def __init__(self, status: int) -> None:
+        self.status = status
+
+    def exit_status_ready(self) -> bool:
+        return True
+
+    def recv_exit_status(self) -> int:
+        return self.status
+
+
+class _Client:
+    def __init__(self, target: str, status: int = 0) -> None:
+        self.target = target
+        self.status = status
+        self.transport = _Transport()
+        self.closed = False
+        self.commands = []
+
+    def get_transport(self):
+        return self.transport
+
+    def exec_command(self, command, timeout=None):
+        self.commands.append(command)
+        stdout = io.BytesIO(b"")
+        stdout.channel = _Channel(self.status)
+        return None, stdout, io.BytesIO(b"")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    clients = []
+
+    def fake_open(host, target, timeout):
+        client = _Client(target)
+        clients.append(client)
+        return client
+
+    monkeypatch.setattr(core, "load_paramiko", lambda: object())
+    monkeypatch.setattr(core, "_open_ssh_client", fake_open)
+    return clients
+
+
+SSH_A = {"host": "10.0.4.1", "method": "ssh", "username": "admin"}
+SSH_B = {"host": "10.0.4.2:2222", "method": "ssh", "username": "admin"}
+WINRM = {"host": "10.0.4.3", "method": "winrm"}
+
+
+def test_warm_opens_each_ssh_host_once(opened):
+    pool = core.SSHSessionPool(max_workers=4)
+    assert pool.warm([SSH_A, SSH_B, WINRM, dict(SSH_A)]) == 2
+    assert sorted(client.target for client in opened) == ["10.0.4.1", "10.0.4.2:2222"]
+    assert all(client.transport.keepalive == core.SSH_KEEPALIVE_INTERVAL for client in opened)
+    # 이미 열린 세션은 다시 열지 않는다.
+    assert pool.warm([SSH_A, SSH_B]) == 2
+    assert len(opened) == 2
+    assert pool.has_session(SSH_A) and not pool.has_session(WINRM)
+
+
+def test_acquire_hands_out_a_session_once(opened):
+    pool = core.SSHSessionPool()
+    pool.warm([SSH_A])
+    client = pool.acquire(SSH_A)
+    assert client is opened[0] and not client.closed
+    assert pool.acquire(SSH_A) is None
+    assert len(pool) == 0
+
+
+def test_dead_and_expired_sessions_are_evicted(opened):
+    pool = core.SSHSessionPool()
+    pool.warm([SSH_A, SSH_B])
+    dead = next(client for client in opened if client.target == "10.0.4.1")
+    dead.transport.active = False
+    assert not pool.has_session(SSH_A)
+    pool.prune()
+    assert dead.closed and len(pool) == 1
+
+    pool._max_age = 0.0
+    assert pool.acquire(SSH_B) is None
+    assert all(client.closed for client in opened)
+
+
+def test_close_all_closes_everything(opened):
+    pool = core.SSHSessionPool()
+    pool.warm([SSH_A, SSH_B])
+    pool.close_all()
+    assert len(pool) == 0
+    assert all(client.closed for client in opened)
+
+
+def test_shutdown_uses_pooled_session_then_reconnects_if_it_died(opened):
+    pool = core.SSHSessionPool()
+    pool.warm([SSH_A])
+    message = core._shutdown_remote_ssh(SSH_A, "10.0.4.1", time.monotonic() + 5, pool)
+    assert message.endswith("(미리 연결된 세션)")
+    assert len(opened) == 1 and opened[0].closed
+
+    pool.warm([SSH_A])
+    opened[1].status = -1  # 세션은 있지만 명령이 종료 코드를 받지 못함
+    message = core._shutdown_remote_ssh(SSH_A, "10.0.4.1", time.monotonic() + 5, pool)
+    assert "미리 연결된 세션" not in message
+    assert len(opened) == 3 and all(client.closed for client in opened)
+
+
+def test_runner_arms_prewarm_from_the_scheduler_clock(qapp, config_dir, monkeypatch):
+    monkeypatch.setattr(core, "optional_module_available", lambda name: True)
+    run_at = datetime(2026, 10, 12, 9, 0)
+    now = [run_at - timedelta(seconds=100)]
+    cfg_mgr = core.ConfigManager(write_interval=None)
+
+    def prepare(cfg: core.SchedulerConfig) -> None:
+        cfg.remote_hosts = [SSH_A]
+        cfg.enable_remote_shutdown = True
+        cfg.remote_prewarm_seconds = 60
+
+    cfg_mgr.update(prepare)
+    runner = core.ScheduleRunner(cfg_mgr, core.AudioBackend(), clock=lambda: now[0])
+    warmed = []
+    runner.ssh_pool.prewarm = warmed.append
+    try:
+        run = core.UpcomingRun(run_at, "mon", None, False, True, True, "09:00")
+        runner._schedule_prewarm(run)
+        assert runner._prewarm_timer.isActive()
+        assert runner._prewarm_timer.interval() == 40000
+        assert warmed == []
+
+        now[0] = run_at - timedelta(seconds=30)
+        runner._schedule_prewarm(run)
+        assert not runner._prewarm_timer.isActive()
+        assert warmed == [[SSH_A]]
+
+        runner._schedule_prewarm(core.UpcomingRun(run_at, "mon", None, False, False, True, "09:00"))
+        assert not runner._prewarm_timer.isActive()
+        assert len(warmed) == 1
+    finally:
+        runner.stop()
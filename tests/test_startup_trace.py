@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""시작 단계 기록(`StartupTrace`)과 모듈 불러오기 측정(`ImportProfiler`)."""
+from __future__ import annotations
+
+import json
+import sys
+
+import autoclose_profile as profile
+
+
+def test_phases_nest_and_record_durations():
+    trace = profile.StartupTrace()
+    with trace.phase("창 만들기"):
+        with trace.phase("화면 구성"):
+            pass
+        trace.mark("첫 페이지")
+    names = [(entry["name"], entry["depth"]) for entry in trace.phases]
+    assert names == [("창 만들기", 0), ("화면 구성", 1), ("첫 페이지", 1)]
+    outer, inner, mark = trace.phases
+    assert outer["ms"] >= inner["ms"] >= 0
+    assert inner["start_ms"] >= outer["start_ms"]
+    assert "ms" not in mark
+
+
+def test_failed_phase_still_closes():
+    trace = profile.StartupTrace()
+    try:
+        with trace.phase("설정 불러오기"):
+            raise ValueError
+    except ValueError:
+        pass
+    with trace.phase("아이콘"):
+        pass
+    assert "ms" in trace.phases[0]
+    assert trace.phases[1]["depth"] == 0
+
+
+def test_finish_writes_once_and_ignores_later_phases(tmp_path):
+    trace = profile.StartupTrace()
+    seen = []
+    trace.add_listener(seen.append)
+    with trace.phase("QApplication 생성"):
+        pass
+    path = tmp_path / profile.STARTUP_TRACE_FILE
+    record = trace.finish(path, "gui")
+    assert record["mode"] == "gui" and record["total_ms"] >= record["phases"][0]["ms"]
+    assert seen == [record]
+
+    with trace.phase("늦은 단계"):
+        pass
+    trace.mark("늦은 시점")
+    assert [entry["name"] for entry in trace.phases] == ["QApplication 생성"]
+    assert trace.finish(path, "gui") is None
+    assert seen == [record]
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 and json.loads(lines[0])["phases"][0]["name"] == "QApplication 생성"
+
+
+def test_trace_file_keeps_recent_records(tmp_path):
+    path = tmp_path / profile.STARTUP_TRACE_FILE
+    for run in range(profile.STARTUP_TRACE_KEEP + 5):
+        profile.StartupTrace().finish(path, f"run{run}")
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == profile.STARTUP_TRACE_KEEP
+    assert records[-1]["mode"] == f"run{profile.STARTUP_TRACE_KEEP + 4}"
+    assert records[0]["mode"] == "run5"
+
+
+def test_unwritable_trace_file_does_not_break_startup(tmp_path):
+    seen = []
+    trace = profile.StartupTrace()
+    trace.add_listener(seen.append)
+    # 폴더 자리에 쓰려 하면 OSError가 나지만 기록은 돌려주고 알림도 간다.
+    record = trace.finish(tmp_path, "headless")
+    assert record is not None and seen == [record]
+
+
+def test_import_profiler_is_opt_in_and_times_new_modules(tmp_path, monkeypatch):
+    assert profile.ImportProfiler.from_argv(["app", "--headless"]) is None
+
+    (tmp_path / "profiled_leaf.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "profiled_root.py").write_text("import profiled_leaf\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    report = tmp_path / "imports.txt"
+    profiler = profile.ImportProfiler.from_argv(["app", f"{profile.PROFILE_IMPORTS_OPTION}={report}"])
+    try:
+        assert profiler is not None and sys.meta_path[0] is profiler
+        import profiled_root  # noqa: F401
+    finally:
+        profiler.uninstall()
+        sys.modules.pop("profiled_root", None)
+        sys.modules.pop("profiled_leaf", None)
+    phase, own, cumulative, depth = profiler.records["profiled_root"]
+    assert (phase, depth) == ("시작 경로", 0)
+    assert profiler.records["profiled_leaf"][3] == 1
+    assert cumulative >= own and cumulative >= profiler.records["profiled_leaf"][2]
+
+    assert profiler.finish([("지연 모듈", lambda: None)]) == 0
+    assert profiler not in sys.meta_path
+    text = report.read_text(encoding="utf-8")
+    assert "profiled_root" in text and "지연 로딩: 지연 모듈" in text
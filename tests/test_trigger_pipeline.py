@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""예약 실행 한 회차의 단계 진행(프로그램 종료 ∥ 음성 재생 → 후속 종료)."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+import autoclose_core as core
+from conftest import wait_until
+
+
+class ScriptedAudio(core.AudioBackend):
+    """시험에서 재생 끝을 직접 알리는 재생기. `duration`을 주면 재생 시작 때 길이도 알린다."""
+
+    def __init__(self, duration: float = 0.0) -> None:
+        super().__init__()
+        self.duration = duration
+        self.active = False
+        self.played = []
+
+    def play(self, path: str) -> None:
+        self.played.append((path, time.monotonic()))
+        self._current = path
+        self.active = True
+        self.playback_started.emit(path)
+        if self.duration:
+            self.remember_duration(path, self.duration)
+            self.duration_known.emit(path, self.duration)
+
+    def finish(self) -> None:
+        path = self._current or ""
+        self._current = None
+        self.active = False
+        self.playback_finished.emit(path)
+
+    def stop(self) -> None:
+        if self.active:
+            self.finish()
+
+    def is_active(self) -> bool:
+        return self.active
+
+
+def _slow_termination(seconds: float, calls):
+    def fake(targets, timeout=0, include_children=False, index=None, **_):
+        calls.append(time.monotonic())
+        time.sleep(seconds)
+        return core.TerminationReport(elapsed=seconds)
+
+    return fake
+
+
+@pytest.fixture
+def make_runner(qapp, config_dir):
+    runners = []
+
+    def make(audio: core.AudioBackend, **settings):
+        cfg_mgr = core.ConfigManager(write_interval=None)
+
+        def prepare(cfg: core.SchedulerConfig) -> None:
+            cfg.targets = ["a.exe"]
+            cfg.remote_hosts = [{"host": "10.0.8.1", "method": "ssh"}]
+            cfg.enable_remote_shutdown = True
+            cfg.enable_local_shutdown = True
+            cfg.remote_prewarm_seconds = 0
+            for key, value in settings.items():
+                setattr(cfg, key, value)
+
+        cfg_mgr.update(prepare)
+        runner = core.ScheduleRunner(cfg_mgr, audio)
+        runner.follow_ups = []
+        runner._run_follow_up = lambda remote, local: runner.follow_ups.append((remote, local))
+        runner._prewarm_remote_sessions = lambda: None
+        runners.append(runner)
+        return runner
+
+    yield make
+    for runner in runners:
+        runner.stop()
+
+
+def test_playback_starts_while_programs_are_still_closing(qapp, make_runner, monkeypatch):
+    calls = []
+    monkeypatch.setattr(core, "terminate_programs", _slow_termination(0.4, calls))
+    audio = ScriptedAudio()
+    runner = make_runner(audio)
+    stages = []
+    runner.stage_message.connect(stages.append)
+
+    started = time.monotonic()
+    runner.trigger("mon", "a.mp3", True, True)
+    # 음성은 종료 작업을 기다리지 않고 바로 시작한다.
+    assert audio.played and audio.played[0][1] - started < 0.2
+    assert wait_until(qapp, lambda: bool(calls))
+
+    audio.finish()
+    assert runner.follow_ups == []
+    assert "프로그램 종료 확인 중…" in stages
+    assert wait_until(qapp, lambda: bool(runner.follow_ups))
+    assert runner.follow_ups == [(True, True)]
+
+
+def test_follow_up_waits_for_playback_after_fast_termination(qapp, make_runner, monkeypatch):
+    calls = []
+    monkeypatch.setattr(core, "terminate_programs", _slow_termination(0.0, calls))
+    audio = ScriptedAudio()
+    runner = make_runner(audio)
+    runner.trigger("mon", "a.mp3", False, True)
+    assert wait_until(qapp, lambda: runner._pipeline is not None and runner._pipeline.termination_done)
+    assert runner.follow_ups == []
+
+    audio.finish()
+    assert runner.follow_ups == [(False, True)]
+    assert runner._pipeline is None
+
+
+def test_stale_termination_of_a_replaced_run_is_ignored(qapp, make_runner, monkeypatch):
+    calls = []
+    monkeypatch.setattr(core, "terminate_programs", _slow_termination(0.3, calls))
+    audio = ScriptedAudio()
+    runner = make_runner(audio)
+    runner.trigger("mon", "a.mp3", False, True)
+    first = runner._pipeline
+    runner.trigger("tue", "b.mp3", False, True)
+    assert runner._pipeline is not first
+
+    audio.finish()
+    assert wait_until(qapp, lambda: len(calls) == 2 and runner.follow_ups != [])
+    wait_until(qapp, lambda: False, timeout=0.2)
+    # 버린 회차의 종료 완료는 후속 단계를 한 번 더 실행하지 않는다.
+    assert runner.follow_ups == [(False, True)]
+
+
+@pytest.fixture
+def remote_starts(monkeypatch):
+    monkeypatch.setattr(core, "terminate_programs", _slow_termination(0.0, []))
+    return []
+
+
+def test_remote_shutdown_leads_the_end_of_the_announcement(qapp, make_runner, remote_starts):
+    audio = ScriptedAudio(duration=1.3)
+    runner = make_runner(audio, remote_lead_seconds=1)
+    runner._start_remote_shutdown = lambda cfg: remote_starts.append(time.monotonic())
+    started = time.monotonic()
+    runner.trigger("mon", "a.mp3", True, True)
+    assert runner._remote_lead_timer.isActive()
+    assert wait_until(qapp, lambda: bool(remote_starts))
+    assert 0.1 < remote_starts[0] - started < 1.0
+    assert runner._pipeline.remote_started
+
+    audio.finish()
+    # 먼저 보낸 원격 종료는 후속 단계에서 다시 보내지 않는다.
+    assert wait_until(qapp, lambda: bool(runner.follow_ups))
+    assert runner.follow_ups == [(False, True)]
+    assert len(remote_starts) == 1
+
+
+def test_no_early_remote_without_lead_or_permission(qapp, make_runner, remote_starts):
+    audio = ScriptedAudio(duration=1.0)
+    runner = make_runner(audio, remote_lead_seconds=0)
+    runner._start_remote_shutdown = lambda cfg: remote_starts.append(time.monotonic())
+    runner.trigger("mon", "a.mp3", True, True)
+    assert not runner._remote_lead_timer.isActive()
+
+    # 요일 설정에서 원격 종료를 끄면 타이머를 맞추지 않는다.
+    runner.cfg_mgr.update(lambda cfg: setattr(cfg, "remote_lead_seconds", 1))
+    runner.cfg_mgr.update(lambda cfg: setattr(cfg.days["tue"], "allow_remote", False))
+    runner.trigger("tue", "b.mp3", True, True)
+    assert not runner._remote_lead_timer.isActive()
+    audio.finish()
+    assert wait_until(qapp, lambda: bool(runner.follow_ups))
+    assert runner.follow_ups == [(False, True)]
+    assert remote_starts == []
+
+
+def test_lead_timer_is_dropped_when_playback_ends_first(qapp, make_runner, remote_starts):
+    audio = ScriptedAudio(duration=5.0)
+    runner = make_runner(audio, remote_lead_seconds=1)
+    runner._start_remote_shutdown = lambda cfg: remote_starts.append(time.monotonic())
+    runner.trigger("mon", "a.mp3", True, True)
+    assert runner._remote_lead_timer.isActive()
+    assert wait_until(qapp, lambda: runner._pipeline.termination_done)
+    audio.finish()
+    assert not runner._remote_lead_timer.isActive()
+    assert runner.follow_ups == [(True, True)]
+    runner._dispatch_remote_early()
+    assert remote_starts == []